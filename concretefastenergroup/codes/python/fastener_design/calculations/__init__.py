@@ -2,7 +2,13 @@
 
 from .psi_factors import *
 from .geometry import *
-from .interaction import check_nv_interaction, check_combined_loading, get_interaction_summary
+from .interaction import (
+    check_nv_interaction,
+    check_nv_interaction_batch,
+    calculate_nv_interaction_terms,
+    check_combined_loading,
+    get_interaction_summary,
+)
 
 __all__ = [
     'calculate_psi_s_N',
@@ -12,9 +18,27 @@ __all__ = [
     'calculate_psi_h_V',
     'calculate_psi_ec_V',
     'calculate_psi_alpha_V',
+    'calculate_psi_s_N_vec',
+    'calculate_psi_re_N_vec',
+    'calculate_psi_ec_N_vec',
+    'calculate_psi_M_N_vec',
+    'calculate_psi_h_V_vec',
+    'calculate_psi_ec_V_vec',
+    'calculate_psi_alpha_V_vec',
+    'PsiFactorsTension',
+    'PsiFactorsShear',
+    'calculate_psi_factors_tension',
+    'calculate_psi_factors_tension_batch',
+    'calculate_psi_factors_shear',
+    'calculate_psi_factors_shear_batch',
+    'get_all_psi_factors_tension',
+    'get_all_psi_factors_shear',
     'calculate_area_ratio_cone',
+    'calculate_area_ratio_cone_vec',
     'calculate_area_ratio_edge',
     'check_nv_interaction',
+    'check_nv_interaction_batch',
+    'calculate_nv_interaction_terms',
     'check_combined_loading',
     'get_interaction_summary',
 ]
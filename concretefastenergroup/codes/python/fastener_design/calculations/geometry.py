@@ -2,12 +2,19 @@
 Geometry calculations for projected areas and spacing effects
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
 
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
+from ..core.fastener import Fastener
+from ..core.fastener_group import FastenerGroup
+
+
+def _area_ratio_cone_one_edge(c, ccr_N, scr_N):
+    """
+    Ac,N / Ac,N⁰ = (2 × ccr,N) × (ccr,N + c) / scr,N² for one edge at c < ccr,N
+
+    Plain arithmetic, so c may be a float or an ndarray.
+    """
+    return (2.0 * ccr_N) * (ccr_N + c) / scr_N ** 2
 
 
 def calculate_area_ratio_cone(
@@ -51,6 +58,9 @@ def calculate_area_ratio_cone(
         # Full area if no edge effects
         if c1 >= ccr_N and c2 >= ccr_N:
             Ac_N = Ac_N0
+        elif c2 >= ccr_N:
+            # Single edge: full width, length reduced to ccr,N + c1
+            return _area_ratio_cone_one_edge(c1, ccr_N, scr_N)
         else:
             # Reduced area due to edges
             # Simplified: actual implementation needs figures from standard
@@ -64,6 +74,25 @@ def calculate_area_ratio_cone(
     return Ac_N / Ac_N0
 
 
+def calculate_area_ratio_cone_vec(edge_distance, hef) -> np.ndarray:
+    """
+    Vectorized Ac,N / Ac,N⁰ for a single fastener near one edge
+
+    Array counterpart of calculate_area_ratio_cone with only c1 given.
+
+    Args:
+        edge_distance: Edge distances c1 [mm] (array-like)
+        hef: Embedment depth(s) hef [mm] (array-like or scalar)
+
+    Returns:
+        Array of area ratios (1.0 where c1 ≥ ccr,N)
+    """
+    c = np.asarray(edge_distance, dtype=float)
+    hef = np.asarray(hef, dtype=float)
+    ccr_N = 1.5 * hef
+    return np.where(c >= ccr_N, 1.0, _area_ratio_cone_one_edge(c, ccr_N, 3.0 * hef))
+
+
 def calculate_area_ratio_edge(
     fastener: Fastener,
     edge_distance: float,
@@ -7,7 +7,26 @@ according to EC2 Part 4.
 Standard: EC2-4-2 Section 6.7
 """
 
-from typing import Dict, Optional
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+def _ratio(
+    tension_util: float,
+    shear_util: float,
+    alpha: float,
+    beta: float
+) -> Tuple[float, float, float]:
+    """
+    Scalar interaction arithmetic: (NEd/NRd)^α + (VEd/VRd)^β
+
+    Only positive utilizations contribute. Returns
+    (interaction_ratio, tension_term, shear_term).
+    """
+    tension_term = tension_util ** alpha if tension_util > 0 else 0.0
+    shear_term = shear_util ** beta if shear_util > 0 else 0.0
+    return tension_term + shear_term, tension_term, shear_term
 
 
 def check_nv_interaction(
@@ -76,16 +95,12 @@ def check_nv_interaction(
             'error': 'Zero or negative resistance'
         }
 
-    # Calculate individual utilizations
-    tension_util = NEd / NRd if NRd > 0 else 0.0
-    shear_util = VEd / VRd if VRd > 0 else 0.0
-
-    # Calculate interaction terms
-    tension_term = (NEd / NRd) ** alpha if NEd > 0 else 0.0
-    shear_term = (VEd / VRd) ** beta if VEd > 0 else 0.0
+    # Calculate individual utilizations (resistances are > 0 here)
+    tension_util = NEd / NRd
+    shear_util = VEd / VRd
 
-    # Calculate interaction ratio
-    interaction_ratio = tension_term + shear_term
+    # Calculate interaction terms and ratio
+    interaction_ratio, tension_term, shear_term = _ratio(tension_util, shear_util, alpha, beta)
 
     # Determine status
     status = 'OK' if interaction_ratio <= 1.0 else 'FAIL'
@@ -109,6 +124,125 @@ def check_nv_interaction(
     }
 
 
+def calculate_nv_interaction_terms(
+    NEd,
+    NRd,
+    VEd,
+    VRd,
+    alpha: float = 1.5,
+    beta: float = 1.5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Broadcasting N-V interaction arithmetic without any reporting overhead
+
+    Accepts scalars or arrays of any shape (single case, vector of load
+    combinations, fasteners × load cases matrix, ...). Inputs are broadcast
+    against each other and the outputs have the broadcast shape.
+
+    Args:
+        NEd: Design tension load(s) [N]
+        NRd: Design tension resistance(s) [N]
+        VEd: Design shear load(s) [N]
+        VRd: Design shear resistance(s) [N]
+        alpha: Exponent for tension term (default 1.5)
+        beta: Exponent for shear term (default 1.5)
+
+    Returns:
+        (interaction_ratio, tension_term, shear_term,
+         tension_utilization, shear_utilization) arrays
+
+    Standard: EC2-4-2 Section 6.7
+
+    Notes:
+        - Only loads > 0 contribute to the interaction terms
+        - A zero or negative resistance gives an infinite term and ratio
+    """
+    NEd, NRd, VEd, VRd = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (NEd, NRd, VEd, VRd))
+    )
+
+    tension_ok = NRd > 0
+    shear_ok = VRd > 0
+    valid = tension_ok & shear_ok
+
+    # Calculate individual utilizations
+    tension_util = np.divide(NEd, NRd, out=np.zeros(NEd.shape), where=tension_ok)
+    shear_util = np.divide(VEd, VRd, out=np.zeros(VEd.shape), where=shear_ok)
+
+    # Calculate interaction terms (only loads > 0 contribute)
+    tension_term = np.where(NEd > 0, np.power(np.maximum(tension_util, 0.0), alpha), 0.0)
+    shear_term = np.where(VEd > 0, np.power(np.maximum(shear_util, 0.0), beta), 0.0)
+
+    # Avoid division by zero: invalid resistance fails the check
+    tension_term = np.where(tension_ok, np.where(valid, tension_term, 0.0), np.inf)
+    shear_term = np.where(shear_ok, np.where(valid, shear_term, 0.0), np.inf)
+    interaction_ratio = np.where(valid, tension_term + shear_term, np.inf)
+
+    return interaction_ratio, tension_term, shear_term, tension_util, shear_util
+
+
+def check_nv_interaction_batch(
+    NEd,
+    NRd,
+    VEd,
+    VRd,
+    alpha: float = 1.5,
+    beta: float = 1.5
+) -> Dict[str, np.ndarray]:
+    """
+    Check combined tension and shear interaction for many load cases at once
+
+    Vectorized counterpart of check_nv_interaction for load-combination
+    sweeps. Inputs may be scalars or arrays; they are broadcast against each
+    other (e.g. one NRd/VRd pair for a vector of NEd/VEd values).
+
+    Args:
+        NEd: Design tension loads [N]
+        NRd: Design tension resistances [N]
+        VEd: Design shear loads [N]
+        VRd: Design shear resistances [N]
+        alpha: Exponent for tension term (default 1.5)
+        beta: Exponent for shear term (default 1.5)
+
+    Returns:
+        Dictionary of arrays (at least 1-D, one entry per load case):
+            - 'interaction_ratio', 'tension_term', 'shear_term'
+            - 'tension_utilization', 'shear_utilization', 'utilization'
+            - 'status': 'OK' or 'FAIL'
+
+    Standard: EC2-4-2 Section 6.7
+
+    Notes:
+        - Same rules as check_nv_interaction: a zero or negative resistance
+          gives an infinite ratio and status 'FAIL'
+        - No formula strings are built; use check_nv_interaction for reporting
+
+    Example:
+        >>> res = check_nv_interaction_batch([50000, 90000], 100000, [20000, 35000], 40000)
+        >>> res['status']
+        array(['OK', 'FAIL'], dtype='<U4')
+    """
+    interaction_ratio, tension_term, shear_term, tension_util, shear_util = (
+        calculate_nv_interaction_terms(
+            *(np.atleast_1d(v) for v in (NEd, NRd, VEd, VRd)), alpha, beta
+        )
+    )
+
+    max_util = np.where(
+        np.isfinite(interaction_ratio), np.maximum(tension_util, shear_util), np.inf
+    )
+
+    return {
+        'interaction_ratio': interaction_ratio,
+        'tension_term': tension_term,
+        'shear_term': shear_term,
+        'tension_utilization': tension_util,
+        'shear_utilization': shear_util,
+        'status': np.where(interaction_ratio <= 1.0, 'OK', 'FAIL'),
+        'utilization': max_util
+    }
+
+
 def check_combined_loading(
     tension_results: Dict,
     shear_results: Dict,
@@ -179,38 +313,86 @@ def get_interaction_summary(interaction_result: Dict) -> str:
 
     Returns:
         Formatted text summary
+
+    Notes:
+        - The values used in the report are extracted first (cheap), and the
+          string formatting is memoized on them, so repeated reports of the
+          same result (e.g. governing case across load sweeps) are not rebuilt
+    """
+    return _format_summary(_summary_data(interaction_result))
+
+
+def _summary_data(interaction_result: Dict) -> Tuple:
     """
+    Extract the values shown in the interaction summary as a hashable tuple
+
+    Args:
+        interaction_result: Result from check_nv_interaction or check_combined_loading
+
+    Returns:
+        Tuple of summary values (see _format_summary)
+    """
+    return (
+        interaction_result.get('NEd_kN', interaction_result.get('NEd', 0) / 1000),
+        interaction_result.get('VEd_kN', interaction_result.get('VEd', 0) / 1000),
+        interaction_result.get('NRd_kN', interaction_result.get('NRd', 0) / 1000),
+        interaction_result.get('VRd_kN', interaction_result.get('VRd', 0) / 1000),
+        interaction_result.get('governing_tension_mode', 'N/A'),
+        interaction_result.get('governing_shear_mode', 'N/A'),
+        interaction_result['tension_utilization'],
+        interaction_result['shear_utilization'],
+        interaction_result['alpha'],
+        interaction_result['beta'],
+        interaction_result['formula'],
+        interaction_result['formula_result'],
+        interaction_result['interaction_ratio'],
+        interaction_result['status'],
+        interaction_result.get('standard_ref', 'EC2-4-2 Section 6.7'),
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_summary(data: Tuple) -> str:
+    """
+    Format interaction summary values as text (memoized)
+
+    Args:
+        data: Tuple from _summary_data
+
+    Returns:
+        Formatted text summary
+    """
+    (NEd_kN, VEd_kN, NRd_kN, VRd_kN, governing_tension, governing_shear,
+     tension_util, shear_util, alpha, beta, formula, formula_result,
+     interaction_ratio, status, standard_ref) = data
+
     lines = []
     lines.append("COMBINED LOADING (N-V INTERACTION)")
     lines.append("-" * 60)
 
     # Loads
-    NEd_kN = interaction_result.get('NEd_kN', interaction_result.get('NEd', 0) / 1000)
-    VEd_kN = interaction_result.get('VEd_kN', interaction_result.get('VEd', 0) / 1000)
     lines.append(f"Design loads:")
     lines.append(f"  NEd = {NEd_kN:.1f} kN")
     lines.append(f"  VEd = {VEd_kN:.1f} kN")
 
     # Capacities
-    NRd_kN = interaction_result.get('NRd_kN', interaction_result.get('NRd', 0) / 1000)
-    VRd_kN = interaction_result.get('VRd_kN', interaction_result.get('VRd', 0) / 1000)
     lines.append(f"\nDesign resistances:")
-    lines.append(f"  NRd = {NRd_kN:.1f} kN (governing: {interaction_result.get('governing_tension_mode', 'N/A')})")
-    lines.append(f"  VRd = {VRd_kN:.1f} kN (governing: {interaction_result.get('governing_shear_mode', 'N/A')})")
+    lines.append(f"  NRd = {NRd_kN:.1f} kN (governing: {governing_tension})")
+    lines.append(f"  VRd = {VRd_kN:.1f} kN (governing: {governing_shear})")
 
     # Individual utilizations
     lines.append(f"\nIndividual utilizations:")
-    lines.append(f"  Tension: {interaction_result['tension_utilization']:.3f}")
-    lines.append(f"  Shear:   {interaction_result['shear_utilization']:.3f}")
+    lines.append(f"  Tension: {tension_util:.3f}")
+    lines.append(f"  Shear:   {shear_util:.3f}")
 
     # Interaction check
-    lines.append(f"\nInteraction check (α={interaction_result['alpha']}, β={interaction_result['beta']}):")
-    lines.append(f"  Formula: {interaction_result['formula']}")
-    lines.append(f"  Result:  {interaction_result['formula_result']}")
-    lines.append(f"  Ratio:   {interaction_result['interaction_ratio']:.3f}")
-    lines.append(f"  Status:  {interaction_result['status']}")
+    lines.append(f"\nInteraction check (α={alpha}, β={beta}):")
+    lines.append(f"  Formula: {formula}")
+    lines.append(f"  Result:  {formula_result}")
+    lines.append(f"  Ratio:   {interaction_ratio:.3f}")
+    lines.append(f"  Status:  {status}")
 
     lines.append("-" * 60)
-    lines.append(f"Standard: {interaction_result.get('standard_ref', 'EC2-4-2 Section 6.7')}")
+    lines.append(f"Standard: {standard_ref}")
 
     return '\n'.join(lines)
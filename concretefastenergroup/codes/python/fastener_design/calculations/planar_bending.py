@@ -7,18 +7,44 @@ axial forces (tension/compression) in fasteners.
 Standard: Based on elastic beam theory and discrete inertia approach
 """
 
+import logging
 import numpy as np
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import List, Tuple, Dict, Union
 
+logger = logging.getLogger(__name__)
 
-def calculate_centroid(positions: List[Tuple[float, float]],
-                       areas: List[float]) -> Tuple[float, float]:
+# Public functions accept lists of (x, y) tuples or arrays. Internally the
+# geometry is converted once to contiguous float64 arrays:
+#   positions → shape (n, 2), areas → shape (n,)
+PositionsLike = Union[List[Tuple[float, float]], np.ndarray]
+AreasLike = Union[List[float], np.ndarray]
+
+# Per-fastener result keys, in output order (see distribute_loads_with_bending)
+_DISTRIBUTION_KEYS = (
+    'x', 'y', 'N', 'N_direct', 'N_Mx', 'N_My',
+    'Vx', 'Vx_direct', 'Vx_torsion', 'Vy', 'Vy_direct', 'Vy_torsion', 'V_total'
+)
+
+
+def _as_positions(positions: PositionsLike) -> np.ndarray:
+    """Convert positions to a contiguous (n, 2) float64 array (no copy if already one)"""
+    return np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 2)
+
+
+def _as_areas(areas: AreasLike) -> np.ndarray:
+    """Convert areas to a contiguous (n,) float64 array (no copy if already one)"""
+    return np.ascontiguousarray(areas, dtype=np.float64).reshape(-1)
+
+
+def calculate_centroid(positions: PositionsLike,
+                       areas: AreasLike) -> Tuple[float, float]:
     """
     Calculate centroid of fastener group
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates [mm] or (n, 2) array
+        areas: List of fastener areas [mm²] or (n,) array
 
     Returns:
         (xc, yc): Centroid coordinates [mm]
@@ -27,33 +53,44 @@ def calculate_centroid(positions: List[Tuple[float, float]],
         xc = Σ(Ai × xi) / ΣAi
         yc = Σ(Ai × yi) / ΣAi
     """
-    if not positions or not areas:
+    pos = _as_positions(positions)
+    areas = _as_areas(areas)
+    if pos.size == 0 or areas.size == 0:
         return (0.0, 0.0)
 
-    positions = np.array(positions)
-    areas = np.array(areas)
+    # Geometry is usually identical across load cases - reuse cached result
+    return _cached_centroid(pos.tobytes(), areas.tobytes())
+
+
+@lru_cache(maxsize=128)
+def _cached_centroid(pos_bytes: bytes, areas_bytes: bytes) -> Tuple[float, float]:
+    """Memoized calculate_centroid, keyed on the raw array bytes"""
+    return _centroid(np.frombuffer(pos_bytes).reshape(-1, 2), np.frombuffer(areas_bytes))
 
-    total_area = np.sum(areas)
+
+def _centroid(pos: np.ndarray, areas: np.ndarray) -> Tuple[float, float]:
+    """Centroid calculation on (n, 2) / (n,) arrays (see calculate_centroid)"""
+    total_area = areas.sum()
     if total_area == 0:
         return (0.0, 0.0)
 
-    xc = np.sum(areas * positions[:, 0]) / total_area
-    yc = np.sum(areas * positions[:, 1]) / total_area
+    xc = np.dot(areas, pos[:, 0]) / total_area
+    yc = np.dot(areas, pos[:, 1]) / total_area
 
     return (float(xc), float(yc))
 
 
 def calculate_section_properties(
-    positions: List[Tuple[float, float]],
-    areas: List[float],
+    positions: PositionsLike,
+    areas: AreasLike,
     centroid: Tuple[float, float]
 ) -> Dict[str, float]:
     """
     Calculate section properties (moments of inertia) for fastener group
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates [mm] or (n, 2) array
+        areas: List of fastener areas [mm²] or (n,) array
         centroid: (xc, yc) centroid position [mm]
 
     Returns:
@@ -75,21 +112,36 @@ def calculate_section_properties(
         - Positive Mx causes tension on +y side (top)
         - Positive My causes tension on +x side (right)
     """
-    if not positions or not areas:
+    pos = _as_positions(positions)
+    areas = _as_areas(areas)
+    if pos.size == 0 or areas.size == 0:
         return {'Ix': 0.0, 'Iy': 0.0, 'Ixy': 0.0, 'J': 0.0}
 
-    positions = np.array(positions)
-    areas = np.array(areas)
+    # Geometry is usually identical across load cases - reuse cached result.
+    # A copy is returned so callers cannot mutate the cached dictionary.
     xc, yc = centroid
+    return dict(_cached_section_properties(pos.tobytes(), areas.tobytes(), float(xc), float(yc)))
+
+
+@lru_cache(maxsize=128)
+def _cached_section_properties(pos_bytes: bytes,
+                               areas_bytes: bytes,
+                               xc: float,
+                               yc: float) -> Dict[str, float]:
+    """Memoized calculate_section_properties, keyed on the raw array bytes"""
+    return _section_props(np.frombuffer(pos_bytes).reshape(-1, 2), np.frombuffer(areas_bytes), xc, yc)
+
 
+def _section_props(pos: np.ndarray, areas: np.ndarray, xc: float, yc: float) -> Dict[str, float]:
+    """Section properties on (n, 2) / (n,) arrays (see calculate_section_properties)"""
     # Distances from centroid
-    x = positions[:, 0] - xc
-    y = positions[:, 1] - yc
+    x = pos[:, 0] - xc
+    y = pos[:, 1] - yc
 
-    # Calculate moments of inertia
-    Ix = np.sum(y**2 * areas)
-    Iy = np.sum(x**2 * areas)
-    Ixy = np.sum(x * y * areas)
+    # Calculate moments of inertia (one product + dot reduction each)
+    Ix = np.dot(y * y, areas)
+    Iy = np.dot(x * x, areas)
+    Ixy = np.dot(x * y, areas)
     J = Ix + Iy  # Polar moment
 
     return {
@@ -101,8 +153,8 @@ def calculate_section_properties(
 
 
 def calculate_bending_forces(
-    positions: List[Tuple[float, float]],
-    areas: List[float],
+    positions: PositionsLike,
+    areas: AreasLike,
     Mx: float,
     My: float,
     centroid: Tuple[float, float],
@@ -112,8 +164,8 @@ def calculate_bending_forces(
     Calculate axial forces in fasteners due to bending moments Mx and My
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates [mm] or (n, 2) array
+        areas: List of fastener areas [mm²] or (n,) array
         Mx: Bending moment about x-axis [kNm]
         My: Bending moment about y-axis [kNm]
         centroid: (xc, yc) centroid position [mm]
@@ -139,20 +191,20 @@ def calculate_bending_forces(
         - Positive force: Tension (↑)
         - Negative force: Compression (↓)
     """
-    if not positions or not areas:
+    pos = _as_positions(positions)
+    areas = _as_areas(areas)
+    if pos.size == 0 or areas.size == 0:
         return []
 
-    n = len(positions)
+    n = len(pos)
     if Mx == 0 and My == 0:
         return [0.0] * n
 
-    positions = np.array(positions)
-    areas = np.array(areas)
     xc, yc = centroid
 
     # Distances from centroid
-    x = positions[:, 0] - xc  # mm
-    y = positions[:, 1] - yc  # mm
+    x = pos[:, 0] - xc  # mm
+    y = pos[:, 1] - yc  # mm
 
     # Get section properties
     Ix = section_props['Ix']
@@ -165,46 +217,64 @@ def calculate_bending_forces(
         # Degenerate case (all fasteners on a line)
         return [0.0] * n
 
-    # Construct inertia matrix and its inverse
-    I_matrix = np.array([[Ix, Ixy],
-                         [Ixy, Iy]])
+    return _bending_forces_array(x, y, areas, Mx, My, Ix, Iy, Ixy).tolist()
+
+
+def _bending_forces_array(
+    x: np.ndarray,
+    y: np.ndarray,
+    areas: np.ndarray,
+    Mx: float,
+    My: float,
+    Ix: float,
+    Iy: float,
+    Ixy: float
+) -> np.ndarray:
+    """
+    Axial bending forces for all fasteners at once (see calculate_bending_forces)
+
+    Args:
+        x, y: Fastener distances from centroid [mm]
+        areas: Fastener areas [mm²]
+        Mx, My: Bending moments [kNm]
+        Ix, Iy, Ixy: Section properties [mm⁴] (non-degenerate section)
 
-    I_inv = np.linalg.inv(I_matrix)
+    Returns:
+        Array of axial forces (tension +, compression -) [kN]
+    """
+    # Closed-form inverse of the symmetric inertia matrix
+    # I = [[Ix, Ixy], [Ixy, Iy]]  →  I_inv = 1/det × [[Iy, -Ixy], [-Ixy, Ix]]
+    det = Ix * Iy - Ixy**2
+    inv00 = Iy / det
+    inv01 = -Ixy / det
+    inv11 = Ix / det
 
     # Convert moments to N·mm for calculation
     Mx_Nmm = Mx * 1e6  # kNm → Nmm
     My_Nmm = My * 1e6  # kNm → Nmm
 
-    # Build moment vector
-    # Due to the [y, x] position vector formulation (line 187), we need to negate My
+    # Moment vector is [Mx, -My]
+    # Due to the [y, x] position vector formulation below, we need to negate My
     # to achieve correct sign convention: positive My → tension at left, compression at right
-    M = np.array([Mx_Nmm, -My_Nmm])
-
-    # Calculate stress (N/mm²) and force (N) at each fastener
-    forces = []
-    for i in range(n):
-        # IMPORTANT: Mx creates stress prop to y, My creates stress prop to x
-        # Position vector is [y, x] NOT [x, y]!
-        pos_vec = np.array([y[i], x[i]])
-
-        # Stress at this position: σ = [y, x] @ I_inv @ [Mx, My]
-        # This gives: σ = y*(I_inv[0,0]*Mx + I_inv[0,1]*My) + x*(I_inv[1,0]*Mx + I_inv[1,1]*My)
-        stress = pos_vec @ I_inv @ M  # N/mm²
-
-        # Force = stress × area
-        force_N = stress * areas[i]  # N
-        force_kN = force_N / 1000.0  # kN
-
-        forces.append(float(force_kN))
-
+    Iinv_M0 = inv00 * Mx_Nmm + inv01 * (-My_Nmm)
+    Iinv_M1 = inv01 * Mx_Nmm + inv11 * (-My_Nmm)
+
+    # IMPORTANT: Mx creates stress prop to y, My creates stress prop to x
+    # Position vector is [y, x] NOT [x, y]!
+    # Stress at each position: σ = [y, x] @ I_inv @ [Mx, -My]
+    # Force = stress × area [N → kN], evaluated in place with the unit
+    # conversion folded into the scalar coefficients (one output array)
+    forces = np.multiply(y, Iinv_M0 / 1000.0)
+    forces += x * (Iinv_M1 / 1000.0)
+    forces *= areas
     return forces
 
 
 def verify_torsion_forces(
-    positions: List[Tuple[float, float]],
+    positions: PositionsLike,
     centroid: Tuple[float, float],
-    Vx_torsion_list: List[float],
-    Vy_torsion_list: List[float],
+    Vx_torsion_list: AreasLike,
+    Vy_torsion_list: AreasLike,
     Mz: float,
     tolerance: float = 1e-6
 ) -> Dict[str, any]:
@@ -212,10 +282,10 @@ def verify_torsion_forces(
     Verify torsional force calculations according to technical notes (torsion.md)
 
     Args:
-        positions: List of (x, y) fastener coordinates [mm]
+        positions: List of (x, y) fastener coordinates [mm] or (n, 2) array
         centroid: (xc, yc) centroid position [mm]
-        Vx_torsion_list: List of x-component torsional forces [kN]
-        Vy_torsion_list: List of y-component torsional forces [kN]
+        Vx_torsion_list: List of x-component torsional forces [kN] or (n,) array
+        Vy_torsion_list: List of y-component torsional forces [kN] or (n,) array
         Mz: Applied torsional moment [kNm]
         tolerance: Tolerance for verification checks
 
@@ -233,7 +303,8 @@ def verify_torsion_forces(
         2. Force equilibrium: Σ(Fx_i) = 0, Σ(Fy_i) = 0
         3. Moment recovery: Σ(x_i * Fy_i - y_i * Fx_i) = Mz
     """
-    if not positions or Mz == 0:
+    pos = _as_positions(positions)
+    if pos.size == 0 or Mz == 0:
         return {
             'perpendicularity_passed': True,
             'force_equilibrium_passed': True,
@@ -244,39 +315,29 @@ def verify_torsion_forces(
         }
 
     xc, yc = centroid
-    n = len(positions)
+    Vx_arr = np.asarray(Vx_torsion_list, dtype=float)  # kN
+    Vy_arr = np.asarray(Vy_torsion_list, dtype=float)  # kN
 
-    # Check 1: Perpendicularity (forces perpendicular to radius)
-    perpendicularity_errors = []
-    for i in range(n):
-        x_i = positions[i][0] - xc  # mm
-        y_i = positions[i][1] - yc  # mm
-        Fx_i = Vx_torsion_list[i] * 1000.0  # kN → N
-        Fy_i = Vy_torsion_list[i] * 1000.0  # kN → N
+    # Distances from centroid
+    dx = pos[:, 0] - xc  # mm
+    dy = pos[:, 1] - yc  # mm
 
-        # Dot product should be zero
-        dot_product = Fx_i * x_i + Fy_i * y_i
-        perpendicularity_errors.append(abs(dot_product))
+    # Check 1: Perpendicularity (forces perpendicular to radius)
+    # Dot product F_i · r_i should be zero (forces in N, kN → N)
+    perpendicularity_errors = np.abs((Vx_arr * dx + Vy_arr * dy) * 1000.0)
 
-    perp_passed = all(err < tolerance * 1e6 for err in perpendicularity_errors)  # Scale tolerance for N·mm
+    perp_passed = bool((perpendicularity_errors < tolerance * 1e6).all())  # Scale tolerance for N·mm
 
     # Check 2: Force equilibrium
-    sum_Fx = sum(Vx_torsion_list)  # kN
-    sum_Fy = sum(Vy_torsion_list)  # kN
+    sum_Fx = float(Vx_arr.sum())  # kN
+    sum_Fy = float(Vy_arr.sum())  # kN
     force_sum = (sum_Fx, sum_Fy)
 
     force_eq_passed = (abs(sum_Fx) < tolerance and abs(sum_Fy) < tolerance)
 
     # Check 3: Moment recovery
-    moment_sum = 0.0
-    for i in range(n):
-        x_i = positions[i][0] - xc  # mm
-        y_i = positions[i][1] - yc  # mm
-        Fx_i = Vx_torsion_list[i]   # kN
-        Fy_i = Vy_torsion_list[i]   # kN
-
-        # Moment = x * Fy - y * Fx (in kN·mm)
-        moment_sum += (x_i * Fy_i - y_i * Fx_i)
+    # Moment = x * Fy - y * Fx (in kN·mm)
+    moment_sum = float((dx * Vy_arr - dy * Vx_arr).sum())
 
     moment_recovered = moment_sum / 1000.0  # kN·mm → kNm
     moment_passed = abs(moment_recovered - Mz) < tolerance
@@ -285,7 +346,7 @@ def verify_torsion_forces(
         'perpendicularity_passed': perp_passed,
         'force_equilibrium_passed': force_eq_passed,
         'moment_recovery_passed': moment_passed,
-        'perpendicularity_errors': perpendicularity_errors,
+        'perpendicularity_errors': perpendicularity_errors.tolist(),
         'force_sum': force_sum,
         'moment_recovered': float(moment_recovered)
     }
@@ -350,8 +411,8 @@ def calculate_eccentricity_moments(
 
 
 def distribute_loads_with_bending(
-    positions: List[Tuple[float, float]],
-    areas: List[float],
+    positions: PositionsLike,
+    areas: AreasLike,
     N: float,
     Vx: float,
     Vy: float,
@@ -365,8 +426,8 @@ def distribute_loads_with_bending(
     Complete load distribution including bending moments Mx, My
 
     Args:
-        positions: List of (x, y) fastener coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) fastener coordinates [mm] or (n, 2) array
+        areas: List of fastener areas [mm²] or (n,) array
         N: Axial force (tension +) [kN]
         Vx: Shear force in x-direction [kN]
         Vy: Shear force in y-direction [kN]
@@ -395,20 +456,185 @@ def distribute_loads_with_bending(
                 'V_total': float (resultant shear),
             }
     """
-    if not positions or not areas:
+    # Convert once; the helpers below accept these arrays without copying
+    pos = _as_positions(positions)
+    areas = _as_areas(areas)
+    if pos.size == 0 or areas.size == 0:
         return []
 
-    n = len(positions)
+    return _distribute_from_geometry(
+        _geometry(pos, areas), N, Vx, Vy, Mx, My, Mz, load_point, application_type
+    )
+
 
+def calculate_group_geometry(positions: PositionsLike, areas: AreasLike) -> Dict:
+    """
+    Precompute the load-independent geometry of a fastener group
+
+    The result can be passed to distribute_loads_with_bending_precomputed for
+    every load case, so the centroid, section properties and Σr² are
+    computed once per group instead of once per load case.
+
+    Args:
+        positions: List of (x, y) fastener coordinates [mm] or (n, 2) array
+        areas: List of fastener areas [mm²] or (n,) array
+
+    Returns:
+        Dictionary with:
+            'x', 'y', 'areas': Coordinates [mm] and areas [mm²] (arrays)
+            'xc', 'yc': Area-weighted centroid [mm]
+            'dx', 'dy': Distances from centroid [mm] (arrays)
+            'Ix', 'Iy', 'Ixy': Discrete moments of inertia [mm⁴]
+            'sum_r2': Σ(dx² + dy²) [mm²]
+        or None if there are no fasteners
+    """
+    pos = _as_positions(positions)
+    areas = _as_areas(areas)
+    if pos.size == 0 or areas.size == 0:
+        return None
+
+    return _geometry(pos, areas)
+
+
+def distribute_loads_with_bending_precomputed(
+    geometry: Dict,
+    N: float,
+    Vx: float,
+    Vy: float,
+    Mx: float,
+    My: float,
+    Mz: float,
+    load_point: Tuple[float, float] = None,
+    application_type: str = 'centroid'
+) -> Dict[str, np.ndarray]:
+    """
+    Load distribution as arrays, using geometry from calculate_group_geometry
+
+    Same calculation as distribute_loads_with_bending, without building a
+    dictionary per fastener. Intended for callers that post-process all
+    fasteners at once (e.g. the web interface formatter).
+
+    Args:
+        geometry: Result of calculate_group_geometry (None for no fasteners)
+        N, Vx, Vy, Mx, My, Mz, load_point, application_type:
+            See distribute_loads_with_bending
+
+    Returns:
+        Dictionary of (n,) arrays with the keys of the per-fastener
+        dictionaries of distribute_loads_with_bending (except 'fastener_id'):
+            'x', 'y', 'N', 'N_direct', 'N_Mx', 'N_My',
+            'Vx', 'Vx_direct', 'Vx_torsion',
+            'Vy', 'Vy_direct', 'Vy_torsion', 'V_total'
+        Empty dictionary if there are no fasteners. Arrays may share memory,
+        so treat them as read-only.
+    """
+    if geometry is None:
+        return {}
+
+    return _distribute_arrays_from_geometry(
+        geometry, N, Vx, Vy, Mx, My, Mz, load_point, application_type
+    )
+
+
+def _geometry(pos: np.ndarray, areas: np.ndarray) -> Dict:
+    """
+    Group geometry for load distribution from (n, 2) / (n,) arrays
+
+    Returns the dictionary described in calculate_group_geometry.
+    """
     # Calculate centroid
-    centroid = calculate_centroid(positions, areas)
+    centroid = calculate_centroid(pos, areas)
     xc, yc = centroid
 
+    # Calculate section properties
+    section_props = calculate_section_properties(pos, areas, centroid)
+
+    x_arr = pos[:, 0]
+    y_arr = pos[:, 1]
+    dx = x_arr - xc  # mm
+    dy = y_arr - yc  # mm
+
+    return {
+        'x': x_arr,
+        'y': y_arr,
+        'areas': areas,
+        'xc': xc,
+        'yc': yc,
+        'dx': dx,
+        'dy': dy,
+        'Ix': section_props['Ix'],
+        'Iy': section_props['Iy'],
+        'Ixy': section_props['Ixy'],
+        'sum_r2': float(np.dot(dx, dx) + np.dot(dy, dy))  # Σr² without an r² temporary
+    }
+
+
+def _distribute_from_geometry(
+    geometry: Dict,
+    N: float,
+    Vx: float,
+    Vy: float,
+    Mx: float,
+    My: float,
+    Mz: float,
+    load_point: Tuple[float, float],
+    application_type: str
+) -> List[Dict[str, float]]:
+    """
+    Distribute loads using precomputed group geometry
+
+    Args:
+        geometry: Dictionary with 'x', 'y', 'areas', 'dx', 'dy' arrays and
+                  'xc', 'yc', 'Ix', 'Iy', 'Ixy', 'sum_r2' scalars
+        N, Vx, Vy, Mx, My, Mz, load_point, application_type:
+            See distribute_loads_with_bending
+
+    Returns:
+        List of dictionaries with forces per fastener
+    """
+    forces = _distribute_arrays_from_geometry(
+        geometry, N, Vx, Vy, Mx, My, Mz, load_point, application_type
+    )
+
+    # Convert each array to native floats in one call, then build the dicts
+    columns = zip(*(forces[key].tolist() for key in _DISTRIBUTION_KEYS))
+
+    return [
+        {'fastener_id': i + 1, **dict(zip(_DISTRIBUTION_KEYS, row))}
+        for i, row in enumerate(columns)
+    ]
+
+
+def _distribute_arrays_from_geometry(
+    geometry: Dict,
+    N: float,
+    Vx: float,
+    Vy: float,
+    Mx: float,
+    My: float,
+    Mz: float,
+    load_point: Tuple[float, float],
+    application_type: str
+) -> Dict[str, np.ndarray]:
+    """
+    Distribute loads using precomputed group geometry, as arrays
+
+    Args:
+        geometry: See _distribute_from_geometry
+        N, Vx, Vy, Mx, My, Mz, load_point, application_type:
+            See distribute_loads_with_bending
+
+    Returns:
+        Dictionary of per-fastener force arrays
+        (see distribute_loads_with_bending_precomputed)
+    """
+    centroid = (geometry['xc'], geometry['yc'])
+
     # Determine load application point
     if application_type == 'point' and load_point is not None:
         xp, yp = load_point
     else:
-        xp, yp = xc, yc
+        xp, yp = centroid
 
     # Calculate additional moments from eccentricity
     ecc_moments = calculate_eccentricity_moments(N, Vx, Vy, (xp, yp), centroid)
@@ -418,119 +644,148 @@ def distribute_loads_with_bending(
     My_total = My + ecc_moments['My_ecc']
     Mz_total = Mz + ecc_moments['Mz_ecc']
 
-    # Calculate section properties
-    section_props = calculate_section_properties(positions, areas, centroid)
-
-    # Calculate bending forces from Mx and My
-    N_bending = calculate_bending_forces(
-        positions, areas, Mx_total, My_total, centroid, section_props
+    # Pure-numeric kernel: all per-fastener forces as arrays
+    (N_total, N_direct, N_from_Mx_only, N_from_My_only,
+     Vx_total, Vx_direct, Vx_torsion,
+     Vy_total, Vy_direct, Vy_torsion) = _distribute_core(
+        geometry['dx'], geometry['dy'], geometry['areas'],
+        N, Vx, Vy, Mx_total, My_total, Mz_total,
+        geometry['Ix'], geometry['Iy'], geometry['Ixy'], geometry['sum_r2']
     )
 
-    # Prepare result
-    distribution = []
-
-    for i in range(n):
-        x, y = positions[i]
-        dx = x - xc
-        dy = y - yc
-
-        # AXIAL FORCES (Tension/Compression)
-        N_direct = N / n
-        N_Mx = N_bending[i] if i < len(N_bending) else 0.0
-
-        # Split bending contribution (for display)
-        # This is approximate - actual implementation uses combined matrix
-        if Mx_total != 0 or My_total != 0:
-            # Recalculate individual contributions for display
-            if Mx_total != 0:
-                N_from_Mx_only = calculate_bending_forces(
-                    positions, areas, Mx_total, 0.0, centroid, section_props
-                )[i]
-            else:
-                N_from_Mx_only = 0.0
-
-            if My_total != 0:
-                N_from_My_only = calculate_bending_forces(
-                    positions, areas, 0.0, My_total, centroid, section_props
-                )[i]
-            else:
-                N_from_My_only = 0.0
-        else:
-            N_from_Mx_only = 0.0
-            N_from_My_only = 0.0
-
-        N_total = N_direct + N_Mx
-
-        # SHEAR FORCES
-        # Convention: All forces returned as REACTIONS (what fasteners provide)
-        # This means we negate applied loads to show fastener reactions
-        Vx_direct = Vx / n  # Applied load per fastener
-        Vy_direct = Vy / n  # Applied load per fastener
-
-        # Torsional shear from Mz
-        # Following technical notes: torsion.md
-        #
-        # For +Mz (counter-clockwise when viewed from +z):
-        #   F_i = (Mz * r_i) / Σ(r_j²)
-        #   Fx_i = -F_i * (y_i / r_i)
-        #   Fy_i = +F_i * (x_i / r_i)
+    # Torsion diagnostics (formatted lazily, only when DEBUG logging is enabled)
+    if Mz_total != 0 and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Torsion: Mz=%s kNm, sum_r²=%.0f mm², max |Vx_torsion|=%.3f kN, max |Vy_torsion|=%.3f kN",
+            Mz_total, geometry['sum_r2'], np.abs(Vx_torsion).max(), np.abs(Vy_torsion).max()
+        )
+
+    # Total forces (sum direct + torsion)
+    # Convention: Return forces as calculated
+    # - Direct forces: applied loads (will need negation for reaction arrows)
+    # - Torsion forces: resisting forces (will need negation for reaction arrows)
+    V_resultant = np.hypot(Vx_total, Vy_total)
+
+    return {
+        'x': geometry['x'],
+        'y': geometry['y'],
+        'N': N_total,
+        'N_direct': N_direct,
+        'N_Mx': N_from_Mx_only,
+        'N_My': N_from_My_only,
+        'Vx': Vx_total,
+        'Vx_direct': Vx_direct,
+        'Vx_torsion': Vx_torsion,
+        'Vy': Vy_total,
+        'Vy_direct': Vy_direct,
+        'Vy_torsion': Vy_torsion,
+        'V_total': V_resultant
+    }
+
+
+def _distribute_core(
+    dx: np.ndarray,
+    dy: np.ndarray,
+    areas: np.ndarray,
+    N: float,
+    Vx: float,
+    Vy: float,
+    Mx: float,
+    My: float,
+    Mz: float,
+    Ix: float,
+    Iy: float,
+    Ixy: float,
+    sum_r2: float
+) -> Tuple[np.ndarray, ...]:
+    """
+    Numeric core of distribute_loads_with_bending
+
+    Works on plain float arrays and scalars only (no dicts or lists), so the
+    whole distribution is a handful of array operations per load case.
+
+    Args:
+        dx, dy: Fastener distances from centroid [mm]
+        areas: Fastener areas [mm²]
+        N, Vx, Vy: Applied forces [kN]
+        Mx, My, Mz: Total moments incl. eccentricity [kNm]
+        Ix, Iy, Ixy: Section properties [mm⁴]
+        sum_r2: Σ(dx² + dy²) [mm²]
+
+    Returns:
+        (N_total, N_direct, N_Mx, N_My,
+         Vx_total, Vx_direct, Vx_torsion,
+         Vy_total, Vy_direct, Vy_torsion) arrays [kN]
+        Arrays may share memory (e.g. N_total is N_direct without bending),
+        so treat them as read-only.
+    """
+    n = len(dx)
+    inv_n = 1.0 / n  # Direct share factor, reused for N, Vx and Vy
+
+    # Decide up front which load effects are present; zero-moment load cases
+    # then reduce to the direct N/n, V/n share, and zero loads to a shared
+    # zero array
+    det = Ix * Iy - Ixy**2
+    has_bending = (Mx != 0 or My != 0) and abs(det) >= 1e-10
+    has_torsion = Mz != 0 and sum_r2 > 0
+    zeros = np.zeros(n)
+
+    # AXIAL FORCES (Tension/Compression)
+    N_direct = np.full(n, N * inv_n) if N != 0 else zeros
+
+    # Bending contribution, split into Mx and My parts (for display)
+    # Bending is linear in (Mx, My), so the combined bending force is simply
+    # N_Mx + N_My - no separate combined evaluation is needed
+    if has_bending:
+        N_Mx = _bending_forces_array(dx, dy, areas, Mx, 0.0, Ix, Iy, Ixy) if Mx != 0 else zeros
+        N_My = _bending_forces_array(dx, dy, areas, 0.0, My, Ix, Iy, Ixy) if My != 0 else zeros
+        N_total = N_direct + (N_Mx + N_My)
+    else:
+        # No moments, or degenerate section (all fasteners on a line)
+        N_Mx = zeros
+        N_My = zeros
+        N_total = N_direct
+
+    # SHEAR FORCES
+    # Convention: All forces returned as REACTIONS (what fasteners provide)
+    # This means we negate applied loads to show fastener reactions
+    Vx_direct = np.full(n, Vx * inv_n) if Vx != 0 else zeros  # Applied load per fastener
+    Vy_direct = np.full(n, Vy * inv_n) if Vy != 0 else zeros  # Applied load per fastener
+
+    # Torsional shear from Mz
+    # Following technical notes: torsion.md
+    #
+    # For +Mz (counter-clockwise when viewed from +z):
+    #   F_i = (Mz * r_i) / Σ(r_j²)
+    #   Fx_i = -F_i * (y_i / r_i)
+    #   Fy_i = +F_i * (x_i / r_i)
+    #
+    # Where:
+    #   - x_i, y_i are distances from centroid
+    #   - r_i = sqrt(x_i² + y_i²)
+    #   - Technical notes formulas give resisting forces (fastener reactions)
+    if has_torsion:
+        Mz_Nmm = Mz * 1e6  # kNm → Nmm
+
+        # Force components (for +Mz, CCW)
+        # Technical notes formula gives applied forces on fasteners
+        # Negate to get reaction forces (what fasteners push back with)
         #
-        # Where:
-        #   - x_i, y_i are distances from centroid
-        #   - r_i = sqrt(x_i² + y_i²)
-        #   - Technical notes formulas give resisting forces (fastener reactions)
-        sum_r_squared = sum([(positions[j][0] - centroid[0])**2 + (positions[j][1] - centroid[1])**2
-                             for j in range(len(positions))])
-        if sum_r_squared > 0 and Mz_total != 0:
-            Mz_Nmm = Mz_total * 1e6  # kNm → Nmm
-
-            # Distance from centroid
-            r_i = (dx**2 + dy**2)**0.5  # mm
-
-            if r_i > 0:
-                # Torsional force magnitude at this fastener
-                F_i_N = (Mz_Nmm * r_i) / sum_r_squared  # N
-
-                # DEBUG OUTPUT (remove after testing)
-                if i == 0:  # Only print for first fastener
-                    print(f"DEBUG Torsion: Mz={Mz_total} kNm, r_i={r_i:.2f} mm, sum_r²={sum_r_squared:.0f} mm², F_i={F_i_N:.2f} N")
-
-                # Force components (for +Mz, CCW)
-                # Technical notes formula gives applied forces on fasteners
-                # Negate to get reaction forces (what fasteners push back with)
-                Vx_torsion = +F_i_N * (dy / r_i) / 1000.0  # kN (negated from tech notes)
-                Vy_torsion = -F_i_N * (dx / r_i) / 1000.0  # kN (negated from tech notes)
-            else:
-                # Fastener at centroid has no torsional force
-                Vx_torsion = 0.0
-                Vy_torsion = 0.0
-        else:
-            Vx_torsion = 0.0
-            Vy_torsion = 0.0
-
-        # Total forces (sum direct + torsion)
-        # Convention: Return forces as calculated
-        # - Direct forces: applied loads (will need negation for reaction arrows)
-        # - Torsion forces: resisting forces (will need negation for reaction arrows)
+        # F_i * (y_i / r_i) = Mz * y_i / Σr², so r_i cancels: each component is
+        # a single scaled copy of dy (or dx). A fastener at the centroid
+        # (dx = dy = 0) automatically carries no torsional force.
+        k = Mz_Nmm / sum_r2 / 1000.0  # N/mm → kN/mm
+        Vx_torsion = np.multiply(dy, k)  # kN (negated from tech notes)
+        Vy_torsion = np.multiply(dx, -k)  # kN (negated from tech notes)
+
         Vx_total = Vx_direct + Vx_torsion
         Vy_total = Vy_direct + Vy_torsion
-        V_resultant = (Vx_total**2 + Vy_total**2)**0.5
-
-        distribution.append({
-            'fastener_id': i + 1,
-            'x': float(x),
-            'y': float(y),
-            'N': float(N_total),
-            'N_direct': float(N_direct),
-            'N_Mx': float(N_from_Mx_only),
-            'N_My': float(N_from_My_only),
-            'Vx': float(Vx_total),
-            'Vx_direct': float(Vx_direct),
-            'Vx_torsion': float(Vx_torsion),
-            'Vy': float(Vy_total),
-            'Vy_direct': float(Vy_direct),
-            'Vy_torsion': float(Vy_torsion),
-            'V_total': float(V_resultant)
-        })
-
-    return distribution
\ No newline at end of file
+    else:
+        Vx_torsion = zeros
+        Vy_torsion = zeros
+        Vx_total = Vx_direct
+        Vy_total = Vy_direct
+
+    return (N_total, N_direct, N_Mx, N_My,
+            Vx_total, Vx_direct, Vx_torsion,
+            Vy_total, Vy_direct, Vy_torsion)
@@ -4,19 +4,93 @@ Psi (ψ) modification factors for EC2 Part 4 fastener design
 These factors account for various geometric and loading effects on capacity.
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import math
+from typing import NamedTuple
 
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
-from core.concrete import ConcreteProperties
+import numpy as np
+
+from ..core.fastener import Fastener
+from ..core.fastener_group import FastenerGroup
+from ..core.concrete import ConcreteProperties
+
+
+# Scalar kernels
+#
+# Numeric cores of the ψ factors on plain floats. The public functions below
+# only unpack the Fastener/ConcreteProperties attributes they need and
+# delegate here, so optimization loops can call the kernels directly.
+
+def _psi_s_N(c: float, ccr_N: float) -> float:
+    """ψs,N for edge distance c and characteristic edge distance ccr,N"""
+    if c >= ccr_N:
+        return 1.0
+    # 0 ≤ c < ccr,N bounds the result to [0.7, 1.0) without clamping
+    return 0.7 + 0.3 * (c / ccr_N)
+
+
+def _psi_re_N(c: float, ccr_N: float) -> float:
+    """ψre,N for edge distance c and characteristic edge distance ccr,N"""
+    if c >= ccr_N:
+        return 1.0
+    # c ≥ 0 already gives ψre,N ≥ 0.5; only the upper bound can bind
+    return min(1.0, 0.5 + (c / ccr_N))
+
+
+def _psi_ec_N(e: float, scr_N: float) -> float:
+    """ψec,N for eccentricity e and characteristic spacing scr,N"""
+    if e == 0:
+        return 1.0
+    return min(1.0, 1.0 / (1.0 + 2.0 * e / scr_N))
+
+
+def _psi_M_N(h: float, hef: float) -> float:
+    """ψM,N for member thickness h and embedment depth hef"""
+    if h >= 2.0 * hef:
+        return 1.0
+    return h / (2.0 * hef)
+
+
+def _psi_h_V(c: float, h: float) -> float:
+    """ψh,V for edge distance c1 and member thickness h"""
+    if h >= 1.5 * c:
+        return 1.0
+    return min(1.0, math.sqrt((1.5 * c) / h))
+
+
+def _psi_ec_V(e: float, c: float) -> float:
+    """ψec,V for eccentricity e and edge distance c1"""
+    if e == 0:
+        return 1.0
+    return min(1.0, 1.0 / (1.0 + 2.0 * e / (3.0 * c)))
+
+
+def _psi_alpha_V_formula(alpha: float) -> float:
+    """ψα,V = 1 / (cos(α) + 0.4×sin(α)) for load angle α [degrees]"""
+    if alpha == 0:
+        return 1.0
+    alpha_rad = math.radians(alpha)
+    denominator = math.cos(alpha_rad) + 0.4 * math.sin(alpha_rad)
+    if denominator > 0:
+        return 1.0 / denominator
+    return 1.0
+
+
+# ψα,V for whole-degree angles 0°..90°, which covers almost all UI input
+_PSI_ALPHA_TABLE = tuple(_psi_alpha_V_formula(a) for a in range(91))
+
+
+def _psi_alpha_V(alpha: float) -> float:
+    """ψα,V for load angle α [degrees], using the table for whole degrees"""
+    if 0 <= alpha <= 90 and alpha == int(alpha):
+        return _PSI_ALPHA_TABLE[int(alpha)]
+    return _psi_alpha_V_formula(alpha)
 
 
 def calculate_psi_s_N(
     concrete: ConcreteProperties,
     fastener: Fastener,
-    edge_distance: float = None
+    edge_distance: float = None,
+    ccr_N: float = None
 ) -> float:
     """
     Calculate ψs,N - shell spalling factor for concrete cone failure
@@ -36,6 +110,7 @@ def calculate_psi_s_N(
         fastener: Fastener with embedment depth
         edge_distance: Minimum edge distance c [mm]
                       If None, assumes no edge effect (ψs,N = 1.0)
+        ccr_N: Optional precomputed characteristic edge distance [mm]
 
     Returns:
         ψs,N: Shell spalling factor (0.7 ≤ ψs,N ≤ 1.0)
@@ -50,24 +125,16 @@ def calculate_psi_s_N(
     if edge_distance is None:
         return 1.0
 
-    ccr_N = fastener.get_characteristic_edge_distance()  # 1.5 × hef
+    if ccr_N is None:
+        ccr_N = fastener.constants.ccr_N  # 1.5 × hef
 
-    if edge_distance >= ccr_N:
-        # No shell spalling effect
-        return 1.0
-
-    # Calculate factor
-    psi_s_N = 0.7 + 0.3 * (edge_distance / ccr_N)
-
-    # Ensure within valid range
-    psi_s_N = max(0.7, min(1.0, psi_s_N))
-
-    return psi_s_N
+    return _psi_s_N(edge_distance, ccr_N)
 
 
 def calculate_psi_re_N(
     edge_distance: float,
-    fastener: Fastener
+    fastener: Fastener,
+    ccr_N: float = None
 ) -> float:
     """
     Calculate ψre,N - edge effect factor for concrete cone failure
@@ -85,6 +152,7 @@ def calculate_psi_re_N(
     Args:
         edge_distance: Edge distance c1 [mm]
         fastener: Fastener with embedment depth
+        ccr_N: Optional precomputed characteristic edge distance [mm]
 
     Returns:
         ψre,N: Edge effect factor (0.5 ≤ ψre,N ≤ 1.0)
@@ -96,23 +164,17 @@ def calculate_psi_re_N(
         - If c1 ≥ ccr,N, then ψre,N = 1.0 (no edge effect)
         - Minimum value is 0.5
     """
-    ccr_N = fastener.get_characteristic_edge_distance()  # 1.5 × hef
+    if ccr_N is None:
+        ccr_N = fastener.constants.ccr_N  # 1.5 × hef
 
-    if edge_distance >= ccr_N:
-        return 1.0
-
-    psi_re_N = 0.5 + (edge_distance / ccr_N)
-
-    # Ensure within range
-    psi_re_N = max(0.5, min(1.0, psi_re_N))
-
-    return psi_re_N
+    return _psi_re_N(edge_distance, ccr_N)
 
 
 def calculate_psi_ec_N(
     eccentricity: float,
     group: FastenerGroup = None,
-    fastener: Fastener = None
+    fastener: Fastener = None,
+    scr_N: float = None
 ) -> float:
     """
     Calculate ψec,N - eccentricity factor for tension loading
@@ -130,6 +192,7 @@ def calculate_psi_ec_N(
         eccentricity: Load eccentricity eN [mm]
         group: Optional FastenerGroup
         fastener: Optional Fastener (if no group)
+        scr_N: Optional precomputed characteristic spacing [mm]
 
     Returns:
         ψec,N: Eccentricity factor (≤ 1.0)
@@ -144,16 +207,15 @@ def calculate_psi_ec_N(
         return 1.0
 
     # Get characteristic spacing
-    if group is not None:
-        scr_N = group.reference_fastener.get_characteristic_spacing()
-    elif fastener is not None:
-        scr_N = fastener.get_characteristic_spacing()
-    else:
-        raise ValueError("Must provide either group or fastener")
-
-    psi_ec_N = 1.0 / (1.0 + 2.0 * eccentricity / scr_N)
+    if scr_N is None:
+        if group is not None:
+            scr_N = group.reference_fastener.constants.scr_N
+        elif fastener is not None:
+            scr_N = fastener.constants.scr_N
+        else:
+            raise ValueError("Must provide either group or fastener")
 
-    return min(1.0, psi_ec_N)
+    return _psi_ec_N(eccentricity, scr_N)
 
 
 def calculate_psi_M_N(
@@ -186,12 +248,7 @@ def calculate_psi_M_N(
         - Only applies for thin members (h < 2 × hef)
         - For thick members, full cone develops (ψM,N = 1.0)
     """
-    if concrete.h >= 2.0 * fastener.hef:
-        return 1.0
-
-    psi_M_N = concrete.h / (2.0 * fastener.hef)
-
-    return min(1.0, psi_M_N)
+    return _psi_M_N(concrete.h, fastener.hef)
 
 
 # Shear-specific psi factors
@@ -228,12 +285,7 @@ def calculate_psi_h_V(
         - Applies to concrete edge failure in shear
         - For thick members, no reduction (ψh,V = 1.0)
     """
-    if concrete.h >= 1.5 * edge_distance:
-        return 1.0
-
-    psi_h_V = ((1.5 * edge_distance) / concrete.h) ** 0.5
-
-    return min(1.0, psi_h_V)
+    return _psi_h_V(edge_distance, concrete.h)
 
 
 def calculate_psi_ec_V(
@@ -265,12 +317,7 @@ def calculate_psi_ec_V(
         - Only relevant when load is eccentric
         - If eV = 0, then ψec,V = 1.0
     """
-    if eccentricity == 0:
-        return 1.0
-
-    psi_ec_V = 1.0 / (1.0 + 2.0 * eccentricity / (3.0 * edge_distance))
-
-    return min(1.0, psi_ec_V)
+    return _psi_ec_V(eccentricity, edge_distance)
 
 
 def calculate_psi_alpha_V(load_angle: float) -> float:
@@ -301,37 +348,156 @@ def calculate_psi_alpha_V(load_angle: float) -> float:
         - α = 90° is least critical (load parallel to edge)
         - Factor increases capacity for non-perpendicular loads
     """
-    import math
+    return _psi_alpha_V(load_angle)
 
-    if load_angle == 0:
-        return 1.0
 
-    # Convert to radians
-    alpha_rad = math.radians(load_angle)
+# Vectorized psi factors
+#
+# Array counterparts of the scalar functions above for parametric sweeps
+# (many edge distances, eccentricities or embedment depths at once). They
+# take plain numbers/arrays instead of Fastener/ConcreteProperties objects
+# and broadcast like any NumPy ufunc.
 
-    # Calculate factor
-    denominator = math.cos(alpha_rad) + 0.4 * math.sin(alpha_rad)
+def calculate_psi_s_N_vec(edge_distance, hef) -> np.ndarray:
+    """
+    Vectorized ψs,N = 0.7 + 0.3 × c / ccr,N ≤ 1.0
+
+    Args:
+        edge_distance: Edge distances c [mm] (array-like)
+        hef: Embedment depth(s) hef [mm] (array-like or scalar)
+
+    Returns:
+        Array of ψs,N values
+    """
+    c = np.asarray(edge_distance, dtype=float)
+    ccr_N = 1.5 * np.asarray(hef, dtype=float)
+    return np.minimum(0.7 + 0.3 * c / ccr_N, 1.0)
 
-    if denominator > 0:
-        psi_alpha_V = 1.0 / denominator
-    else:
-        psi_alpha_V = 1.0
 
-    return psi_alpha_V
+def calculate_psi_re_N_vec(edge_distance, hef) -> np.ndarray:
+    """
+    Vectorized ψre,N = 0.5 + c1 / ccr,N ≤ 1.0
 
+    Args:
+        edge_distance: Edge distances c1 [mm] (array-like)
+        hef: Embedment depth(s) hef [mm] (array-like or scalar)
 
-def get_all_psi_factors_tension(
+    Returns:
+        Array of ψre,N values
+    """
+    c = np.asarray(edge_distance, dtype=float)
+    ccr_N = 1.5 * np.asarray(hef, dtype=float)
+    return np.minimum(0.5 + c / ccr_N, 1.0)
+
+
+def calculate_psi_ec_N_vec(eccentricity, hef) -> np.ndarray:
+    """
+    Vectorized ψec,N = 1 / (1 + 2 × eN / scr,N) ≤ 1.0
+
+    Args:
+        eccentricity: Load eccentricities eN [mm] (array-like)
+        hef: Embedment depth(s) hef [mm] (array-like or scalar)
+
+    Returns:
+        Array of ψec,N values
+    """
+    e = np.asarray(eccentricity, dtype=float)
+    scr_N = 3.0 * np.asarray(hef, dtype=float)
+    return np.minimum(1.0 / (1.0 + 2.0 * e / scr_N), 1.0)
+
+
+def calculate_psi_M_N_vec(h, hef) -> np.ndarray:
+    """
+    Vectorized ψM,N = h / (2 × hef) ≤ 1.0
+
+    Args:
+        h: Member thickness(es) [mm] (array-like or scalar)
+        hef: Embedment depth(s) hef [mm] (array-like or scalar)
+
+    Returns:
+        Array of ψM,N values
+    """
+    h = np.asarray(h, dtype=float)
+    hef = np.asarray(hef, dtype=float)
+    return np.minimum(h / (2.0 * hef), 1.0)
+
+
+def calculate_psi_h_V_vec(edge_distance, h) -> np.ndarray:
+    """
+    Vectorized ψh,V = (1.5 × c1 / h)^0.5 ≤ 1.0
+
+    Args:
+        edge_distance: Edge distances c1 [mm] (array-like)
+        h: Member thickness(es) [mm] (array-like or scalar)
+
+    Returns:
+        Array of ψh,V values (1.0 where h ≥ 1.5 × c1)
+    """
+    c = np.asarray(edge_distance, dtype=float)
+    h = np.asarray(h, dtype=float)
+    psi_h_V = np.minimum(np.sqrt(1.5 * c / h), 1.0)
+    return np.where(h >= 1.5 * c, 1.0, psi_h_V)
+
+
+def calculate_psi_ec_V_vec(eccentricity, edge_distance) -> np.ndarray:
+    """
+    Vectorized ψec,V = 1 / (1 + 2 × eV / (3 × c1)) ≤ 1.0
+
+    Args:
+        eccentricity: Load eccentricities eV [mm] (array-like)
+        edge_distance: Edge distances c1 [mm] (array-like)
+
+    Returns:
+        Array of ψec,V values (1.0 where eV = 0)
+    """
+    e = np.asarray(eccentricity, dtype=float)
+    c = np.asarray(edge_distance, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        psi_ec_V = np.minimum(1.0 / (1.0 + 2.0 * e / (3.0 * c)), 1.0)
+    return np.where(e == 0, 1.0, psi_ec_V)
+
+
+def calculate_psi_alpha_V_vec(load_angle) -> np.ndarray:
+    """
+    Vectorized ψα,V = 1 / (cos(α) + 0.4×sin(α))
+
+    Args:
+        load_angle: Angles α [degrees] (array-like)
+
+    Returns:
+        Array of ψα,V values (1.0 where the denominator is not positive)
+    """
+    alpha_rad = np.deg2rad(np.asarray(load_angle, dtype=float))
+    denominator = np.cos(alpha_rad) + 0.4 * np.sin(alpha_rad)
+    with np.errstate(divide='ignore'):
+        return np.where(denominator > 0, 1.0 / denominator, 1.0)
+
+
+class PsiFactorsTension(NamedTuple):
+    """ψ factors for tension loading (floats, or ndarrays from the batch function)"""
+    psi_s_N: float
+    psi_re_N: float
+    psi_ec_N: float
+    psi_M_N: float
+
+
+class PsiFactorsShear(NamedTuple):
+    """ψ factors for shear loading (floats, or ndarrays from the batch function)"""
+    psi_h_V: float
+    psi_ec_V: float
+    psi_alpha_V: float
+
+
+def calculate_psi_factors_tension(
     fastener: Fastener,
     concrete: ConcreteProperties,
     edge_distance: float = None,
     eccentricity: float = 0.0,
     group: FastenerGroup = None
-) -> dict:
+) -> PsiFactorsTension:
     """
     Calculate all ψ factors for tension loading
 
-    Useful for UI display and reporting.
-
     Args:
         fastener: Fastener object
         concrete: Concrete properties
@@ -339,6 +505,91 @@ def get_all_psi_factors_tension(
         eccentricity: Load eccentricity [mm]
         group: Optional fastener group
 
+    Returns:
+        PsiFactorsTension with fields:
+            - psi_s_N: Shell spalling factor
+            - psi_re_N: Edge effect factor
+            - psi_ec_N: Eccentricity factor
+            - psi_M_N: Member thickness factor
+
+    Notes:
+        - Scalar inputs only; use calculate_psi_factors_tension_batch for
+          arrays of edge distances or eccentricities
+    """
+    # Characteristic distances are shared by several factors; look them up once
+    ccr_N = fastener.constants.ccr_N
+    scr_N = (group.reference_fastener if group is not None else fastener).constants.scr_N
+
+    return PsiFactorsTension(
+        _psi_s_N(edge_distance, ccr_N) if edge_distance is not None else 1.0,
+        _psi_re_N(edge_distance, ccr_N) if edge_distance else 1.0,
+        _psi_ec_N(eccentricity, scr_N),
+        _psi_M_N(concrete.h, fastener.hef)
+    )
+
+
+def calculate_psi_factors_tension_batch(
+    fastener: Fastener,
+    concrete: ConcreteProperties,
+    edge_distance=None,
+    eccentricity=0.0,
+    group: FastenerGroup = None
+) -> PsiFactorsTension:
+    """
+    Calculate all ψ factors for tension loading over arrays of inputs
+
+    Vectorized counterpart of calculate_psi_factors_tension for parametric
+    sweeps, built on the *_vec functions above.
+
+    Args:
+        fastener: Fastener object
+        concrete: Concrete properties
+        edge_distance: Edge distances [mm] (array-like, scalar or None)
+        eccentricity: Load eccentricities [mm] (array-like or scalar)
+        group: Optional fastener group
+
+    Returns:
+        PsiFactorsTension of ndarrays broadcast to a common shape
+    """
+    # Edge factors use the checked fastener; only ψec,N uses the group reference
+    hef = fastener.hef
+    hef_ref = (group.reference_fastener if group is not None else fastener).hef
+    e = np.asarray(eccentricity, dtype=float)
+
+    if edge_distance is None:
+        # No edge effect for any point in the sweep
+        ones = np.ones_like(e)
+        psi_s_N = ones
+        psi_re_N = ones
+    else:
+        c = np.asarray(edge_distance, dtype=float)
+        psi_s_N = calculate_psi_s_N_vec(c, hef)
+        # c = 0 is treated as "no edge distance given", as in the scalar path
+        psi_re_N = np.where(c == 0, 1.0, calculate_psi_re_N_vec(c, hef))
+
+    psi_s_N, psi_re_N, psi_ec_N = np.broadcast_arrays(
+        psi_s_N, psi_re_N, calculate_psi_ec_N_vec(e, hef_ref)
+    )
+    psi_M_N = np.full(psi_s_N.shape, calculate_psi_M_N(concrete, fastener))
+
+    return PsiFactorsTension(
+        psi_s_N.copy(), psi_re_N.copy(), psi_ec_N.copy(), psi_M_N
+    )
+
+
+def get_all_psi_factors_tension(
+    fastener: Fastener,
+    concrete: ConcreteProperties,
+    edge_distance: float = None,
+    eccentricity: float = 0.0,
+    group: FastenerGroup = None
+) -> dict:
+    """
+    Calculate all ψ factors for tension loading
+
+    Useful for UI display and reporting. See calculate_psi_factors_tension
+    for the arguments.
+
     Returns:
         Dictionary with all ψ factors:
             - 'psi_s_N': Shell spalling factor
@@ -346,23 +597,18 @@ def get_all_psi_factors_tension(
             - 'psi_ec_N': Eccentricity factor
             - 'psi_M_N': Member thickness factor
     """
-    factors = {
-        'psi_s_N': calculate_psi_s_N(concrete, fastener, edge_distance),
-        'psi_re_N': calculate_psi_re_N(edge_distance, fastener) if edge_distance else 1.0,
-        'psi_ec_N': calculate_psi_ec_N(eccentricity, group, fastener),
-        'psi_M_N': calculate_psi_M_N(concrete, fastener)
-    }
+    return calculate_psi_factors_tension(
+        fastener, concrete, edge_distance, eccentricity, group
+    )._asdict()
 
-    return factors
 
-
-def get_all_psi_factors_shear(
+def calculate_psi_factors_shear(
     fastener: Fastener,
     concrete: ConcreteProperties,
     edge_distance: float,
     eccentricity: float = 0.0,
     load_angle: float = 0.0
-) -> dict:
+) -> PsiFactorsShear:
     """
     Calculate all ψ factors for shear loading
 
@@ -374,12 +620,67 @@ def get_all_psi_factors_shear(
         load_angle: Load angle relative to edge [degrees]
 
     Returns:
-        Dictionary with all ψ factors for shear
+        PsiFactorsShear with fields psi_h_V, psi_ec_V and psi_alpha_V
+
+    Notes:
+        - Scalar inputs only; use calculate_psi_factors_shear_batch for
+          arrays of edge distances, eccentricities or load angles
     """
-    factors = {
-        'psi_h_V': calculate_psi_h_V(concrete, fastener, edge_distance),
-        'psi_ec_V': calculate_psi_ec_V(eccentricity, edge_distance),
-        'psi_alpha_V': calculate_psi_alpha_V(load_angle)
-    }
+    return PsiFactorsShear(
+        _psi_h_V(edge_distance, concrete.h),
+        _psi_ec_V(eccentricity, edge_distance),
+        _psi_alpha_V(load_angle)
+    )
+
+
+def calculate_psi_factors_shear_batch(
+    fastener: Fastener,
+    concrete: ConcreteProperties,
+    edge_distance,
+    eccentricity=0.0,
+    load_angle=0.0
+) -> PsiFactorsShear:
+    """
+    Calculate all ψ factors for shear loading over arrays of inputs
+
+    Vectorized counterpart of calculate_psi_factors_shear for parametric
+    sweeps, built on the *_vec functions above.
 
-    return factors
+    Args:
+        fastener: Fastener object
+        concrete: Concrete properties
+        edge_distance: Edge distances c1 [mm] (array-like or scalar)
+        eccentricity: Load eccentricities [mm] (array-like or scalar)
+        load_angle: Load angles relative to edge [degrees] (array-like or scalar)
+
+    Returns:
+        PsiFactorsShear of ndarrays broadcast to a common shape
+    """
+    psi_h_V, psi_ec_V, psi_alpha_V = np.broadcast_arrays(
+        calculate_psi_h_V_vec(edge_distance, concrete.h),
+        calculate_psi_ec_V_vec(eccentricity, edge_distance),
+        calculate_psi_alpha_V_vec(load_angle)
+    )
+
+    return PsiFactorsShear(psi_h_V.copy(), psi_ec_V.copy(), psi_alpha_V.copy())
+
+
+def get_all_psi_factors_shear(
+    fastener: Fastener,
+    concrete: ConcreteProperties,
+    edge_distance: float,
+    eccentricity: float = 0.0,
+    load_angle: float = 0.0
+) -> dict:
+    """
+    Calculate all ψ factors for shear loading
+
+    Useful for UI display and reporting. See calculate_psi_factors_shear
+    for the arguments.
+
+    Returns:
+        Dictionary with all ψ factors for shear
+    """
+    return calculate_psi_factors_shear(
+        fastener, concrete, edge_distance, eccentricity, load_angle
+    )._asdict()
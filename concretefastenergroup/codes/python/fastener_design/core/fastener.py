@@ -4,10 +4,19 @@ Fastener class for EC2 Part 4 design
 Represents a single fastener with geometry and material properties.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, NamedTuple
 import math
 
 
+class FastenerConstants(NamedTuple):
+    """Per-fastener constants derived from hef, As and fuk"""
+    NRk_s_per_unit: float    # As × fuk [N]
+    ccr_N: float             # 1.5 × hef [mm]
+    scr_N: float             # 3 × hef [mm]
+    h_thresh: float          # 2 × hef [mm]
+    blowout_c_thresh: float  # 0.5 × hef [mm]
+
+
 class Fastener:
     """
     Represents a single fastener with geometry and material properties
@@ -20,6 +29,7 @@ class Fastener:
         fastener_type: Type of fastener
         d_head: Head diameter for headed fasteners [mm]
         material_grade: Steel material grade (e.g., '8.8', '5.8')
+        constants: FastenerConstants derived from hef, As and fuk
 
     Standard: EC2-4-1, EC2-4-2
 
@@ -87,6 +97,9 @@ class Fastener:
         # Validate geometry
         self._validate()
 
+        # Constants reused by the failure mode and ψ factor functions
+        self.refresh_constants()
+
     def _validate(self) -> None:
         """
         Validate fastener geometry
@@ -129,6 +142,21 @@ class Fastener:
                     f"fastener diameter {self.d} mm"
                 )
 
+    def refresh_constants(self) -> None:
+        """
+        Rebuild the constants derived from hef, As and fuk
+
+        Called from __init__; call it again after reassigning hef, As or
+        fuk on an existing fastener.
+        """
+        self.constants = FastenerConstants(
+            NRk_s_per_unit=self.As * self.fuk,
+            ccr_N=1.5 * self.hef,
+            scr_N=3.0 * self.hef,
+            h_thresh=2.0 * self.hef,
+            blowout_c_thresh=0.5 * self.hef
+        )
+
     def get_effective_area(self) -> float:
         """
         Get stressed cross-sectional area
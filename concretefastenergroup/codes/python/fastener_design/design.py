@@ -9,6 +9,8 @@ from typing import List, Dict, Optional, Tuple
 import sys
 from pathlib import Path
 
+import numpy as np
+
 from fastener_design.core.fastener import Fastener
 from fastener_design.core.fastener_group import FastenerGroup
 from fastener_design.core.concrete import ConcreteProperties
@@ -373,27 +375,139 @@ class FastenerDesign:
                 - 'overall_status': 'OK' or 'FAIL'
                 - 'summary': Text summary
         """
-        results = {}
-
         # Check tension if load present
-        if self.NEd > 0:
-            results['tension'] = self.check_tension_modes(tension_modes)
-        else:
-            results['tension'] = None
+        tension = self.check_tension_modes(tension_modes) if self.NEd > 0 else None
 
         # Check shear if load present
-        if self.VEd > 0:
-            results['shear'] = self.check_shear_modes(shear_modes)
-        else:
-            results['shear'] = None
+        shear = self.check_shear_modes(shear_modes) if self.VEd > 0 else None
+
+        return self._combine_results(tension, shear, self.NEd, self.VEd)
+
+    def check_all_modes_batch(
+        self,
+        tension,
+        shear,
+        tension_modes: List[str] = None,
+        shear_modes: List[str] = None
+    ) -> List[Dict]:
+        """
+        Check all specified failure modes for several load cases at once
+
+        Resistances do not depend on the loads, so each failure mode is
+        evaluated once and only the utilizations are computed per load case,
+        as whole arrays. Each result equals check_all_modes of a design
+        built with the corresponding loads.
+
+        Args:
+            tension: Tension loads NEd per load case [N] (array-like)
+            shear: Shear loads VEd per load case [N] (array-like, same length)
+            tension_modes: List of tension modes to check (None = all)
+            shear_modes: List of shear modes to check (None = all)
+
+        Returns:
+            List with one check_all_modes results dictionary per load case
+
+        Notes:
+            - The loading of this design object is not changed
+            - The per-mode 'info' dictionaries are shared between load cases
+
+        Example:
+            >>> results = design.check_all_modes_batch([30000, 45000], [20000, 0])
+            >>> [r['overall_status'] for r in results]
+        """
+        NEd = np.asarray(tension, dtype=float)
+        VEd = np.asarray(shear, dtype=float)
+        if NEd.ndim != 1 or NEd.shape != VEd.shape:
+            raise ValueError(
+                f"Tension and shear must be 1-D arrays of equal length, "
+                f"got shapes {NEd.shape} and {VEd.shape}"
+            )
+
+        tension_results = self._batch_mode_results(
+            self.check_tension_modes, tension_modes, NEd, 'NRd'
+        )
+        shear_results = self._batch_mode_results(
+            self.check_shear_modes, shear_modes, VEd, 'VRd'
+        )
+
+        return [
+            self._combine_results(t, s, NEd_i, VEd_i)
+            for t, s, NEd_i, VEd_i in zip(tension_results, shear_results, NEd.tolist(), VEd.tolist())
+        ]
+
+    def _batch_mode_results(self, check, modes, loads: np.ndarray, resistance_key: str) -> List:
+        """
+        Per-load-case results of check_tension_modes or check_shear_modes
+
+        Args:
+            check: Bound check_tension_modes or check_shear_modes
+            modes: Modes passed on to check
+            loads: Design loads per load case [N]
+            resistance_key: 'NRd' or 'VRd'
+
+        Returns:
+            List of results dictionaries, None where the load is not positive
+        """
+        loaded = loads > 0
+        if not loaded.any():
+            return [None] * len(loads)
+
+        # Resistances and governing mode, evaluated once for all load cases
+        template = check(modes)
+        mode_names = [key for key, value in template.items() if isinstance(value, dict)]
+
+        resistances = np.array([template[mode][resistance_key] for mode in mode_names], dtype=float)
+        utilization = np.divide(
+            loads[:, None], resistances,
+            out=np.full((len(loads), len(mode_names)), float('inf')),
+            where=resistances > 0
+        ).tolist()
+        if 'min_capacity' in template:
+            within_capacity = (loads <= template['min_capacity']).tolist()
+
+        batch = []
+        for i, is_loaded in enumerate(loaded.tolist()):
+            if not is_loaded:
+                batch.append(None)
+                continue
+
+            results = dict(template)
+            for j, mode in enumerate(mode_names):
+                results[mode] = {**template[mode], 'utilization': utilization[i][j]}
+            if 'min_capacity' in template:
+                results['status'] = 'OK' if within_capacity[i] else 'FAIL'
+            batch.append(results)
+
+        return batch
+
+    def _combine_results(
+        self,
+        tension: Optional[Dict],
+        shear: Optional[Dict],
+        NEd: float,
+        VEd: float
+    ) -> Dict:
+        """
+        Add the interaction check, overall status and summary to mode results
+
+        Args:
+            tension: Tension mode results, or None if no tension
+            shear: Shear mode results, or None if no shear
+            NEd: Design tension load [N]
+            VEd: Design shear load [N]
+
+        Returns:
+            Complete results dictionary (see check_all_modes)
+        """
+        results = {'tension': tension, 'shear': shear}
 
         # Check combined loading interaction (N-V) if both loads present
         if results['tension'] and results['shear']:
             results['interaction'] = check_combined_loading(
                 results['tension'],
                 results['shear'],
-                self.NEd,
-                self.VEd
+                NEd,
+                VEd
             )
         else:
             results['interaction'] = None
@@ -410,12 +524,12 @@ class FastenerDesign:
         results['overall_status'] = 'OK' if all(s == 'OK' for s in statuses) else 'FAIL'
 
         # Generate summary
-        results['summary'] = self._generate_summary(results)
+        results['summary'] = self._generate_summary(results, NEd, VEd)
 
         return results
 
-    def _generate_summary(self, results: Dict) -> str:
-        """Generate text summary of results"""
+    def _generate_summary(self, results: Dict, NEd: float, VEd: float) -> str:
+        """Generate text summary of results for the given design loads"""
         lines = []
         lines.append("=" * 60)
         lines.append("FASTENER DESIGN CHECK SUMMARY")
@@ -429,10 +543,10 @@ class FastenerDesign:
 
         # Loading
         lines.append(f"\nLoading ({self.loading_type}):")
-        if self.NEd > 0:
-            lines.append(f"  Tension: NEd = {self.NEd/1000:.1f} kN")
-        if self.VEd > 0:
-            lines.append(f"  Shear:   VEd = {self.VEd/1000:.1f} kN")
+        if NEd > 0:
+            lines.append(f"  Tension: NEd = {NEd/1000:.1f} kN")
+        if VEd > 0:
+            lines.append(f"  Shear:   VEd = {VEd/1000:.1f} kN")
 
         # Tension results
         if results.get('tension'):
@@ -5,20 +5,18 @@ Standard: EC2-4-2 Section 6.3.5
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
-from core.concrete import ConcreteProperties
-from calculations.psi_factors import (
-    calculate_psi_h_V,
-    calculate_psi_ec_V,
-    calculate_psi_alpha_V,
+
+from ...core.fastener import Fastener
+from ...core.fastener_group import FastenerGroup
+from ...core.concrete import ConcreteProperties
+from ...calculations.psi_factors import (
+    PsiFactorsShear,
+    _psi_h_V,
+    _psi_ec_V,
+    _psi_alpha_V,
     get_all_psi_factors_shear
 )
-from calculations.geometry import calculate_area_ratio_edge
+from ...calculations.geometry import calculate_area_ratio_edge
 
 
 def concrete_edge_failure(
@@ -85,10 +83,12 @@ def concrete_edge_failure(
     # Step 2: Calculate projected area ratio
     area_ratio = calculate_area_ratio_edge(fastener, edge_distance, group)
 
-    # Step 3: Calculate ψ factors
-    psi_h_V = calculate_psi_h_V(concrete, fastener, edge_distance)
-    psi_ec_V = calculate_psi_ec_V(eccentricity, edge_distance)
-    psi_alpha_V = calculate_psi_alpha_V(load_angle)
+    # Step 3: Calculate ψ factors (scalar kernels, see calculate_psi_factors_shear)
+    psi_h_V, psi_ec_V, psi_alpha_V = PsiFactorsShear(
+        _psi_h_V(edge_distance, concrete.h),
+        _psi_ec_V(eccentricity, edge_distance),
+        _psi_alpha_V(load_angle)
+    )
 
     # ψs,V (spacing effect) - simplified as 1.0 for single fastener
     psi_s_V = 1.0 if group is None else 0.7  # Simplified reduction for groups
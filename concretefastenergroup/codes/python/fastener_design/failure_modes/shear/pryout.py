@@ -5,16 +5,13 @@ Standard: EC2-4-2 Section 6.3.4
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
-from core.concrete import ConcreteProperties
+from ...core.fastener import Fastener
+from ...core.fastener_group import FastenerGroup
+from ...core.concrete import ConcreteProperties
 
 # Import concrete cone calculation (pry-out is related to cone capacity)
-from failure_modes.tension.concrete_cone import concrete_cone_failure
+from ..tension.concrete_cone import concrete_cone_failure
 
 
 def pryout_failure(
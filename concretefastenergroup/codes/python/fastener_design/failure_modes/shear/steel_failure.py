@@ -5,11 +5,8 @@ Standard: EC2-4-2 Section 6.3.3
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
+from ...core.fastener import Fastener
 
 
 def steel_failure_shear(
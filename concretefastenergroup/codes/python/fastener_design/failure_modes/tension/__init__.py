@@ -3,13 +3,18 @@
 from .steel_failure import steel_failure_tension
 from .concrete_cone import concrete_cone_failure
 from .pullout import pullout_failure
-from .splitting import splitting_failure
-from .blowout import blowout_failure
+from .splitting import splitting_failure, splitting_requirements_met
+from .blowout import blowout_failure, blowout_relevant_mask, is_blowout_relevant
+from .grid import evaluate_tension_grid
 
 __all__ = [
     'steel_failure_tension',
     'concrete_cone_failure',
     'pullout_failure',
     'splitting_failure',
-    'blowout_failure'
+    'splitting_requirements_met',
+    'blowout_failure',
+    'blowout_relevant_mask',
+    'is_blowout_relevant',
+    'evaluate_tension_grid'
 ]
@@ -4,14 +4,59 @@ Blow-out failure in tension
 Standard: EC2-4-2 Section 6.2.7
 """
 
+from functools import lru_cache
+from math import sqrt
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
-from core.concrete import ConcreteProperties
+import numpy as np
+
+from ...core.fastener import Fastener
+from ...core.fastener_group import FastenerGroup
+from ...core.concrete import ConcreteProperties
+
+
+# Empirical factor (from European Technical Specification)
+K_CB = 8.0  # Typical value
+
+
+def _blowout_resistance(
+    c: float,
+    hef: float,
+    fck: float,
+    h: float,
+    spacing: float = 0.0
+) -> float:
+    """
+    Blow-out resistance kernel on plain floats
+
+    Args:
+        c: Edge distance [mm]
+        hef: Embedment depth [mm]
+        fck: Concrete strength [N/mm²]
+        h: Member thickness [mm]
+        spacing: Maximum spacing along the edge [mm] (0 for single fastener)
+
+    Returns:
+        NRk_cb: Characteristic blow-out resistance [N] (1e9 if not relevant)
+    """
+    # Blow-out typically only when c < 0.5 × hef
+    if c >= 0.5 * hef:
+        # Blow-out not critical - return high value
+        return 1e9
+
+    # Simplified formula based on edge distance and concrete strength
+    NRk_cb = K_CB * c * sqrt(c) * sqrt(fck)
+
+    # Spacing effect
+    if spacing > 0:
+        NRk_cb *= 1.0 + spacing / c
+
+    # Geometric effects (simplified)
+    # If member is thin relative to embedment, reduction applies
+    if h < hef:
+        NRk_cb *= h / hef
+
+    return NRk_cb
 
 
 def blowout_failure(
@@ -62,36 +107,58 @@ def blowout_failure(
         >>> concrete = ConcreteProperties(strength_class='C25/30', thickness=150)
         >>> NRk_cb = blowout_failure(fastener, concrete, edge_distance=50)
     """
-    # Check if blow-out is relevant
-    # Blow-out typically only when c < 0.5 × hef
-    if edge_distance >= 0.5 * fastener.hef:
-        # Blow-out not critical - return high value
+    # Blow-out not critical - skip the group spacing lookup
+    if edge_distance >= fastener.constants.blowout_c_thresh:
         return 1e9
 
-    # Empirical factor (from European Technical Specification)
-    k_cb = 8.0  # Typical value
-
     # Spacing effect
     if group and group.n_fasteners > 1:
         spacing = group.get_max_spacing()
-        spacing_factor = 1.0 + spacing / edge_distance
     else:
-        spacing_factor = 1.0
+        spacing = 0.0
 
-    # Calculate blow-out capacity
-    # Simplified formula based on edge distance and concrete strength
-    NRk_cb0 = k_cb * (edge_distance ** 1.5) * (concrete.fck ** 0.5)
+    return _blowout_resistance(
+        edge_distance, fastener.hef, concrete.fck, concrete.h, spacing
+    )
 
-    # Apply spacing effect
-    NRk_cb = NRk_cb0 * spacing_factor
 
-    # Geometric effects (simplified)
-    # If member is thin relative to embedment, reduction applies
-    if concrete.h < fastener.hef:
-        thickness_reduction = concrete.h / fastener.hef
-        NRk_cb *= thickness_reduction
+def blowout_relevant_mask(hef, edge_distance) -> np.ndarray:
+    """
+    Boolean mask of points where blow-out must be checked (c < 0.5 × hef)
 
-    return NRk_cb
+    Args:
+        hef: Embedment depth(s) [mm] (array-like or scalar)
+        edge_distance: Edge distance(s) c [mm] (array-like)
+
+    Returns:
+        Boolean ndarray, True where blow-out is relevant
+    """
+    return np.asarray(edge_distance, dtype=float) < 0.5 * np.asarray(hef, dtype=float)
+
+
+def is_blowout_relevant(fastener: Fastener, edge_distance: float) -> bool:
+    """
+    Check if blow-out must be considered (c < 0.5 × hef)
+
+    Use in loops that only need the yes/no answer; check_blowout_relevance
+    adds the explanation text for reporting.
+
+    Args:
+        fastener: Fastener object
+        edge_distance: Edge distance c [mm]
+
+    Returns:
+        True if blow-out is relevant
+    """
+    return edge_distance < fastener.constants.blowout_c_thresh
+
+
+@lru_cache(maxsize=256)
+def _format_blowout_reason(edge_distance: float, c_threshold: float, is_relevant: bool) -> str:
+    """Explanation text for a blow-out relevance check (memoized)"""
+    if is_relevant:
+        return f"Edge distance ({edge_distance}mm) < threshold ({c_threshold}mm). Blow-out must be checked."
+    return f"Edge distance ({edge_distance}mm) ≥ threshold ({c_threshold}mm). Blow-out not critical."
 
 
 def check_blowout_relevance(
@@ -115,21 +182,16 @@ def check_blowout_relevance(
             - 'c_threshold': Threshold edge distance (0.5 × hef)
             - 'reason': Explanation
     """
-    c_threshold = 0.5 * fastener.hef
+    c_threshold = fastener.constants.blowout_c_thresh
 
-    is_relevant = edge_distance < c_threshold
-
-    if is_relevant:
-        reason = f"Edge distance ({edge_distance}mm) < threshold ({c_threshold}mm). Blow-out must be checked."
-    else:
-        reason = f"Edge distance ({edge_distance}mm) ≥ threshold ({c_threshold}mm). Blow-out not critical."
+    is_relevant = is_blowout_relevant(fastener, edge_distance)
 
     return {
         'relevant': is_relevant,
         'c_threshold': c_threshold,
         'c_actual': edge_distance,
         'hef': fastener.hef,
-        'reason': reason
+        'reason': _format_blowout_reason(edge_distance, c_threshold, is_relevant)
     }
 
 
@@ -5,21 +5,19 @@ Standard: EC2-4-2 Section 6.2.5
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from core.fastener import Fastener
-from core.fastener_group import FastenerGroup
-from core.concrete import ConcreteProperties
-from calculations.psi_factors import (
-    calculate_psi_s_N,
-    calculate_psi_re_N,
-    calculate_psi_ec_N,
-    calculate_psi_M_N,
+
+from ...core.fastener import Fastener
+from ...core.fastener_group import FastenerGroup
+from ...core.concrete import ConcreteProperties
+from ...calculations.psi_factors import (
+    PsiFactorsTension,
+    _psi_s_N,
+    _psi_re_N,
+    _psi_ec_N,
+    _psi_M_N,
     get_all_psi_factors_tension
 )
-from calculations.geometry import calculate_area_ratio_cone
+from ...calculations.geometry import calculate_area_ratio_cone
 
 
 def concrete_cone_failure(
@@ -85,14 +83,18 @@ def concrete_cone_failure(
         edge_dict = {'c1': edge_distance} if edge_distance else None
         area_ratio = calculate_area_ratio_cone(fastener, None, edge_dict)
 
-    # Step 3: Calculate ψ factors
-    psi_s_N = calculate_psi_s_N(concrete, fastener, edge_distance)
-    psi_re_N = calculate_psi_re_N(edge_distance, fastener) if edge_distance else 1.0
-    psi_ec_N = calculate_psi_ec_N(eccentricity, group, fastener)
-    psi_M_N = calculate_psi_M_N(concrete, fastener)
+    # Step 3: Calculate ψ factors (scalar kernels, see calculate_psi_factors_tension)
+    ccr_N = fastener.constants.ccr_N
+    scr_N = (group.reference_fastener if group is not None else fastener).constants.scr_N
+    psi = PsiFactorsTension(
+        _psi_s_N(edge_distance, ccr_N) if edge_distance is not None else 1.0,
+        _psi_re_N(edge_distance, ccr_N) if edge_distance else 1.0,
+        _psi_ec_N(eccentricity, scr_N),
+        _psi_M_N(concrete.h, fastener.hef)
+    )
 
     # Step 4: Calculate final resistance
-    NRk_c = NRk_c0 * area_ratio * psi_s_N * psi_re_N * psi_ec_N * psi_M_N
+    NRk_c = NRk_c0 * area_ratio * psi.psi_s_N * psi.psi_re_N * psi.psi_ec_N * psi.psi_M_N
 
     return NRk_c
 
@@ -0,0 +1,112 @@
+"""
+Tension resistance over a grid of edge distances and eccentricities
+
+Evaluates all tension failure modes for a single fastener in one vectorized
+pass, for design-space sweeps (e.g. UI sliders over edge distance).
+
+Standard: EC2-4-2 Section 6.2
+"""
+
+from math import sqrt
+
+import numpy as np
+
+from ...core.fastener import Fastener
+from ...core.concrete import ConcreteProperties
+from ...calculations.psi_factors import (
+    calculate_psi_s_N_vec,
+    calculate_psi_re_N_vec,
+    calculate_psi_ec_N_vec,
+    calculate_psi_M_N,
+)
+from ...calculations.geometry import calculate_area_ratio_cone_vec
+from .steel_failure import steel_failure_tension
+from .pullout import pullout_failure
+from .splitting import splitting_requirements_met
+from .blowout import K_CB, blowout_relevant_mask
+
+
+def evaluate_tension_grid(
+    fastener: Fastener,
+    concrete: ConcreteProperties,
+    edge_distances,
+    eccentricities=0.0
+) -> dict:
+    """
+    Calculate characteristic tension resistances over a grid of load points
+
+    Equivalent to calling steel_failure_tension, concrete_cone_failure,
+    pullout_failure, splitting_failure and blowout_failure for a single
+    fastener at every (edge distance, eccentricity) point, but evaluated
+    with whole-array operations instead of one Python call per point.
+
+    Args:
+        fastener: Fastener object
+        concrete: Concrete properties
+        edge_distances: Edge distances c [mm] (array-like, > 0)
+        eccentricities: Load eccentricities eN [mm] (array-like or scalar),
+                        broadcast against edge_distances
+
+    Returns:
+        Dictionary of ndarrays with characteristic resistances [N]:
+            - 'steel', 'cone', 'pullout', 'splitting', 'blowout'
+            - 'governing': Minimum over all modes
+
+    Notes:
+        - Single fastener only (no group spacing or projected-area effects)
+        - Non-governing modes return 1e9, as in the scalar functions
+
+    Example:
+        >>> fastener = Fastener(16, 100, 500)
+        >>> concrete = ConcreteProperties(strength_class='C25/30', thickness=200)
+        >>> grid = evaluate_tension_grid(fastener, concrete, np.linspace(40, 300, 50))
+        >>> grid['governing'].shape
+        (50,)
+    """
+    c, e = np.broadcast_arrays(
+        np.asarray(edge_distances, dtype=float),
+        np.asarray(eccentricities, dtype=float)
+    )
+    hef = fastener.hef
+
+    # Steel and pull-out do not depend on geometry
+    NRk_s = np.full(c.shape, steel_failure_tension(fastener))
+    NRk_p = np.full(c.shape, pullout_failure(fastener, concrete))
+
+    # Concrete cone: NRk,c⁰ × Ac,N/Ac,N⁰ × ψs,N × ψre,N × ψM,N (× ψec,N)
+    NRk_c0 = concrete.get_k_factor() * (concrete.fck_cube ** 0.5) * (hef ** 1.5)
+    NRk_c_centric = (
+        NRk_c0 * calculate_area_ratio_cone_vec(c, hef)
+        * calculate_psi_s_N_vec(c, hef)
+        * calculate_psi_re_N_vec(c, hef)
+        * calculate_psi_M_N(concrete, fastener)
+    )
+    NRk_c = NRk_c_centric * calculate_psi_ec_N_vec(e, hef)
+
+    # Splitting: prevented by reinforcement or minimum edge distance/thickness
+    if concrete.reinforced:
+        NRk_sp = np.full(c.shape, 1e9)
+    else:
+        requirements_met = splitting_requirements_met(c, concrete.h, fastener.d, hef)
+        NRk_sp = np.where(requirements_met, 1e9, 0.5 * NRk_c_centric)
+
+    # Blow-out: only evaluated where relevant (c < 0.5 × hef)
+    NRk_cb = np.full(c.shape, 1e9)
+    relevant = blowout_relevant_mask(hef, c)
+    if relevant.any():
+        c_cb = c[relevant]
+        NRk_cb_relevant = K_CB * c_cb * np.sqrt(c_cb) * sqrt(concrete.fck)
+        if concrete.h < hef:
+            NRk_cb_relevant *= concrete.h / hef
+        NRk_cb[relevant] = NRk_cb_relevant
+
+    governing = np.minimum.reduce([NRk_s, NRk_c, NRk_p, NRk_sp, NRk_cb])
+
+    return {
+        'steel': NRk_s,
+        'cone': NRk_c,
+        'pullout': NRk_p,
+        'splitting': NRk_sp,
+        'blowout': NRk_cb,
+        'governing': governing,
+    }
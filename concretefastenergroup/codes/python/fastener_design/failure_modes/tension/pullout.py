@@ -5,12 +5,9 @@ Standard: EC2-4-2 Section 6.2.4
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
-from core.concrete import ConcreteProperties
+from ...core.fastener import Fastener
+from ...core.concrete import ConcreteProperties
 
 
 def pullout_failure(
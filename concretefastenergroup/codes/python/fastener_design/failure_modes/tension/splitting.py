@@ -5,13 +5,30 @@ Standard: EC2-4-2 Section 6.2.6
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
-from core.concrete import ConcreteProperties
-from core.fastener_group import FastenerGroup
+from ...core.fastener import Fastener
+from ...core.concrete import ConcreteProperties
+from ...core.fastener_group import FastenerGroup
+
+
+def splitting_requirements_met(edge_distance, h, d, hef):
+    """
+    Check the edge distance and thickness requirements against splitting
+
+    c ≥ c_min,sp = 1.5 × d and h ≥ 2 × hef, the edge distance and thickness
+    checks of check_splitting_risk without the report. Plain comparisons, so
+    edge_distance may be a float or an ndarray (element-wise result).
+
+    Args:
+        edge_distance: Edge distance(s) c [mm]
+        h: Member thickness [mm]
+        d: Fastener diameter [mm]
+        hef: Embedment depth [mm]
+
+    Returns:
+        True (or boolean ndarray) where both requirements are met
+    """
+    return (edge_distance >= 1.5 * d) & (h >= 2.0 * hef)
 
 
 def check_splitting_risk(
@@ -69,7 +86,7 @@ def check_splitting_risk(
         checks['spacing'] = {'ok': True, 'note': 'Not provided'}
 
     # Minimum thickness check
-    h_min = 2.0 * fastener.hef
+    h_min = fastener.constants.h_thresh
     checks['thickness'] = {
         'value': concrete.h,
         'minimum': h_min,
@@ -77,7 +94,7 @@ def check_splitting_risk(
     }
 
     # Determine overall risk
-    all_ok = all(check.get('ok', False) for check in checks.values())
+    all_ok = all(check['ok'] for check in checks.values())
 
     if all_ok:
         risk = 'low'
@@ -145,7 +162,7 @@ def splitting_failure(
     # Otherwise, calculate reduced capacity
     # Simplified formula (actual depends on specific geometry)
     # Conservative estimate: fraction of concrete cone capacity
-    from failure_modes.tension.concrete_cone import concrete_cone_failure
+    from .concrete_cone import concrete_cone_failure
 
     NRk_c = concrete_cone_failure(
         fastener, concrete, group, edge_distance, eccentricity=0.0
@@ -5,11 +5,8 @@ Standard: EC2-4-2 Section 6.2.3
 """
 
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.fastener import Fastener
+from ...core.fastener import Fastener
 
 
 def steel_failure_tension(
@@ -56,10 +53,7 @@ def steel_failure_tension(
         >>> print(f"Steel capacity: {NRk_s/1000:.1f} kN")
         Steel capacity: 78.5 kN
     """
-    # Calculate characteristic resistance
-    NRk_s = n_fasteners * fastener.As * fastener.fuk
-
-    return NRk_s
+    return n_fasteners * fastener.constants.NRk_s_per_unit
 
 
 def get_steel_capacity_info(fastener: Fastener) -> dict:
@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures for fastener design tests
+
+tests/ is a subpackage of fastener_design, so pytest puts codes/python on
+sys.path once during collection; test modules import fastener_design.*
+without any path setup of their own.
+"""
+
+from functools import lru_cache
+
+import pytest
+
+from ..core.fastener import Fastener
+from ..core.concrete import ConcreteProperties
+
+
+@lru_cache(maxsize=None)
+def _cached_fastener(diameter, embedment_depth, steel_grade, area=None,
+                     fastener_type='headed', d_head=None):
+    return Fastener(diameter, embedment_depth, steel_grade, area=area,
+                    fastener_type=fastener_type, d_head=d_head)
+
+
+@lru_cache(maxsize=None)
+def _cached_concrete(fck=None, thickness=0, cracked=False, reinforced=False,
+                     strength_class=None):
+    return ConcreteProperties(fck=fck, thickness=thickness, cracked=cracked,
+                              reinforced=reinforced, strength_class=strength_class)
+
+
+@pytest.fixture(scope='session')
+def make_fastener():
+    """
+    Factory returning one shared Fastener per unique set of arguments
+
+    Instances are shared between tests and must not be mutated; tests that
+    change attributes or expect constructor errors call Fastener directly.
+    """
+    return _cached_fastener
+
+
+@pytest.fixture(scope='session')
+def make_concrete():
+    """
+    Factory returning one shared ConcreteProperties per unique set of arguments
+
+    Instances are shared between tests and must not be mutated.
+    """
+    return _cached_concrete
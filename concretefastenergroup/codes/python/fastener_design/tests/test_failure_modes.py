@@ -2,26 +2,32 @@
 Unit tests for failure mode calculations
 """
 
-import unittest
+import importlib.util
 import sys
-from pathlib import Path
+import unittest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import pytest
 
-from core.fastener import Fastener
-from core.concrete import ConcreteProperties
-from core.fastener_group import FastenerGroup
+from fastener_design.core.fastener import Fastener
+from fastener_design.core.concrete import ConcreteProperties
+from fastener_design.core.fastener_group import FastenerGroup
 
-from failure_modes.tension.steel_failure import steel_failure_tension
-from failure_modes.tension.concrete_cone import concrete_cone_failure
-from failure_modes.tension.pullout import pullout_failure
-from failure_modes.tension.splitting import splitting_failure, check_splitting_risk
-from failure_modes.tension.blowout import blowout_failure, check_blowout_relevance
-from failure_modes.shear.steel_failure import steel_failure_shear
-from failure_modes.shear.concrete_edge import concrete_edge_failure
-from failure_modes.shear.pryout import pryout_failure
+from fastener_design.failure_modes.tension.steel_failure import steel_failure_tension
+from fastener_design.failure_modes.tension.concrete_cone import concrete_cone_failure
+from fastener_design.failure_modes.tension.pullout import pullout_failure
+from fastener_design.failure_modes.tension.splitting import (
+    splitting_failure, check_splitting_risk, splitting_requirements_met
+)
+from fastener_design.failure_modes.tension.blowout import (
+    blowout_failure, blowout_relevant_mask, check_blowout_relevance, is_blowout_relevant
+)
+from fastener_design.failure_modes.tension.grid import evaluate_tension_grid
+from fastener_design.failure_modes.shear.steel_failure import steel_failure_shear
+from fastener_design.failure_modes.shear.concrete_edge import concrete_edge_failure
+from fastener_design.failure_modes.shear.pryout import pryout_failure
 
-from design import FastenerDesign
+from fastener_design.design import FastenerDesign
 
 
 class TestSteelFailure(unittest.TestCase):
@@ -143,6 +149,22 @@ class TestConcreteFailures(unittest.TestCase):
         self.assertEqual(risk['risk'], 'high')
         self.assertFalse(risk['requirements_met'])
 
+    def test_splitting_requirements_mask(self):
+        """Test that the array requirement check agrees with the risk check"""
+        fastener = Fastener(16, 100, 500)
+        edge_distances = [10.0, 23.9, 24.0, 150.0]
+
+        for thickness in (150, 250):
+            concrete = ConcreteProperties(strength_class='C25/30', thickness=thickness)
+            met = splitting_requirements_met(
+                np.array(edge_distances), concrete.h, fastener.d, fastener.hef
+            )
+
+            self.assertEqual(
+                met.tolist(),
+                [check_splitting_risk(fastener, concrete, c)['requirements_met'] for c in edge_distances]
+            )
+
     def test_blowout_not_relevant(self):
         """Test blow-out when not relevant (large edge distance)"""
         fastener = Fastener(16, 100, 500)
@@ -175,6 +197,23 @@ class TestConcreteFailures(unittest.TestCase):
         # Large edge distance
         relevance_large = check_blowout_relevance(fastener, edge_distance=150)
         self.assertFalse(relevance_large['relevant'])
+        self.assertIn('not critical', relevance_large['reason'])
+
+        # Fast check agrees without building the report
+        self.assertTrue(is_blowout_relevant(fastener, 40))
+        self.assertFalse(is_blowout_relevant(fastener, 150))
+
+    def test_blowout_relevant_mask(self):
+        """Test that the relevance mask agrees with the scalar relevance check"""
+        fastener = Fastener(16, 100, 500)
+        edge_distances = [20, 40, 49.9, 50, 150]
+
+        mask = blowout_relevant_mask(fastener.hef, edge_distances)
+
+        self.assertEqual(
+            mask.tolist(),
+            [check_blowout_relevance(fastener, c)['relevant'] for c in edge_distances]
+        )
 
     def test_pryout_failure(self):
         """Test pry-out failure"""
@@ -204,6 +243,39 @@ class TestConcreteFailures(unittest.TestCase):
         self.assertAlmostEqual(VRk_cp, 2.0 * NRk_c, places=0)
 
 
+class TestTensionGrid(unittest.TestCase):
+    """Test vectorized tension resistance over a grid of edge distances"""
+
+    def test_grid_matches_scalar_modes(self):
+        """Test that every grid point matches the scalar failure mode functions"""
+        fastener = Fastener(16, 100, 500, area=157)
+        edge_distances = [10.0, 20.0, 40.0, 49.9, 50.0, 100.0, 150.0, 300.0]
+        eccentricities = [0.0, 30.0]
+
+        for thickness in (80, 150, 250):
+            concrete = ConcreteProperties(strength_class='C25/30', thickness=thickness)
+            grid = evaluate_tension_grid(
+                fastener, concrete,
+                [[c] for c in edge_distances], eccentricities
+            )
+            self.assertEqual(grid['governing'].shape, (len(edge_distances), 2))
+
+            for i, c in enumerate(edge_distances):
+                for j, e in enumerate(eccentricities):
+                    expected = {
+                        'steel': steel_failure_tension(fastener),
+                        'cone': concrete_cone_failure(fastener, concrete, None, c, e),
+                        'pullout': pullout_failure(fastener, concrete),
+                        'splitting': splitting_failure(fastener, concrete, None, c),
+                        'blowout': blowout_failure(fastener, concrete, c),
+                    }
+                    for mode, value in expected.items():
+                        self.assertAlmostEqual(grid[mode][i, j] / value, 1.0, places=9)
+                    self.assertAlmostEqual(
+                        grid['governing'][i, j] / min(expected.values()), 1.0, places=9
+                    )
+
+
 class TestFastenerDesign(unittest.TestCase):
     """Test FastenerDesign class"""
 
@@ -244,6 +316,32 @@ class TestFastenerDesign(unittest.TestCase):
         self.assertIn('steel', results['shear'])
         self.assertIn('edge', results['shear'])
 
+    def test_batch_matches_scalar(self):
+        """Test that the batch check equals check_all_modes per load case"""
+        design = FastenerDesign(
+            fastener=self.fastener,
+            concrete=self.concrete,
+            loading={'tension': 0.0, 'shear': 0.0},
+            edge_distances={'c1': 150}
+        )
+        tension = [50000.0, 0.0, 20000.0, 250000.0, 0.0]
+        shear = [0.0, 20000.0, 15000.0, 90000.0, 0.0]
+
+        batch = design.check_all_modes_batch(tension, shear)
+
+        self.assertEqual(len(batch), len(tension))
+        for NEd, VEd, results in zip(tension, shear, batch):
+            single = FastenerDesign(
+                fastener=self.fastener,
+                concrete=self.concrete,
+                loading={'tension': NEd, 'shear': VEd},
+                edge_distances={'c1': 150}
+            )
+            self.assertEqual(results, single.check_all_modes())
+
+        with self.assertRaises(ValueError):
+            design.check_all_modes_batch([1000.0, 2000.0], [1000.0])
+
     def test_combined_loading(self):
         """Test design with combined tension and shear"""
         design = FastenerDesign(
@@ -376,21 +474,8 @@ class TestFastenerDesign(unittest.TestCase):
             self.assertIn('info', results[mode])
 
 
-def run_tests():
-    """Run all tests"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    suite.addTests(loader.loadTestsFromTestCase(TestSteelFailure))
-    suite.addTests(loader.loadTestsFromTestCase(TestConcreteFailures))
-    suite.addTests(loader.loadTestsFromTestCase(TestFastenerDesign))
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result.wasSuccessful()
-
-
 if __name__ == '__main__':
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    args = [__file__]
+    if importlib.util.find_spec('xdist') is not None:
+        args += ['-n', 'auto']
+    sys.exit(pytest.main(args))
@@ -2,98 +2,79 @@
 Unit tests for N-V interaction calculations
 """
 
-import unittest
+import importlib.util
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from calculations.interaction import check_nv_interaction, check_combined_loading, get_interaction_summary
-from core.fastener import Fastener
-from core.concrete import ConcreteProperties
-from design import FastenerDesign
-
-
-class TestNVInteraction(unittest.TestCase):
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from fastener_design.calculations.interaction import (
+    check_nv_interaction,
+    check_nv_interaction_batch,
+    calculate_nv_interaction_terms,
+    check_combined_loading,
+    get_interaction_summary,
+)
+from fastener_design.core.fastener import Fastener
+from fastener_design.core.concrete import ConcreteProperties
+from fastener_design.design import FastenerDesign
+
+
+# Boundary sweep: tension/shear utilizations × exponents (α = β), with the
+# expected ratios computed in one array operation as an independent oracle
+_SWEEP_NRd, _SWEEP_VRd = 100000.0, 40000.0
+_SWEEP_UTIL = np.array([0.0, 0.25, 0.5, 1.0, 1.2])
+_SWEEP_EXPONENTS = np.array([1.0, 1.5, 2.0])
+_n, _v, _a = (
+    grid.ravel() for grid in np.meshgrid(_SWEEP_UTIL, _SWEEP_UTIL, _SWEEP_EXPONENTS, indexing='ij')
+)
+_SWEEP_EXPECTED = _n ** _a + _v ** _a
+
+SWEEP_CASES = [
+    pytest.param(
+        n * _SWEEP_NRd, v * _SWEEP_VRd, a, expected,
+        id=f'n{n:g}-v{v:g}-exp{a:g}'
+    )
+    for n, v, a, expected in zip(_n, _v, _a, _SWEEP_EXPECTED)
+]
+
+
+class TestNVInteraction:
     """Test N-V interaction calculations"""
 
-    def test_interaction_basic(self):
-        """Test basic interaction calculation"""
-        result = check_nv_interaction(
-            NEd=50000,  # 50 kN
-            NRd=100000,  # 100 kN
-            VEd=20000,  # 20 kN
-            VRd=40000,  # 40 kN
-            alpha=1.5,
-            beta=1.5
-        )
-
+    @pytest.mark.parametrize("NEd,NRd,VEd,VRd,alpha,beta,expected,status", [
         # (50/100)^1.5 + (20/40)^1.5 = 0.3536 + 0.3536 = 0.7071
-        self.assertAlmostEqual(result['interaction_ratio'], 0.7071, places=3)
-        self.assertEqual(result['status'], 'OK')
-
-    def test_interaction_tension_only(self):
-        """Test with tension only (no shear)"""
-        result = check_nv_interaction(
-            NEd=50000,
-            NRd=100000,
-            VEd=0,
-            VRd=40000,
-            alpha=1.5,
-            beta=1.5
-        )
-
+        pytest.param(50000, 100000, 20000, 40000, 1.5, 1.5, 0.7071, 'OK', id='basic'),
         # (50/100)^1.5 + 0 = 0.3536
-        self.assertAlmostEqual(result['interaction_ratio'], 0.3536, places=3)
-        self.assertEqual(result['status'], 'OK')
-
-    def test_interaction_shear_only(self):
-        """Test with shear only (no tension)"""
-        result = check_nv_interaction(
-            NEd=0,
-            NRd=100000,
-            VEd=20000,
-            VRd=40000,
-            alpha=1.5,
-            beta=1.5
-        )
-
+        pytest.param(50000, 100000, 0, 40000, 1.5, 1.5, 0.3536, 'OK', id='tension_only'),
         # 0 + (20/40)^1.5 = 0.3536
-        self.assertAlmostEqual(result['interaction_ratio'], 0.3536, places=3)
-        self.assertEqual(result['status'], 'OK')
-
-    def test_interaction_fail(self):
-        """Test failing interaction check"""
+        pytest.param(0, 100000, 20000, 40000, 1.5, 1.5, 0.3536, 'OK', id='shear_only'),
+        # (90/100)^1.5 + (35/40)^1.5 = 0.8538 + 0.8185 = 1.6723
+        pytest.param(90000, 100000, 35000, 40000, 1.5, 1.5, 1.6723, 'FAIL', id='fail'),
+        # (0.6)^1.5 + (0.6)^1.5 = 0.4648 + 0.4648 = 0.9295 < 1
+        pytest.param(60000, 100000, 24000, 40000, 1.5, 1.5, 0.9295, 'OK', id='limit'),
+        # Linear interaction: (50/100)^1.0 + (20/40)^1.0 = 0.5 + 0.5 = 1.0
+        pytest.param(50000, 100000, 20000, 40000, 1.0, 1.0, 1.0, 'OK', id='different_exponents'),
+    ])
+    def test_interaction(self, NEd, NRd, VEd, VRd, alpha, beta, expected, status):
+        """Test interaction ratio and status for representative load cases"""
         result = check_nv_interaction(
-            NEd=90000,  # High tension
-            NRd=100000,
-            VEd=35000,  # High shear
-            VRd=40000,
-            alpha=1.5,
-            beta=1.5
+            NEd=NEd, NRd=NRd, VEd=VEd, VRd=VRd, alpha=alpha, beta=beta
         )
 
-        # (90/100)^1.5 + (35/40)^1.5 = 0.8539 + 0.8254 = 1.6793
-        self.assertGreater(result['interaction_ratio'], 1.0)
-        self.assertEqual(result['status'], 'FAIL')
-
-    def test_interaction_limit(self):
-        """Test interaction at limit (ratio = 1.0)"""
-        # Need to find values where (NEd/NRd)^1.5 + (VEd/VRd)^1.5 ≈ 1.0
-        # Try 70% of each: (0.7)^1.5 + (0.7)^1.5 = 0.5831 + 0.5831 = 1.166 > 1
-        # Try 60% of each: (0.6)^1.5 + (0.6)^1.5 = 0.4648 + 0.4648 = 0.9296 < 1
+        assert result['interaction_ratio'] == pytest.approx(expected, abs=5e-4)
+        assert result['status'] == status
 
+    @pytest.mark.parametrize("NEd,VEd,exponent,expected", SWEEP_CASES)
+    def test_interaction_sweep(self, NEd, VEd, exponent, expected):
+        """Test interaction ratio and status over the boundary sweep"""
         result = check_nv_interaction(
-            NEd=60000,
-            NRd=100000,
-            VEd=24000,
-            VRd=40000,
-            alpha=1.5,
-            beta=1.5
+            NEd=NEd, NRd=_SWEEP_NRd, VEd=VEd, VRd=_SWEEP_VRd, alpha=exponent, beta=exponent
         )
 
-        self.assertLess(result['interaction_ratio'], 1.0)
-        self.assertEqual(result['status'], 'OK')
+        assert np.isclose(result['interaction_ratio'], expected, atol=1e-12)
+        assert result['status'] == ('OK' if expected <= 1.0 else 'FAIL')
 
     def test_interaction_zero_resistance(self):
         """Test with zero resistance (error condition)"""
@@ -106,24 +87,8 @@ class TestNVInteraction(unittest.TestCase):
             beta=1.5
         )
 
-        self.assertEqual(result['status'], 'FAIL')
-        self.assertIn('error', result)
-
-    def test_interaction_different_exponents(self):
-        """Test with different exponents"""
-        # Linear interaction (α=β=1.0)
-        result = check_nv_interaction(
-            NEd=50000,
-            NRd=100000,
-            VEd=20000,
-            VRd=40000,
-            alpha=1.0,
-            beta=1.0
-        )
-
-        # (50/100)^1.0 + (20/40)^1.0 = 0.5 + 0.5 = 1.0
-        self.assertAlmostEqual(result['interaction_ratio'], 1.0, places=6)
-        self.assertEqual(result['status'], 'OK')
+        assert result['status'] == 'FAIL'
+        assert 'error' in result
 
     def test_interaction_summary(self):
         """Test summary text generation"""
@@ -136,134 +101,153 @@ class TestNVInteraction(unittest.TestCase):
 
         summary = get_interaction_summary(result)
 
-        self.assertIn('COMBINED LOADING', summary)
-        self.assertIn('ned', summary.lower())
-        self.assertIn('ved', summary.lower())
-        self.assertIn('ratio', summary.lower())
+        assert 'COMBINED LOADING' in summary
+        assert 'ned' in summary.lower()
+        assert 'ved' in summary.lower()
+        assert 'ratio' in summary.lower()
+
+    def test_interaction_batch_matches_scalar(self):
+        """Test that the batch check agrees with the scalar check per load case"""
+        cases = [
+            (50000, 100000, 20000, 40000),   # Combined, OK
+            (50000, 100000, 0, 40000),       # Tension only
+            (0, 100000, 20000, 40000),       # Shear only
+            (90000, 100000, 35000, 40000),   # Combined, FAIL
+            (50000, 0, 20000, 40000),        # Zero resistance
+        ]
+        NEd, NRd, VEd, VRd = zip(*cases)
+
+        batch = check_nv_interaction_batch(NEd, NRd, VEd, VRd, alpha=1.5, beta=1.5)
+
+        for i, case in enumerate(cases):
+            scalar = check_nv_interaction(*case, alpha=1.5, beta=1.5)
+            assert batch['status'][i] == scalar['status']
+            for key in ('interaction_ratio', 'tension_term', 'shear_term', 'utilization'):
+                assert batch[key][i] == pytest.approx(scalar[key], abs=5e-10)
+
+
+    def test_interaction_terms_broadcast(self):
+        """Test that the raw interaction terms broadcast over any input shape"""
+        # Scalar input gives a 0-d result
+        ratio, *_ = calculate_nv_interaction_terms(50000, 100000, 20000, 40000)
+        assert ratio.shape == ()
+        assert float(ratio) == pytest.approx(0.7071, abs=5e-4)
+
+        # Fasteners (rows) × load cases (columns)
+        NEd = [[50000, 0], [90000, 60000]]
+        VEd = [[20000], [35000]]
+        ratio, tension_term, shear_term, _, _ = calculate_nv_interaction_terms(
+            NEd, 100000, VEd, 40000
+        )
+        assert ratio.shape == (2, 2)
+        for i in range(2):
+            for j in range(2):
+                scalar = check_nv_interaction(NEd[i][j], 100000, VEd[i][0], 40000)
+                assert ratio[i, j] == pytest.approx(scalar['interaction_ratio'], abs=5e-10)
 
 
-class TestCombinedLoadingWithDesign(unittest.TestCase):
-    """Test combined loading with FastenerDesign class"""
+@pytest.fixture(scope='module')
+def fastener():
+    """Fastener shared by the design tests (never mutated)"""
+    return Fastener(16, 100, 500, area=157)
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.fastener = Fastener(16, 100, 500, area=157)
-        self.concrete = ConcreteProperties(strength_class='C25/30', thickness=200, cracked=True)
 
-    def test_combined_loading_pass(self):
-        """Test design with combined loading that passes"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'tension': 15000, 'shear': 10000},  # Low loads to ensure pass
-            edge_distances={'c1': 150, 'c2': 150}
-        )
+@pytest.fixture(scope='module')
+def concrete():
+    """Concrete shared by the design tests (never mutated)"""
+    return ConcreteProperties(strength_class='C25/30', thickness=200, cracked=True)
+
+
+@lru_cache(maxsize=None)
+def _check_all_modes(fastener, concrete, loading_key, edge_key):
+    """Run check_all_modes once per unique (loading, edge distances) pair"""
+    design = FastenerDesign(
+        fastener=fastener,
+        concrete=concrete,
+        loading=dict(loading_key),
+        edge_distances=dict(edge_key)
+    )
+    return design.check_all_modes()
+
 
-        results = design.check_all_modes()
+def _results(fastener, concrete, loading, edge_distances):
+    """Cached check_all_modes results; callers must not mutate the dict"""
+    return _check_all_modes(
+        fastener, concrete, frozenset(loading.items()), frozenset(edge_distances.items())
+    )
+
+
+@pytest.fixture(scope='module')
+def combined_results(fastener, concrete):
+    """check_all_modes results for the reference combined load case"""
+    return _results(fastener, concrete, {'tension': 30000, 'shear': 20000}, {'c1': 150})
+
+
+class TestCombinedLoadingWithDesign:
+    """Test combined loading with FastenerDesign class"""
+
+    def test_combined_loading_pass(self, fastener, concrete):
+        """Test design with combined loading that passes"""
+        # Low loads to ensure pass
+        results = _results(fastener, concrete, {'tension': 15000, 'shear': 10000}, {'c1': 150, 'c2': 150})
 
         # Should have interaction check
-        self.assertIn('interaction', results)
-        self.assertIsNotNone(results['interaction'])
+        assert 'interaction' in results
+        assert results['interaction'] is not None
 
         # Check that interaction was calculated
-        self.assertIn('interaction_ratio', results['interaction'])
-        self.assertIn('status', results['interaction'])
+        assert 'interaction_ratio' in results['interaction']
+        assert 'status' in results['interaction']
 
-    def test_combined_loading_fail(self):
+    def test_combined_loading_fail(self, fastener, concrete):
         """Test design with combined loading that fails"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'tension': 45000, 'shear': 35000},  # High loads
-            edge_distances={'c1': 150}
-        )
-
-        results = design.check_all_modes()
+        # High loads
+        results = _results(fastener, concrete, {'tension': 45000, 'shear': 35000}, {'c1': 150})
 
         # Should have interaction check
-        self.assertIn('interaction', results)
-        self.assertIsNotNone(results['interaction'])
+        assert 'interaction' in results
+        assert results['interaction'] is not None
 
         # May fail interaction or individual modes
-        self.assertIn(results['overall_status'], ['OK', 'FAIL'])
+        assert results['overall_status'] in ['OK', 'FAIL']
 
-    def test_tension_only_no_interaction(self):
+    def test_tension_only_no_interaction(self, fastener, concrete):
         """Test that tension-only doesn't trigger interaction check"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'tension': 30000},  # Tension only
-            edge_distances={'c1': 150}
-        )
-
-        results = design.check_all_modes()
+        # Tension only
+        results = _results(fastener, concrete, {'tension': 30000}, {'c1': 150})
 
         # Should NOT have interaction check
-        self.assertIsNone(results['interaction'])
+        assert results['interaction'] is None
 
-    def test_shear_only_no_interaction(self):
+    def test_shear_only_no_interaction(self, fastener, concrete):
         """Test that shear-only doesn't trigger interaction check"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'shear': 20000},  # Shear only
-            edge_distances={'c1': 150}
-        )
-
-        results = design.check_all_modes()
+        # Shear only
+        results = _results(fastener, concrete, {'shear': 20000}, {'c1': 150})
 
         # Should NOT have interaction check
-        self.assertIsNone(results['interaction'])
+        assert results['interaction'] is None
 
-    def test_interaction_in_summary(self):
+    def test_interaction_in_summary(self, combined_results):
         """Test that interaction appears in summary"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'tension': 30000, 'shear': 20000},
-            edge_distances={'c1': 150}
-        )
-
-        results = design.check_all_modes()
-        summary = results['summary']
+        summary = combined_results['summary']
 
         # Summary should include interaction info
-        self.assertIn('INTERACTION', summary)
-        self.assertIn('Ratio', summary)
+        assert 'INTERACTION' in summary
+        assert 'Ratio' in summary
 
-    def test_interaction_governing_modes(self):
+    def test_interaction_governing_modes(self, combined_results):
         """Test that interaction uses governing modes"""
-        design = FastenerDesign(
-            fastener=self.fastener,
-            concrete=self.concrete,
-            loading={'tension': 30000, 'shear': 20000},
-            edge_distances={'c1': 150}
-        )
-
-        results = design.check_all_modes()
-        interaction = results['interaction']
+        interaction = combined_results['interaction']
 
         # Should have governing mode info
-        self.assertIn('governing_tension_mode', interaction)
-        self.assertIn('governing_shear_mode', interaction)
-        self.assertIn(interaction['governing_tension_mode'], ['steel', 'cone', 'pullout', 'splitting', 'blowout'])
-        self.assertIn(interaction['governing_shear_mode'], ['steel', 'edge', 'pryout'])
-
-
-def run_tests():
-    """Run all interaction tests"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    suite.addTests(loader.loadTestsFromTestCase(TestNVInteraction))
-    suite.addTests(loader.loadTestsFromTestCase(TestCombinedLoadingWithDesign))
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result.wasSuccessful()
+        assert 'governing_tension_mode' in interaction
+        assert 'governing_shear_mode' in interaction
+        assert interaction['governing_tension_mode'] in ['steel', 'cone', 'pullout', 'splitting', 'blowout']
+        assert interaction['governing_shear_mode'] in ['steel', 'edge', 'pryout']
 
 
 if __name__ == '__main__':
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    args = [__file__]
+    if importlib.util.find_spec('xdist') is not None:
+        args += ['-n', 'auto']
+    sys.exit(pytest.main(args))
@@ -0,0 +1,246 @@
+"""
+Unit tests for planar bending load distribution
+"""
+
+import unittest
+
+import numpy as np
+
+from fastener_design.calculations.planar_bending import (
+    calculate_centroid,
+    calculate_group_geometry,
+    calculate_section_properties,
+    distribute_loads_with_bending,
+    distribute_loads_with_bending_precomputed,
+    verify_torsion_forces,
+)
+
+
+class TestSectionProperties(unittest.TestCase):
+    """Test centroid and section property calculations"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.positions = [(0, 0), (200, 0), (0, 100), (200, 100)]
+        self.areas = [100, 100, 100, 100]
+
+    def test_centroid(self):
+        """Test centroid of symmetric 2x2 group"""
+        xc, yc = calculate_centroid(self.positions, self.areas)
+
+        self.assertAlmostEqual(xc, 100.0, places=6)
+        self.assertAlmostEqual(yc, 50.0, places=6)
+
+    def test_section_properties(self):
+        """Test discrete moments of inertia"""
+        props = calculate_section_properties(self.positions, self.areas, (100.0, 50.0))
+
+        # Ix = 4 × 50² × 100, Iy = 4 × 100² × 100
+        self.assertAlmostEqual(props['Ix'], 1.0e6, places=3)
+        self.assertAlmostEqual(props['Iy'], 4.0e6, places=3)
+        self.assertAlmostEqual(props['Ixy'], 0.0, places=6)
+        self.assertAlmostEqual(props['J'], 5.0e6, places=3)
+
+    def test_section_properties_cached_copy(self):
+        """Test that cached section properties cannot be mutated by callers"""
+        props = calculate_section_properties(self.positions, self.areas, (100.0, 50.0))
+        props['Ix'] = -1.0
+
+        props_again = calculate_section_properties(self.positions, self.areas, (100.0, 50.0))
+        self.assertAlmostEqual(props_again['Ix'], 1.0e6, places=3)
+
+
+class TestLoadDistribution(unittest.TestCase):
+    """Test complete load distribution with bending and torsion"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.positions = [(50, 50), (-50, 50), (-50, -50), (50, -50)]
+        self.areas = [100, 100, 100, 100]
+
+    def test_direct_loads_only(self):
+        """Test that direct loads are shared equally"""
+        dist = distribute_loads_with_bending(
+            self.positions, self.areas, N=8.0, Vx=4.0, Vy=-2.0, Mx=0.0, My=0.0, Mz=0.0
+        )
+
+        self.assertEqual(len(dist), 4)
+        for d in dist:
+            self.assertAlmostEqual(d['N'], 2.0, places=6)
+            self.assertAlmostEqual(d['Vx'], 1.0, places=6)
+            self.assertAlmostEqual(d['Vy'], -0.5, places=6)
+            self.assertAlmostEqual(d['N_Mx'], 0.0, places=6)
+            self.assertAlmostEqual(d['Vx_torsion'], 0.0, places=6)
+
+    def test_bending_split_sums_to_total(self):
+        """Test that Mx and My contributions add up to the total axial force"""
+        dist = distribute_loads_with_bending(
+            self.positions, self.areas, N=4.0, Vx=0.0, Vy=0.0, Mx=1.0, My=0.5, Mz=0.0
+        )
+
+        for d in dist:
+            self.assertAlmostEqual(d['N'], d['N_direct'] + d['N_Mx'] + d['N_My'], places=6)
+
+        # Equilibrium: bending forces sum to zero
+        self.assertAlmostEqual(sum(d['N_Mx'] + d['N_My'] for d in dist), 0.0, places=6)
+
+    def test_torsion_equilibrium(self):
+        """Test that torsional shear recovers the applied Mz"""
+        Mz = 2.0  # kNm
+        dist = distribute_loads_with_bending(
+            self.positions, self.areas, N=0.0, Vx=0.0, Vy=0.0, Mx=0.0, My=0.0, Mz=Mz
+        )
+
+        # One pass over the distribution, then array reductions
+        x, y, Vx_t, Vy_t = np.array(
+            [(d['x'], d['y'], d['Vx_torsion'], d['Vy_torsion']) for d in dist]
+        ).T
+        moment = np.sum(x * Vy_t - y * Vx_t) / 1000.0
+
+        self.assertAlmostEqual(Vx_t.sum(), 0.0, places=6)
+        self.assertAlmostEqual(Vy_t.sum(), 0.0, places=6)
+        # Forces are returned as reactions, opposing the applied moment
+        self.assertAlmostEqual(moment, -Mz, places=6)
+
+    def test_fastener_at_centroid_has_no_torsion(self):
+        """Test that a fastener at the centroid carries no torsional shear"""
+        positions = self.positions + [(0, 0)]
+        areas = self.areas + [100]
+        dist = distribute_loads_with_bending(
+            positions, areas, N=0.0, Vx=0.0, Vy=0.0, Mx=0.0, My=0.0, Mz=1.0
+        )
+
+        self.assertEqual(dist[4]['Vx_torsion'], 0.0)
+        self.assertEqual(dist[4]['Vy_torsion'], 0.0)
+
+    def test_array_input_matches_list_input(self):
+        """Test that ndarray geometry gives the same result as lists of tuples"""
+        loads = dict(N=3.0, Vx=1.0, Vy=2.0, Mx=0.4, My=-0.2, Mz=0.3)
+        from_lists = distribute_loads_with_bending(self.positions, self.areas, **loads)
+        from_arrays = distribute_loads_with_bending(
+            np.array(self.positions, dtype=float), np.array(self.areas, dtype=float), **loads
+        )
+
+        self.assertEqual(from_lists, from_arrays)
+
+    def test_precomputed_output_matches_dict_output(self):
+        """Test that precomputed arrays carry the same values as the per-fastener dicts"""
+        geometry = calculate_group_geometry(self.positions, self.areas)
+        for loads in (dict(N=3.0, Vx=1.0, Vy=2.0, Mx=0.4, My=-0.2, Mz=0.3,
+                           load_point=(20.0, -10.0), application_type='point'),
+                      dict(N=-1.0, Vx=0.0, Vy=5.0, Mx=0.0, My=1.1, Mz=-0.7)):
+            dist = distribute_loads_with_bending(self.positions, self.areas, **loads)
+            arrays = distribute_loads_with_bending_precomputed(geometry, **loads)
+
+            for i, d in enumerate(dist):
+                for key, value in arrays.items():
+                    self.assertEqual(value[i], d[key])
+
+    def test_empty_group(self):
+        """Test that an empty group returns no distribution"""
+        self.assertEqual(distribute_loads_with_bending([], [], 1, 1, 1, 1, 1, 1), [])
+        self.assertIsNone(calculate_group_geometry([], []))
+        self.assertEqual(distribute_loads_with_bending_precomputed(None, 1, 1, 1, 1, 1, 1), {})
+
+
+class TestSignConvention(unittest.TestCase):
+    """Test force signs for pure Mx, My and Mz on a square pattern"""
+
+    # Load cases (rows) × (Mx, My, Mz) [kNm]
+    LOADS = np.array([[10.0, 0.0, 0.0],
+                      [0.0, 10.0, 0.0],
+                      [0.0, 0.0, 10.0]])
+
+    @classmethod
+    def setUpClass(cls):
+        """Distribute all load cases against one precomputed geometry"""
+        cls.positions = [(50, 50), (-50, 50), (-50, -50), (50, -50)]
+        geometry = calculate_group_geometry(cls.positions, [100] * 4)
+        cls.x_sign = np.sign(geometry['dx'])
+        cls.y_sign = np.sign(geometry['dy'])
+        cls.mx_case, cls.my_case, cls.mz_case = (
+            distribute_loads_with_bending_precomputed(geometry, 0.0, 0.0, 0.0, Mx, My, Mz)
+            for Mx, My, Mz in cls.LOADS
+        )
+
+    def test_mx_tension_on_positive_y(self):
+        """Test that +Mx puts the +y fasteners in tension"""
+        np.testing.assert_array_equal(np.sign(self.mx_case['N']), self.y_sign)
+
+    def test_my_tension_on_negative_x(self):
+        """Test that +My puts the -x fasteners in tension"""
+        np.testing.assert_array_equal(np.sign(self.my_case['N']), -self.x_sign)
+
+    def test_mz_reactions_clockwise(self):
+        """Test that +Mz (CCW) gives clockwise torsional reactions"""
+        # sign(Vx) = sign(y), sign(Vy) = -sign(x); mismatches are reported by index
+        np.testing.assert_array_equal(np.sign(self.mz_case['Vx_torsion']), self.y_sign)
+        np.testing.assert_array_equal(np.sign(self.mz_case['Vy_torsion']), -self.x_sign)
+
+    def test_mz_reactions_tangential(self):
+        """Test that torsional reactions are F = Mz·r/Σr², 90° clockwise of r"""
+        x, y = np.array(self.positions, dtype=float).T
+        Mz = self.LOADS[2, 2]
+        r = np.hypot(x, y)
+
+        magnitude = np.hypot(self.mz_case['Vx_torsion'], self.mz_case['Vy_torsion'])
+        angle = np.degrees(np.arctan2(self.mz_case['Vy_torsion'], self.mz_case['Vx_torsion']))
+
+        # Mz [kNm → kN·mm] × r / Σr²
+        np.testing.assert_allclose(magnitude, Mz * 1000.0 * r / np.sum(r * r), rtol=1e-12)
+        np.testing.assert_allclose(np.mod(angle - np.degrees(np.arctan2(y, x)), 360.0), 270.0)
+
+    def test_moments_do_not_couple(self):
+        """Test that each moment only produces its own force component"""
+        for case in (self.mx_case, self.my_case):
+            np.testing.assert_array_equal(case['Vx'], 0.0)
+            np.testing.assert_array_equal(case['Vy'], 0.0)
+        np.testing.assert_array_equal(self.mx_case['N_My'], 0.0)
+        np.testing.assert_array_equal(self.my_case['N_Mx'], 0.0)
+        np.testing.assert_array_equal(self.mz_case['N'], 0.0)
+
+
+class TestTorsionVerification(unittest.TestCase):
+    """Test verify_torsion_forces on distributed torsional reactions"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.positions = [(50, 50), (-50, 50), (-50, -50), (50, -50)]
+        self.Mz = 10.0  # kNm
+
+    def test_square_pattern_torsion(self):
+        """Test that reactions to Mz pass all torsion.md verification checks"""
+        distribution = distribute_loads_with_bending(
+            self.positions, [100] * 4, N=0.0, Vx=0.0, Vy=0.0, Mx=0.0, My=0.0, Mz=self.Mz
+        )
+
+        # Marshal straight into preallocated arrays, no intermediate lists
+        n = len(distribution)
+        Vx_t = np.fromiter((d['Vx_torsion'] for d in distribution), np.float64, n)
+        Vy_t = np.fromiter((d['Vy_torsion'] for d in distribution), np.float64, n)
+
+        # (Vx, Vy) per fastener, in position order: Mz·r/Σr² = 0.5 kN/mm × 50 mm
+        expected = np.array([[25.0, -25.0],
+                             [25.0, 25.0],
+                             [-25.0, 25.0],
+                             [-25.0, -25.0]])
+        np.testing.assert_allclose(np.column_stack((Vx_t, Vy_t)), expected, rtol=0, atol=1e-9)
+
+        # Forces are returned as reactions, so they recover -Mz
+        result = verify_torsion_forces(self.positions, (0.0, 0.0), Vx_t, Vy_t, -self.Mz)
+
+        self.assertTrue(result['perpendicularity_passed'])
+        self.assertTrue(result['force_equilibrium_passed'])
+        self.assertTrue(result['moment_recovery_passed'])
+        self.assertAlmostEqual(result['moment_recovered'], -self.Mz, places=9)
+
+    def test_no_torsion(self):
+        """Test that Mz = 0 passes trivially"""
+        result = verify_torsion_forces(self.positions, (0.0, 0.0), np.zeros(4), np.zeros(4), 0.0)
+
+        self.assertTrue(result['moment_recovery_passed'])
+        self.assertEqual(result['perpendicularity_errors'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests for psi (ψ) modification factors
+"""
+
+import unittest
+
+import numpy as np
+
+from fastener_design.calculations.psi_factors import (
+    calculate_psi_s_N,
+    calculate_psi_re_N,
+    calculate_psi_ec_N,
+    calculate_psi_h_V,
+    calculate_psi_ec_V,
+    calculate_psi_alpha_V,
+    calculate_psi_s_N_vec,
+    calculate_psi_re_N_vec,
+    calculate_psi_ec_N_vec,
+    calculate_psi_h_V_vec,
+    calculate_psi_ec_V_vec,
+    calculate_psi_alpha_V_vec,
+    calculate_psi_factors_tension,
+    calculate_psi_factors_tension_batch,
+    calculate_psi_factors_shear,
+    calculate_psi_factors_shear_batch,
+    get_all_psi_factors_tension,
+    get_all_psi_factors_shear,
+)
+from fastener_design.core.fastener import Fastener
+from fastener_design.core.concrete import ConcreteProperties
+from fastener_design.core.fastener_group import FastenerGroup
+
+
+class TestVectorizedPsiFactors(unittest.TestCase):
+    """Test that vectorized ψ factors match the scalar functions"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.fastener = Fastener(16, 100, 500, area=157)
+        self.concrete = ConcreteProperties(strength_class='C25/30', thickness=150)
+        self.edge_distances = [10.0, 50.0, 100.0, 149.9, 150.0, 300.0]
+        self.eccentricities = [0.0, 25.0, 100.0, 400.0]
+        self.angles = [0.0, 15.0, 45.0, 68.2, 90.0]
+
+    def test_tension_factors_match_scalar(self):
+        """Test ψs,N, ψre,N and ψec,N against the scalar functions"""
+        hef = self.fastener.hef
+
+        psi_s = calculate_psi_s_N_vec(self.edge_distances, hef)
+        psi_re = calculate_psi_re_N_vec(self.edge_distances, hef)
+        for i, c in enumerate(self.edge_distances):
+            self.assertAlmostEqual(psi_s[i], calculate_psi_s_N(self.concrete, self.fastener, c), places=12)
+            self.assertAlmostEqual(psi_re[i], calculate_psi_re_N(c, self.fastener), places=12)
+
+        psi_ec = calculate_psi_ec_N_vec(self.eccentricities, hef)
+        for i, e in enumerate(self.eccentricities):
+            self.assertAlmostEqual(psi_ec[i], calculate_psi_ec_N(e, fastener=self.fastener), places=12)
+
+    def test_shear_factors_match_scalar(self):
+        """Test ψh,V, ψec,V and ψα,V against the scalar functions"""
+        psi_h = calculate_psi_h_V_vec(self.edge_distances, self.concrete.h)
+        for i, c in enumerate(self.edge_distances):
+            self.assertAlmostEqual(psi_h[i], calculate_psi_h_V(self.concrete, self.fastener, c), places=12)
+
+        for c in self.edge_distances:
+            psi_ec = calculate_psi_ec_V_vec(self.eccentricities, c)
+            for i, e in enumerate(self.eccentricities):
+                self.assertAlmostEqual(psi_ec[i], calculate_psi_ec_V(e, c), places=12)
+
+        psi_alpha = calculate_psi_alpha_V_vec(self.angles)
+        for i, a in enumerate(self.angles):
+            self.assertAlmostEqual(psi_alpha[i], calculate_psi_alpha_V(a), places=12)
+
+    def test_embedment_sweep_broadcasts(self):
+        """Test edge distances (rows) × embedment depths (columns)"""
+        c = np.array(self.edge_distances)[:, None]
+        hef = np.array([60.0, 100.0, 200.0])
+
+        psi_s = calculate_psi_s_N_vec(c, hef)
+        self.assertEqual(psi_s.shape, (len(self.edge_distances), 3))
+        self.assertTrue(np.all((psi_s >= 0.7) & (psi_s <= 1.0)))
+
+    def test_tension_batch_matches_scalar(self):
+        """Test that the tension batch returns arrays matching scalar results"""
+        factors = calculate_psi_factors_tension_batch(
+            self.fastener, self.concrete, edge_distance=np.array(self.edge_distances), eccentricity=50.0
+        )._asdict()
+
+        for key in ('psi_s_N', 'psi_re_N', 'psi_ec_N', 'psi_M_N'):
+            self.assertEqual(factors[key].shape, (len(self.edge_distances),))
+
+        for i, c in enumerate(self.edge_distances):
+            scalar = get_all_psi_factors_tension(self.fastener, self.concrete, c, 50.0)
+            for key, value in scalar.items():
+                self.assertAlmostEqual(factors[key][i], value, places=12)
+
+    def test_shear_batch_matches_scalar(self):
+        """Test that the shear batch over load angles matches scalar results"""
+        factors = calculate_psi_factors_shear_batch(
+            self.fastener, self.concrete, edge_distance=100.0, eccentricity=20.0, load_angle=self.angles
+        )._asdict()
+
+        for i, a in enumerate(self.angles):
+            scalar = get_all_psi_factors_shear(self.fastener, self.concrete, 100.0, 20.0, a)
+            for key, value in scalar.items():
+                self.assertAlmostEqual(factors[key][i], value, places=12)
+
+
+class TestPsiFactorSets(unittest.TestCase):
+    """Test the NamedTuple and dict forms of the combined ψ factor sets"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.fastener = Fastener(16, 100, 500, area=157)
+        self.concrete = ConcreteProperties(strength_class='C25/30', thickness=150)
+
+    def test_tension_tuple_matches_dict(self):
+        """Test that the tension tuple and the reporting dict agree"""
+        psi = calculate_psi_factors_tension(self.fastener, self.concrete, 80.0, 20.0)
+        factors = get_all_psi_factors_tension(self.fastener, self.concrete, 80.0, 20.0)
+
+        self.assertEqual(psi._asdict(), factors)
+        self.assertAlmostEqual(psi.psi_s_N, 0.7 + 0.3 * 80.0 / 150.0, places=12)
+
+    def test_tension_batch_matches_scalar_mixed_group(self):
+        """Test the batch against the scalar set for a group with mixed hef"""
+        reference = Fastener(16, 200, 500, area=157)
+        group = FastenerGroup(
+            fasteners=[reference, self.fastener],
+            spacings={'sx': 150},
+            edge_distances={'c1': 100}
+        )
+        edge_distances = [50.0, 100.0, 200.0]
+
+        batch = calculate_psi_factors_tension_batch(
+            self.fastener, self.concrete, np.array(edge_distances), 20.0, group
+        )
+
+        for i, c in enumerate(edge_distances):
+            scalar = calculate_psi_factors_tension(self.fastener, self.concrete, c, 20.0, group)
+            for field, value in scalar._asdict().items():
+                self.assertAlmostEqual(getattr(batch, field)[i], value, places=12)
+
+        self.assertAlmostEqual(batch.psi_s_N[1], 0.9, places=12)
+        self.assertEqual(batch.psi_re_N[1], 1.0)
+
+    def test_shear_tuple_matches_dict(self):
+        """Test that the shear tuple and the reporting dict agree"""
+        psi = calculate_psi_factors_shear(self.fastener, self.concrete, 100.0, 20.0, 30.0)
+        factors = get_all_psi_factors_shear(self.fastener, self.concrete, 100.0, 20.0, 30.0)
+
+        self.assertEqual(psi._asdict(), factors)
+        self.assertEqual(psi.psi_alpha_V, factors['psi_alpha_V'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,8 +9,10 @@ Created: 2026-01-07
 """
 
 import json
-from typing import Dict, List, Any, Optional
-import math
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
 
 # Import core classes
 from fastener_design.core.fastener import Fastener
@@ -23,6 +25,57 @@ from fastener_design.design import FastenerDesign
 from fastener_design.calculations import planar_bending
 
 
+# Distribution arrays (see planar_bending.distribute_loads_with_bending_precomputed)
+# in the column order of the per-fastener output table; the total resultant
+# is appended as the last column
+_TABLE_SOURCES = (
+    'Vx_direct', 'Vy_direct', 'Vx_torsion', 'Vy_torsion', 'Vx', 'Vy',
+    'N', 'N_direct', 'N_Mx', 'N_My', 'V_total'
+)
+
+# Applied actions of a load case [kN, kNm], in reporting order
+_LOAD_KEYS = ('Vx', 'Vy', 'Mx', 'My', 'Mz', 'N')
+
+# Required fastener fields, read in one call
+_FASTENER_REQUIRED = itemgetter('diameter', 'embedment_depth', 'steel_grade')
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize results for the JavaScript side
+
+    Compact separators, no indentation: the output is only parsed by
+    JSON.parse, and pretty-printing roughly doubles the serialization time
+    and payload size for multi-load-case results.
+    """
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _dumps_spliced(obj: Dict, raw: Dict[str, str]) -> str:
+    """
+    Serialize a dictionary with some values already serialized
+
+    Same result as _dumps(obj) with the values of the keys in raw replaced
+    by the given JSON text, which is spliced in as it is.
+    """
+    parts = []
+    for key, value in obj.items():
+        value_json = raw[key] if key in raw else _dumps(value)
+        parts.append(f'{_dumps(key)}:{value_json}')
+
+    return '{' + ','.join(parts) + '}'
+
+
+def _dumps_output(output: Dict) -> str:
+    """
+    Serialize the multi-load-case output of run_analysis
+
+    Same result as _dumps(output), except that the 'load_cases' entries are
+    already JSON strings and are spliced in as they are.
+    """
+    return _dumps_spliced(output, {'load_cases': '[' + ','.join(output['load_cases']) + ']'})
+
+
 def run_analysis(input_json: str) -> str:
     """
     Main entry point for web interface
@@ -53,61 +106,76 @@ def run_analysis(input_json: str) -> str:
         # Create concrete
         concrete = _create_concrete_from_dict(data['concrete'])
 
+        # Fastener geometry is the same for every load case - build it once
+        fasteners_data = data['fasteners']
+        geometry = _input_geometry(fasteners_data)
+
         # Create fastener group (if multiple fasteners)
         group = None
         if len(fasteners) > 1:
-            group = _create_fastener_group(fasteners, data)
+            group = _create_fastener_group(fasteners, data, geometry)
 
         # Get failure modes to check
-        tension_modes = data['analysis_options']['failure_modes'].get('tension', [])
-        shear_modes = data['analysis_options']['failure_modes'].get('shear', [])
+        analysis_options = data['analysis_options']
+        tension_modes = analysis_options['failure_modes'].get('tension', [])
+        shear_modes = analysis_options['failure_modes'].get('shear', [])
+        check_tension = tension_modes if tension_modes else None
+        check_shear = shear_modes if shear_modes else None
+
+        # One design object for all load cases; only the loads change per case
+        design = FastenerDesign(
+            fastener=fasteners[0],  # Use first as reference
+            concrete=concrete,
+            loading={'tension': 0.0, 'shear': 0.0},
+            edge_distances=data.get('edge_distances', {}),
+            spacings=data.get('spacings', {}),
+            loading_type=analysis_options.get('loading_type', 'static')
+        )
 
-        # Analyze ALL load cases
+        # Distribute ALL load cases over the fasteners
         load_cases = data['loading']['load_cases']
-        load_case_results = []
+        actions = [_load_case_actions(lc) for lc in load_cases]
+        distribution_json = []  # Per-fastener distributions, serialized as each case completes
+        max_tension = []        # Most critically loaded fastener per case [N]
+        max_shear = []
 
-        for lc in load_cases:
+        for lc, lc_actions in zip(load_cases, actions):
             # Calculate load distribution for this load case
             load_distribution = _calculate_load_distribution(
-                data['fasteners'],
-                lc
+                fasteners_data,
+                lc,
+                lc_actions,
+                geometry['planar']
             )
 
             # Find maximum forces on any fastener (for design check)
-            # Design must be based on the most critically loaded fastener
+            # Design must be based on the most critically loaded fastener:
+            # - Tension from N + bending moments (Mx, My)
+            # - Shear from Vx, Vy + torsion (Mz)
             max_tension_kN = max([abs(dist['forces']['N']) for dist in load_distribution], default=0.0)
             max_shear_kN = max([dist['resultants']['V_resultant'] for dist in load_distribution], default=0.0)
+            max_tension.append(max_tension_kN * 1000)  # kN → N
+            max_shear.append(max_shear_kN * 1000)      # kN → N
 
-            # Create loading dict using maximum per-fastener forces
-            # This ensures design accounts for:
-            # - Tension from N + bending moments (Mx, My)
-            # - Shear from Vx, Vy + torsion (Mz)
-            loading = {
-                'tension': max_tension_kN * 1000,  # kN → N
-                'shear': max_shear_kN * 1000       # kN → N
-            }
+            distribution_json.append(_dumps(load_distribution))
 
-            # Create design object
-            design = FastenerDesign(
-                fastener=fasteners[0],  # Use first as reference
-                concrete=concrete,
-                loading=loading,
-                edge_distances=data.get('edge_distances', {}),
-                spacings=data.get('spacings', {}),
-                loading_type=data['analysis_options'].get('loading_type', 'static')
-            )
+        # Check every load case in one pass - resistances are evaluated once
+        all_results = design.check_all_modes_batch(
+            max_tension,
+            max_shear,
+            tension_modes=check_tension,
+            shear_modes=check_shear
+        )
 
-            # Run analysis for this load case
-            results = design.check_all_modes(
-                tension_modes=tension_modes if tension_modes else None,
-                shear_modes=shear_modes if shear_modes else None
-            )
+        load_case_results = []  # Summaries for the max-utilization pass
+        load_case_json = []     # Full results per load case, as JSON strings
 
-            # Store results for this load case
-            load_case_results.append({
-                'load_case_id': lc.get('id', lc.get('name', f'LC{len(load_case_results)+1}')),
-                'load_case_name': lc.get('name', f'LC{len(load_case_results)+1}'),
-                'load_distribution': load_distribution,
+        for i, (lc, lc_actions, results) in enumerate(zip(load_cases, actions, all_results), start=1):
+            # Results for this load case
+            load_case_result = {
+                'load_case_id': lc.get('id', lc.get('name', f'LC{i}')),
+                'load_case_name': lc.get('name', f'LC{i}'),
+                'load_distribution': None,  # Spliced in from distribution_json
                 'failure_modes': {
                     'tension': results.get('tension'),
                     'shear': results.get('shear')
@@ -115,12 +183,18 @@ def run_analysis(input_json: str) -> str:
                 'interaction': results.get('interaction'),
                 'overall_status': results.get('overall_status', 'UNKNOWN'),
                 # Include original load case data for plotting
-                'Vx': lc.get('Vx', 0.0),
-                'Vy': lc.get('Vy', 0.0),
-                'Mx': lc.get('Mx', 0.0),
-                'My': lc.get('My', 0.0),
-                'Mz': lc.get('Mz', 0.0),
-                'N': lc.get('N', 0.0)
+                **dict(zip(_LOAD_KEYS, lc_actions))
+            }
+
+            # Keep only what _calculate_max_utilizations needs
+            load_case_json.append(
+                _dumps_spliced(load_case_result, {'load_distribution': distribution_json[i - 1]})
+            )
+            load_case_results.append({
+                'load_case_name': load_case_result['load_case_name'],
+                'failure_modes': load_case_result['failure_modes'],
+                'interaction': load_case_result['interaction'],
+                'overall_status': load_case_result['overall_status']
             })
 
         # Calculate maximum utilizations across all load cases
@@ -128,14 +202,15 @@ def run_analysis(input_json: str) -> str:
 
         # Format output
         output = _format_output_multi_case(
-            load_case_results,
+            load_case_json,
             max_utilizations,
             data,
             concrete,
-            design
+            design,
+            geometry
         )
 
-        return json.dumps(output, indent=2)
+        return _dumps_output(output)
 
     except Exception as e:
         # Return error in JSON format
@@ -144,7 +219,7 @@ def run_analysis(input_json: str) -> str:
             'error_message': str(e),
             'error_type': type(e).__name__
         }
-        return json.dumps(error_output, indent=2)
+        return _dumps(error_output)
 
 
 def _create_fastener_from_dict(data: Dict[str, Any]) -> Fastener:
@@ -157,13 +232,15 @@ def _create_fastener_from_dict(data: Dict[str, Any]) -> Fastener:
     Returns:
         Fastener object
     """
+    diameter, embedment_depth, steel_grade = _FASTENER_REQUIRED(data)
+
     # Handle area auto-calculation vs override
     area = data.get('area_override') or data.get('area')
 
     return Fastener(
-        diameter=data['diameter'],
-        embedment_depth=data['embedment_depth'],
-        steel_grade=data['steel_grade'],
+        diameter=diameter,
+        embedment_depth=embedment_depth,
+        steel_grade=steel_grade,
         area=area,
         fastener_type=data.get('fastener_type', 'headed'),
         d_head=data.get('d_head')
@@ -193,13 +270,15 @@ def _create_concrete_from_dict(data: Dict[str, Any]) -> ConcreteProperties:
     )
 
 
-def _create_fastener_group(fasteners: List[Fastener], data: Dict[str, Any]) -> FastenerGroup:
+def _create_fastener_group(fasteners: List[Fastener], data: Dict[str, Any],
+                           geometry: Dict) -> FastenerGroup:
     """
     Create FastenerGroup object from fasteners list and data
 
     Args:
         fasteners: List of Fastener objects
         data: Input data dictionary
+        geometry: Fastener geometry from _input_geometry
 
     Returns:
         FastenerGroup object
@@ -208,9 +287,8 @@ def _create_fastener_group(fasteners: List[Fastener], data: Dict[str, Any]) -> F
 
     # Auto-calculate spacings from positions if requested
     if spacings_data.get('auto_calculate', True):
-        # Calculate minimum spacing from positions
-        positions = [(f['x'], f['y']) for f in data['fasteners']]
-        min_sx, min_sy = _calculate_min_spacings(positions)
+        # Minimum spacing from positions
+        min_sx, min_sy = geometry['min_spacings']
         spacings = {'sx': min_sx, 'sy': min_sy}
     else:
         spacings = {
@@ -230,7 +308,7 @@ def _calculate_min_spacings(positions: List[tuple]) -> tuple:
     Calculate minimum spacings from fastener positions
 
     Args:
-        positions: List of (x, y) tuples
+        positions: (n, 2) array or list of (x, y) tuples
 
     Returns:
         (min_sx, min_sy) in mm
@@ -238,21 +316,87 @@ def _calculate_min_spacings(positions: List[tuple]) -> tuple:
     if len(positions) < 2:
         return (0.0, 0.0)
 
-    xs = [p[0] for p in positions]
-    ys = [p[1] for p in positions]
+    pos = np.asarray(positions, dtype=float)
+
+    # Sorted unique x and y coordinates
+    unique_xs = np.unique(pos[:, 0])
+    unique_ys = np.unique(pos[:, 1])
+
+    # Minimum spacing = smallest gap between neighbouring coordinates
+    min_sx = np.diff(unique_xs).min() if unique_xs.size > 1 else 0.0
+    min_sy = np.diff(unique_ys).min() if unique_ys.size > 1 else 0.0
+
+    return (float(min_sx), float(min_sy))
+
+
+def _fastener_geometry_arrays(fasteners_data: List[Dict]) -> tuple:
+    """
+    Extract fastener positions and gross areas as arrays
+
+    Args:
+        fasteners_data: List of fastener dictionaries with {x, y, diameter, ...}
+
+    Returns:
+        (positions, areas): (n, 2) array [mm] and (n,) array [mm²]
+    """
+    positions = np.array([(f['x'], f['y']) for f in fasteners_data], dtype=float).reshape(-1, 2)
+
+    # Gross cross-sectional area from the nominal diameter
+    d = np.array([f.get('diameter', f.get('d', 16)) for f in fasteners_data], dtype=float)
+    areas = 0.25 * np.pi * d * d
+
+    return positions, areas
+
+
+def _input_geometry(fasteners_data: List[Dict]) -> Dict:
+    """
+    Fastener geometry shared by the whole analysis, computed once per request
 
-    # Find unique x and y coordinates
-    unique_xs = sorted(set(xs))
-    unique_ys = sorted(set(ys))
+    Args:
+        fasteners_data: List of fastener dictionaries with {x, y, diameter, ...}
 
-    # Calculate minimum spacings
-    min_sx = min([unique_xs[i+1] - unique_xs[i] for i in range(len(unique_xs)-1)]) if len(unique_xs) > 1 else 0
-    min_sy = min([unique_ys[i+1] - unique_ys[i] for i in range(len(unique_ys)-1)]) if len(unique_ys) > 1 else 0
+    Returns:
+        Dictionary with:
+            - 'positions': (n, 2) array of fastener positions [mm]
+            - 'areas': (n,) array of gross areas [mm²]
+            - 'planar': Group geometry from planar_bending.calculate_group_geometry
+                        (area-weighted centroid and section sums; None if n = 0)
+            - 'centroid': (x, y) unweighted mean position for reporting [mm]
+            - 'min_spacings': (min_sx, min_sy) [mm]
+    """
+    positions, areas = _fastener_geometry_arrays(fasteners_data)
 
-    return (min_sx, min_sy)
+    # Reported centroid is the plain mean, summed in input order
+    n = len(positions)
+    xs, ys = positions.T.tolist()
+    centroid = (sum(xs) / n, sum(ys) / n) if n > 0 else (0, 0)
+
+    return {
+        'positions': positions,
+        'areas': areas,
+        'planar': planar_bending.calculate_group_geometry(positions, areas),
+        'centroid': centroid,
+        'min_spacings': _calculate_min_spacings(positions)
+    }
 
 
-def _calculate_load_distribution(fasteners_data: List[Dict], load_case: Dict) -> List[Dict]:
+def _load_case_actions(load_case: Dict) -> Tuple[float, ...]:
+    """
+    Read the applied actions of a load case once
+
+    Args:
+        load_case: Load case dictionary
+
+    Returns:
+        (Vx, Vy, Mx, My, Mz, N) in kN and kNm, 0.0 where not given
+    """
+    get = load_case.get
+    return tuple(get(key, 0.0) for key in _LOAD_KEYS)
+
+
+def _calculate_load_distribution(fasteners_data: List[Dict], load_case: Dict,
+                                 actions: Tuple[float, ...],
+                                 geometry: Optional[Dict]) -> List[Dict]:
     """
     Calculate load distribution to fasteners including planar bending
 
@@ -260,29 +404,19 @@ def _calculate_load_distribution(fasteners_data: List[Dict], load_case: Dict) ->
 
     Args:
         fasteners_data: List of fastener dictionaries with {x, y, d, ...}
-        load_case: Load case dictionary with Vx, Vy, Mx, My, Mz, N, application_point
+        load_case: Load case dictionary with application_type, application_point
+        actions: (Vx, Vy, Mx, My, Mz, N) from _load_case_actions
+        geometry: Group geometry from planar_bending.calculate_group_geometry
+                  (None if there are no fasteners)
 
     Returns:
         List of dictionaries with forces on each fastener
     """
-    # Extract positions and calculate areas
-    positions = [(f['x'], f['y']) for f in fasteners_data]
-    n = len(positions)
-
-    if n == 0:
+    if geometry is None:
         return []
 
-    # Calculate fastener areas (gross cross-sectional area)
-    import math as m
-    areas = [m.pi * (f.get('diameter', f.get('d', 16))/2)**2 for f in fasteners_data]
-
-    # Get loads
-    Vx = load_case.get('Vx', 0.0)  # kN
-    Vy = load_case.get('Vy', 0.0)  # kN
-    Mx = load_case.get('Mx', 0.0)  # kNm
-    My = load_case.get('My', 0.0)  # kNm
-    Mz = load_case.get('Mz', 0.0)  # kNm
-    N = load_case.get('N', 0.0)    # kN
+    # Get loads [kN, kNm]
+    Vx, Vy, Mx, My, Mz, N = actions
 
     # Get load application point
     if load_case.get('application_type') == 'point':
@@ -295,10 +429,9 @@ def _calculate_load_distribution(fasteners_data: List[Dict], load_case: Dict) ->
         load_point = None
         application_type = 'centroid'
 
-    # Use planar_bending module for complete load distribution
-    distribution_data = planar_bending.distribute_loads_with_bending(
-        positions=positions,
-        areas=areas,
+    # Use planar_bending module for complete load distribution (one array per component)
+    forces = planar_bending.distribute_loads_with_bending_precomputed(
+        geometry=geometry,
         N=N,
         Vx=Vx,
         Vy=Vy,
@@ -309,33 +442,48 @@ def _calculate_load_distribution(fasteners_data: List[Dict], load_case: Dict) ->
         application_type=application_type
     )
 
-    # Format for output (match expected structure)
-    distribution = []
-    for i, data in enumerate(distribution_data):
-        V_resultant = data['V_total']
-        N_total = data['N']
-        total_resultant = math.sqrt(V_resultant**2 + N_total**2)
-
-        distribution.append({
-            'fastener_id': fasteners_data[i]['id'],
-            'position': {'x': data['x'], 'y': data['y']},
+    # One (fasteners × fields) table: the force fields, the shear resultant
+    # and the resultant of shear and axial force
+    n_columns = len(_TABLE_SOURCES)
+    table = np.empty((len(forces['N']), n_columns + 1))
+    for j, key in enumerate(_TABLE_SOURCES):
+        table[:, j] = forces[key]
+    np.hypot(forces['V_total'], forces['N'], out=table[:, n_columns])
+
+    # Format for output (match expected structure): unpack each row straight
+    # into dict literals. Rounding stays with Python round() on the listed
+    # floats; np.round differs from it at some half-way values.
+
+    distribution = [
+        {
+            'fastener_id': fastener_id,
+            'position': {'x': x, 'y': y},
             'forces': {
-                'Vx_direct': round(data['Vx_direct'], 3),
-                'Vy_direct': round(data['Vy_direct'], 3),
-                'Vx_torsion': round(data['Vx_torsion'], 3),
-                'Vy_torsion': round(data['Vy_torsion'], 3),
-                'Vx_total': round(data['Vx'], 3),
-                'Vy_total': round(data['Vy'], 3),
-                'N': round(data['N'], 3),
-                'N_direct': round(data['N_direct'], 3),
-                'N_Mx': round(data['N_Mx'], 3),
-                'N_My': round(data['N_My'], 3)
+                'Vx_direct': round(Vx_direct, 3),
+                'Vy_direct': round(Vy_direct, 3),
+                'Vx_torsion': round(Vx_torsion, 3),
+                'Vy_torsion': round(Vy_torsion, 3),
+                'Vx_total': round(Vx_total, 3),
+                'Vy_total': round(Vy_total, 3),
+                'N': round(N_total, 3),
+                'N_direct': round(N_direct, 3),
+                'N_Mx': round(N_Mx, 3),
+                'N_My': round(N_My, 3)
             },
             'resultants': {
                 'V_resultant': round(V_resultant, 3),
                 'total_resultant': round(total_resultant, 3)
             }
-        })
+        }
+        for fastener_id, x, y, (
+            Vx_direct, Vy_direct, Vx_torsion, Vy_torsion, Vx_total, Vy_total,
+            N_total, N_direct, N_Mx, N_My, V_resultant, total_resultant
+        ) in zip(
+            (f['id'] for f in fasteners_data),
+            forces['x'].tolist(), forces['y'].tolist(),
+            table.tolist()
+        )
+    ]
 
     return distribution
 
@@ -361,70 +509,39 @@ def _calculate_max_utilizations(load_case_results: List[Dict],
         'overall_status': 'OK'
     }
 
-    # Track max utilization for each tension mode
-    for mode in tension_modes:
-        max_util = 0.0
-        max_NRd_kN = None
-        max_case = None
-
-        for lc_result in load_case_results:
-            tension_data = lc_result['failure_modes'].get('tension', {})
-            if tension_data and mode in tension_data:
-                util = tension_data[mode].get('utilization', 0.0)
-                if util > max_util:
-                    max_util = util
-                    max_NRd_kN = tension_data[mode].get('NRd_kN')
-                    max_case = lc_result['load_case_name']
-
-        if max_NRd_kN is not None:
-            max_utils['tension'][mode] = {
-                'utilization': max_util,
-                'NRd_kN': max_NRd_kN,
-                'governing_case': max_case,
-                'status': 'OK' if max_util <= 1.0 else 'FAIL'
-            }
-
-    # Track max utilization for each shear mode
-    for mode in shear_modes:
-        max_util = 0.0
-        max_VRd_kN = None
-        max_case = None
-
-        for lc_result in load_case_results:
-            shear_data = lc_result['failure_modes'].get('shear', {})
-            if shear_data and mode in shear_data:
-                util = shear_data[mode].get('utilization', 0.0)
-                if util > max_util:
-                    max_util = util
-                    max_VRd_kN = shear_data[mode].get('VRd_kN')
-                    max_case = lc_result['load_case_name']
-
-        if max_VRd_kN is not None:
-            max_utils['shear'][mode] = {
-                'utilization': max_util,
-                'VRd_kN': max_VRd_kN,
-                'governing_case': max_case,
-                'status': 'OK' if max_util <= 1.0 else 'FAIL'
-            }
+    if not load_case_results:
+        return max_utils
+
+    # Track max utilization for each tension and shear mode
+    for group, modes, resistance_key in (('tension', tension_modes, 'NRd_kN'),
+                                         ('shear', shear_modes, 'VRd_kN')):
+        group_results = [lc_result['failure_modes'].get(group) or {} for lc_result in load_case_results]
+        util, governing = _utilization_table(group_results, modes)
+
+        for j, mode in enumerate(modes):
+            i = governing[j]
+            max_util = float(util[i, j])
+            if max_util <= 0.0:
+                continue  # Mode not checked in any load case
+
+            resistance = group_results[i][mode].get(resistance_key)
+            if resistance is not None:
+                max_utils[group][mode] = {
+                    'utilization': max_util,
+                    resistance_key: resistance,
+                    'governing_case': load_case_results[i]['load_case_name'],
+                    'status': 'OK' if max_util <= 1.0 else 'FAIL'
+                }
 
     # Track max interaction
-    max_interaction = 0.0
-    max_interaction_case = None
-    max_interaction_data = None
+    interactions = [lc_result.get('interaction') or {} for lc_result in load_case_results]
+    ratio, governing = _utilization_table(interactions, None, 'interaction_ratio')
 
-    for lc_result in load_case_results:
-        interaction = lc_result.get('interaction')
-        if interaction:
-            ratio = interaction.get('interaction_ratio', 0.0)
-            if ratio > max_interaction:
-                max_interaction = ratio
-                max_interaction_case = lc_result['load_case_name']
-                max_interaction_data = interaction
-
-    if max_interaction_data:
+    if ratio[governing[0], 0] > 0.0:
+        i = governing[0]
         max_utils['interaction'] = {
-            **max_interaction_data,
-            'governing_case': max_interaction_case
+            **interactions[i],
+            'governing_case': load_case_results[i]['load_case_name']
         }
 
     # Overall status
@@ -439,34 +556,66 @@ def _calculate_max_utilizations(load_case_results: List[Dict],
     return max_utils
 
 
+def _utilization_table(results: List[Dict], modes: Optional[List[str]],
+                       key: str = 'utilization') -> tuple:
+    """
+    Tabulate utilizations as a (load cases × modes) array and find the maxima
+
+    Args:
+        results: Per-load-case result dicts (at least one) - {mode: {key: value}},
+                 or the value dicts themselves when modes is None
+        modes: Mode names (columns), or None for a single column read
+               directly from each result dict
+        key: Value to tabulate
+
+    Returns:
+        (table, governing): table of values, with 0.0 where a mode was not
+        checked, and the row index of the first maximum in each column
+    """
+    n_cols = 1 if modes is None else len(modes)
+    table = np.zeros((len(results), n_cols))
+
+    for i, result in enumerate(results):
+        if modes is None:
+            values = (result.get(key, 0.0),)
+        else:
+            values = (result[mode].get(key, 0.0) if mode in result else 0.0 for mode in modes)
+        for j, value in enumerate(values):
+            if value > 0.0:
+                table[i, j] = value
+
+    # argmax returns the first maximum, matching a strict '>' running scan
+    return table, table.argmax(axis=0)
+
+
 def _format_output_multi_case(load_case_results: List[Dict],
                                max_utilizations: Dict,
                                input_data: Dict,
                                concrete: ConcreteProperties,
-                               design: FastenerDesign) -> Dict:
+                               design: FastenerDesign,
+                               geometry: Dict) -> Dict:
     """
     Format multi-load case results into output JSON schema
 
     Args:
-        load_case_results: List of results for each load case
+        load_case_results: Results for each load case, as JSON strings
+                           (spliced in by _dumps_output)
         max_utilizations: Max utilizations across all cases
         input_data: Original input data
         concrete: ConcreteProperties object
         design: FastenerDesign object
+        geometry: Fastener geometry from _input_geometry
 
     Returns:
         Dictionary matching output schema
     """
-    # Calculate centroid
-    n = len(input_data['fasteners'])
-    centroid_x = sum(f['x'] for f in input_data['fasteners']) / n if n > 0 else 0
-    centroid_y = sum(f['y'] for f in input_data['fasteners']) / n if n > 0 else 0
+    centroid_x, centroid_y = geometry['centroid']
 
     output = {
         'status': 'success',
         'error_message': None,
         'input_summary': {
-            'n_fasteners': n,
+            'n_fasteners': len(input_data['fasteners']),
             'centroid': {'x': round(centroid_x, 2), 'y': round(centroid_y, 2)},
             'concrete_k_factor': round(concrete.get_k_factor(), 2),
             'gamma_Ms': design.gamma_Ms,
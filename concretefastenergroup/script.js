@@ -132,6 +132,7 @@ files_to_fetch = [
     'failure_modes/tension/pullout.py',
     'failure_modes/tension/splitting.py',
     'failure_modes/tension/blowout.py',
+    'failure_modes/tension/grid.py',
     'failure_modes/shear/__init__.py',
     'failure_modes/shear/steel_failure.py',
     'failure_modes/shear/concrete_edge.py',
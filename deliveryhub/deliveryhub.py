@@ -3,53 +3,233 @@ from tkinter import filedialog, messagebox, scrolledtext, simpledialog
 import pyperclip
 import json
 import os
+import time
 import webbrowser
-from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import orjson  # Optional: faster JSON load/save, falls back to json
+except ImportError:
+    orjson = None
 
 LAST_SESSION_FILE = "C:/ProgramData/collections/last_session.json"
+EXISTS_CACHE_TTL = 2.0  # seconds an os.path.exists result is reused
+
+
+def _json_dumps(obj, indent=None):
+    """Encode obj as UTF-8 JSON bytes, compact or with indent=2; both backends write the same bytes"""
+    if indent not in (None, 2):
+        raise ValueError(f"indent must be None or 2, got {indent!r}")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # ensure_ascii=False matches orjson, which writes non-ASCII as raw UTF-8
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data):
+    """Decode JSON from bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrderedFiles:
+    """Files of one category: display order as a list of names, paths by name"""
+    
+    def __init__(self, items=()):
+        self.names = []
+        self.paths = {}
+        for filename, filepath in items:
+            self[filename] = filepath
+    
+    def __contains__(self, filename):
+        return filename in self.paths
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __iter__(self):
+        return iter(self.names)
+    
+    def __getitem__(self, filename):
+        return self.paths[filename]
+    
+    def __setitem__(self, filename, filepath):
+        if filename not in self.paths:
+            self.names.append(filename)
+        self.paths[filename] = filepath
+    
+    def __delitem__(self, filename):
+        del self.paths[filename]
+        self.names.remove(filename)
+    
+    def prune(self):
+        """Drop names whose paths were deleted directly, in one pass over the order list"""
+        paths = self.paths
+        self.names[:] = [name for name in self.names if name in paths]
+    
+    def items(self):
+        """(filename, filepath) pairs in display order"""
+        paths = self.paths
+        return [(name, paths[name]) for name in self.names]
+    
+    def values(self):
+        """File paths in display order"""
+        paths = self.paths
+        return [paths[name] for name in self.names]
+
 
 class CollectionManager:
     """Handles all file collection logic and data management"""
     
+    _session_dir_ensured = False  # LAST_SESSION_FILE directory created in this process
+    
     def __init__(self):
-        self.collections = {"Calculations": OrderedDict(), "Documents": OrderedDict()}
+        self.collections = {"Calculations": OrderedFiles(), "Documents": OrderedFiles()}
         self.current_file = None
+        self._index = {}  # filename -> category holding it (first in category order)
+        self._exists_cache = {}  # path -> (checked at, exists)
+        self._dirty = False  # Changed since last save/load
+        self._saved_file = None  # File matching the in-memory collection, if any
+        self._saved_indent = None  # indent _saved_file was written with (None for loaded files)
+        self._last_persisted_path = None  # Path last written to LAST_SESSION_FILE
+        self._suspend_refresh = 0  # Nesting depth of batch_update blocks
     
     def new_collection(self):
         """Create a new empty collection"""
-        self.collections = {"calculations": OrderedDict(), "documents": OrderedDict()}
+        self.collections = {"calculations": OrderedFiles(), "documents": OrderedFiles()}
         self.current_file = None
+        self._index = {}
+        self._exists_cache = {}
+        self._dirty = False
+        self._saved_file = None
+        self._saved_indent = None
+    
+    @contextmanager
+    def batch_update(self):
+        """Group several changes; list refreshes requested inside are coalesced into one"""
+        self._suspend_refresh += 1
+        try:
+            yield
+        finally:
+            self._suspend_refresh -= 1
+    
+    @property
+    def refresh_suspended(self):
+        """True inside a batch_update block"""
+        return self._suspend_refresh > 0
+    
+    def _mark_changed(self):
+        """Record that files were added or removed"""
+        self._dirty = True
+        self._exists_cache.clear()
+    
+    def _rebuild_index(self):
+        """Rebuild the filename -> category index from the collections"""
+        self._index = {}
+        for category, files in self.collections.items():
+            for filename in files:
+                self._index.setdefault(filename, category)
+    
+    def _find_category(self, filename):
+        """Scan the categories in order for a filename (for names in several categories)"""
+        for category in self.collections:
+            if filename in self.collections[category]:
+                return category
+        return None
     
     def add_file(self, category, filepath):
         """Add a file to the specified category. Returns True if added, False if already exists"""
         filename = os.path.basename(filepath)
         if filename not in self.collections[category]:
             self.collections[category][filename] = filepath
+            if self._index.setdefault(filename, category) != category:
+                # Same name in another category: keep the first one in category order
+                self._index[filename] = self._find_category(filename)
+            self._mark_changed()
             return True
         return False
     
     def add_files(self, category, filepaths):
         """Add multiple files to a category. Returns count of files actually added"""
+        files = self.collections[category]
+        index = self._index
         added_count = 0
+        # Same steps as add_file, inlined for the bulk case
         for filepath in filepaths:
-            if self.add_file(category, filepath):
+            filename = os.path.basename(filepath)
+            if filename not in files:
+                files[filename] = filepath
+                if index.setdefault(filename, category) != category:
+                    index[filename] = self._find_category(filename)
                 added_count += 1
+        if added_count:
+            self._mark_changed()
         return added_count
     
     def remove_file(self, filename):
         """Remove a file by filename from all categories. Returns True if found and removed"""
-        for category in self.collections:
-            if filename in self.collections[category]:
-                del self.collections[category][filename]
-                return True
-        return False
+        category = self._index.pop(filename, None)
+        if category is None:
+            return False
+        del self.collections[category][filename]
+        self._mark_changed()
+        
+        # The same name may still be held by a later category
+        remaining = self._find_category(filename)
+        if remaining:
+            self._index[filename] = remaining
+        return True
     
     def remove_files(self, filenames):
         """Remove multiple files. Returns count of files actually removed"""
         removed_count = 0
+        touched = set()
         for filename in filenames:
-            if self.remove_file(filename):
-                removed_count += 1
+            category = self._index.pop(filename, None)
+            if category is None:
+                continue
+            del self.collections[category].paths[filename]
+            touched.add(category)
+            
+            remaining = self._find_category(filename)
+            if remaining:
+                self._index[filename] = remaining
+            removed_count += 1
+        
+        # Compact each affected order list once instead of one list.remove per file
+        for category in touched:
+            self.collections[category].prune()
+        if removed_count:
+            self._mark_changed()
+        return removed_count
+    
+    def remove_by_pairs(self, pairs):
+        """Remove files given as (filename, category) pairs. Returns count of files actually removed"""
+        removed_count = 0
+        touched = set()
+        for filename, category in pairs:
+            files = self.collections[category]
+            if filename not in files:
+                continue
+            del files.paths[filename]
+            touched.add(category)
+            
+            # Re-point the index only if it referred to the removed entry
+            if self._index.get(filename) == category:
+                remaining = self._find_category(filename)
+                if remaining:
+                    self._index[filename] = remaining
+                else:
+                    del self._index[filename]
+            removed_count += 1
+        
+        for category in touched:
+            self.collections[category].prune()
+        if removed_count:
+            self._mark_changed()
         return removed_count
     
     def get_all_paths(self):
@@ -59,12 +239,19 @@ class CollectionManager:
             paths.extend(self.collections[category].values())
         return paths
     
+    def path_exists(self, path):
+        """os.path.exists, reusing a result for EXISTS_CACHE_TTL seconds (cleared on any add/remove/load)"""
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached and now - cached[0] < EXISTS_CACHE_TTL:
+            return cached[1]
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (now, exists)
+        return exists
+    
     def get_file_category(self, filename):
         """Find which category a filename belongs to"""
-        for category in self.collections:
-            if filename in self.collections[category]:
-                return category
-        return None
+        return self._index.get(filename)
     
     def move_file_up(self, filename):
         """Move a file up in its category order. Returns True if moved"""
@@ -72,22 +259,15 @@ class CollectionManager:
         if not category:
             return False
             
-        files_list = list(self.collections[category].items())
-        current_pos = None
-        
-        for i, (fname, fpath) in enumerate(files_list):
-            if fname == filename:
-                current_pos = i
-                break
+        names = self.collections[category].names
+        current_pos = names.index(filename)
                 
-        if current_pos is None or current_pos == 0:
+        if current_pos == 0:
             return False
             
-        # Swap with previous item
-        files_list[current_pos], files_list[current_pos - 1] = files_list[current_pos - 1], files_list[current_pos]
-        
-        # Rebuild the OrderedDict
-        self.collections[category] = OrderedDict(files_list)
+        # Swap with previous item (only the order list changes)
+        names[current_pos], names[current_pos - 1] = names[current_pos - 1], names[current_pos]
+        self._dirty = True
         return True
     
     def move_file_down(self, filename):
@@ -96,59 +276,75 @@ class CollectionManager:
         if not category:
             return False
             
-        files_list = list(self.collections[category].items())
-        current_pos = None
-        
-        for i, (fname, fpath) in enumerate(files_list):
-            if fname == filename:
-                current_pos = i
-                break
+        names = self.collections[category].names
+        current_pos = names.index(filename)
                 
-        if current_pos is None or current_pos == len(files_list) - 1:
+        if current_pos == len(names) - 1:
             return False
             
-        # Swap with next item
-        files_list[current_pos], files_list[current_pos + 1] = files_list[current_pos + 1], files_list[current_pos]
-        
-        # Rebuild the OrderedDict
-        self.collections[category] = OrderedDict(files_list)
+        # Swap with next item (only the order list changes)
+        names[current_pos], names[current_pos + 1] = names[current_pos + 1], names[current_pos]
+        self._dirty = True
         return True
     
-    def save(self, filepath=None):
-        """Save collection to file. Uses current_file if filepath not provided"""
+    def save(self, filepath=None, indent=None):
+        """Save collection to file. Uses current_file if filepath not provided. Compact JSON unless indent=2"""
         if filepath:
             self.current_file = filepath
         
         if not self.current_file:
             raise ValueError("No file path specified for saving")
+        
+        # Nothing changed since this file was saved or loaded in the same format: skip the rewrite
+        if (not self._dirty and self.current_file == self._saved_file
+                and indent == self._saved_indent and os.path.exists(self.current_file)):
+            return
             
-        # Convert OrderedDict to regular dict for JSON serialization
+        # Convert OrderedFiles to regular dict (in display order) for JSON serialization
         data_to_save = {}
         for category, files in self.collections.items():
-            data_to_save[category] = dict(files)
+            data_to_save[category] = dict(files.items())
             
-        with open(self.current_file, "w") as f:
-            json.dump(data_to_save, f, indent=4)
+        # Serialize first, then write the whole document at once
+        payload = _json_dumps(data_to_save, indent)
+        with open(self.current_file, "wb") as f:
+            f.write(payload)
+        self._dirty = False
+        self._saved_file = self.current_file
+        self._saved_indent = indent
     
     def load(self, filepath):
         """Load collection from file"""
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = _json_loads(f.read())
             self.collections = {
-                "calculations": OrderedDict(data.get("calculations", {})),
-                "documents": OrderedDict(data.get("documents", {}))
+                "calculations": OrderedFiles(data.get("calculations", {}).items()),
+                "documents": OrderedFiles(data.get("documents", {}).items())
             }
+        self._rebuild_index()
+        self._exists_cache.clear()
+        self._dirty = False
+        self._saved_file = filepath
+        self._saved_indent = None
         self.current_file = filepath
     
     def save_last_session_path(self):
-        """Save the current file path as the last session"""
-        if not self.current_file:
+        """Save the current file path as the last session (skipped if already stored)"""
+        if not self.current_file or self.current_file == self._last_persisted_path:
             return
             
         try:
-            os.makedirs(os.path.dirname(LAST_SESSION_FILE), exist_ok=True)
-            with open(LAST_SESSION_FILE, "w") as f:
-                json.dump({"last_collection_path": self.current_file}, f)
+            if not CollectionManager._session_dir_ensured:
+                os.makedirs(os.path.dirname(LAST_SESSION_FILE), exist_ok=True)
+                CollectionManager._session_dir_ensured = True
+            
+            # Write a temp file and swap it in, so an interrupted write never
+            # leaves a truncated session file behind
+            tmp_file = LAST_SESSION_FILE + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(_json_dumps({"last_collection_path": self.current_file}))
+            os.replace(tmp_file, LAST_SESSION_FILE)
+            self._last_persisted_path = self.current_file
         except Exception:
             pass  # Fail silently
     
@@ -158,11 +354,12 @@ class CollectionManager:
             return False
             
         try:
-            with open(LAST_SESSION_FILE, "r") as f:
-                data = json.load(f)
+            with open(LAST_SESSION_FILE, "rb") as f:
+                data = _json_loads(f.read())
                 last_path = data.get("last_collection_path", "")
                 if last_path and os.path.exists(last_path):
                     self.load(last_path)
+                    self._last_persisted_path = last_path
                     return True
         except Exception:
             pass  # Fail silently
@@ -178,6 +375,7 @@ class FileSelectorApp:
         
         self.manager = CollectionManager()
         self.category_var = tk.StringVar(value="calculations")
+        self._refresh_pending = False  # Deferred list refresh scheduled
 
         self.create_menu()
         self.create_widgets()
@@ -280,19 +478,9 @@ class FileSelectorApp:
         self.root.rowconfigure(1, weight=1)  # Main content area expands
         self.root.columnconfigure(0, weight=1)  # Full width expansion
 
-    def get_file_from_listbox_entry(self, entry):
-        """Extract filename and category from a listbox entry"""
-        entry = entry.strip()
-        
-        # Skip headers and empty lines
-        if entry.startswith("---") or entry == "" or not entry:
-            return None, None
-            
-        if ": " in entry:
-            filename = entry.split(": ")[0].strip()
-            category = self.manager.get_file_category(filename)
-            return filename, category
-        return None, None
+    def get_file_from_listbox_row(self, idx):
+        """Filename and category shown in a listbox row ((None, None) for headers and empty lines)"""
+        return self._row_meta[idx]
 
     def move_up(self):
         selected_indices = self.doc_listbox.curselection()
@@ -301,8 +489,7 @@ class FileSelectorApp:
             return
             
         idx = selected_indices[0]
-        entry = self.doc_listbox.get(idx)
-        filename, category = self.get_file_from_listbox_entry(entry)
+        filename, category = self.get_file_from_listbox_row(idx)
         
         if not filename or not category:
             messagebox.showinfo("Invalid selection", "Please select a valid document (not a category header).")
@@ -321,8 +508,7 @@ class FileSelectorApp:
             return
             
         idx = selected_indices[0]
-        entry = self.doc_listbox.get(idx)
-        filename, category = self.get_file_from_listbox_entry(entry)
+        filename, category = self.get_file_from_listbox_row(idx)
         
         if not filename or not category:
             messagebox.showinfo("Invalid selection", "Please select a valid document (not a category header).")
@@ -336,12 +522,10 @@ class FileSelectorApp:
 
     def select_file_in_list(self, filename, category):
         """Select a specific file in the listbox after updating"""
-        for i in range(self.doc_listbox.size()):
-            entry = self.doc_listbox.get(i)
-            if entry.startswith(filename + ": "):
-                self.doc_listbox.selection_set(i)
-                self.doc_listbox.see(i)
-                break
+        i = self._name_to_row.get((category, filename))
+        if i is not None:
+            self.doc_listbox.selection_set(i)
+            self.doc_listbox.see(i)
 
     def select_files(self):
         selected_files = filedialog.askopenfilenames(title="Select Files")
@@ -349,21 +533,52 @@ class FileSelectorApp:
             return
 
         category = self.category_var.get()
-        added_count = self.manager.add_files(category, selected_files)
+        with self.manager.batch_update():
+            added_count = self.manager.add_files(category, selected_files)
+            if added_count > 0:
+                self.update_document_list()
 
         if added_count > 0:
-            self.update_document_list()
             messagebox.showinfo("Added", f"{added_count} file(s) added to '{category}' category.")
         else:
             messagebox.showinfo("No new files", "Selected files are already in the collection.")
 
     def update_document_list(self):
-        self.doc_listbox.delete(0, tk.END)
-        for category, files in self.manager.collections.items():
-            self.doc_listbox.insert(tk.END, f"--- {category.upper()} ---")
+        if self.manager.refresh_suspended:
+            # Inside a batch: schedule one refresh for when Tk is idle
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.root.after_idle(self._deferred_refresh)
+            return
+        
+        # Side tables so rows never need to be read back and parsed:
+        # row index -> (filename, category), (None, None) for headers and empty lines,
+        # and (category, filename) -> row index
+        # Sized up front: a header, the files and an empty line per category
+        collections = self.manager.collections
+        n_rows = sum(len(files) + 2 for files in collections.values())
+        rows = [""] * n_rows
+        row_meta = [(None, None)] * n_rows
+        self._name_to_row = {}
+        i = 0
+        for category, files in collections.items():
+            rows[i] = f"--- {category.upper()} ---"
+            i += 1
             for fname, fpath in files.items():
-                self.doc_listbox.insert(tk.END, f"{fname}: {fpath}")
-            self.doc_listbox.insert(tk.END, "")  # empty line between categories
+                self._name_to_row[(category, fname)] = i
+                row_meta[i] = (fname, category)
+                rows[i] = f"{fname}: {fpath}"
+                i += 1
+            i += 1  # empty line between categories
+        self._row_meta = row_meta
+        
+        # All rows go to Tk in a single insert call
+        self.doc_listbox.delete(0, tk.END)
+        self.doc_listbox.insert(tk.END, *rows)
+
+    def _deferred_refresh(self):
+        self._refresh_pending = False
+        self.update_document_list()
 
     def copy_to_clipboard(self):
         paths = self.manager.get_all_paths()
@@ -382,21 +597,17 @@ class FileSelectorApp:
         opened_any = False
 
         for idx in selected_indices:
-            entry = self.doc_listbox.get(idx).strip()
+            filename, category = self._row_meta[idx]
 
             # Skip headers and empty lines
-            if entry.startswith("---") or entry == "(No files)" or not entry:
+            if not filename:
                 continue
 
             try:
-                # Split after the first ": " only
-                if ": " in entry:
-                    parts = entry.split(": ", 1)  # Only split once
-                    if len(parts) == 2:
-                        path = parts[1].strip()
-                        if os.path.exists(path):
-                            webbrowser.open(path)
-                            opened_any = True
+                path = self.manager.collections[category][filename]
+                if self.manager.path_exists(path):
+                    webbrowser.open(path)
+                    opened_any = True
             except Exception:
                 continue
 
@@ -409,14 +620,10 @@ class FileSelectorApp:
             messagebox.showinfo("None selected", "Please select at least one document to remove.")
             return
 
-        filenames_to_remove = []
-        for idx in selected_indices:
-            entry = self.doc_listbox.get(idx)
-            if ":" in entry:
-                filename = entry.split(":")[0].strip()
-                filenames_to_remove.append(filename)
+        # (filename, category) of each selected file row, skipping headers and empty lines
+        files_to_remove = [self._row_meta[idx] for idx in selected_indices if self._row_meta[idx][0]]
 
-        removed_count = self.manager.remove_files(filenames_to_remove)
+        removed_count = self.manager.remove_by_pairs(files_to_remove)
         
         if removed_count > 0:
             self.update_document_list()
@@ -10,8 +10,7 @@ def select_files():
 
 def list_pdfs(files):
     file_listbox.delete(0, tk.END)
-    for file in files:
-        file_listbox.insert(tk.END, os.path.basename(file))
+    file_listbox.insert(tk.END, *[os.path.basename(file) for file in files])  # One Tk call for all rows
     file_listbox.select_set(0, tk.END)  # Automatically select all files
 
 def split_filename():
@@ -22,21 +21,23 @@ def split_filename():
         messagebox.showwarning("No file selected", "Please select at least one file.")
         return
 
-    result_text = ""
-    for i in selected_files:
-        filename = file_listbox.get(i)
-        if exclude_extension:
-            filename = filename.rsplit(".pdf", 1)[0]  # Remove .pdf extension
+    all_names = file_listbox.get(0, tk.END)  # One Tk call for every row
+    lines = [None] * len(selected_files)
+    for j, i in enumerate(selected_files):
+        filename = all_names[i]
+        if exclude_extension and filename.endswith(".pdf"):
+            filename = filename[:-4]  # Remove .pdf extension
         
         if split_str and split_str in filename:
             parts = filename.split(split_str, 1)
-            result_text += f"{parts[0]}\t{parts[1]}\n"
+            lines[j] = f"{parts[0]}\t{parts[1]}"
         else:
-            result_text += f"{filename}\n"
+            lines[j] = filename
+    result_text = "\n".join(lines).strip()
     
-    pyperclip.copy(result_text.strip())
+    pyperclip.copy(result_text)
     result_textbox.delete(1.0, tk.END)
-    result_textbox.insert(tk.END, result_text.strip())
+    result_textbox.insert(tk.END, result_text)
     messagebox.showinfo("Copied", "The split filenames have been copied to the clipboard.")
 
 # UI setup
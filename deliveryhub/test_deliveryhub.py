@@ -0,0 +1,77 @@
+"""
+Tests for CollectionManager saving and loading
+
+Run from this directory: python -m pytest test_deliveryhub.py
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("pyperclip")
+
+from deliveryhub import CollectionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Collection with one file per category, saved once (compact) to tmp_path"""
+    m = CollectionManager()
+    m.new_collection()
+    m.add_file("calculations", str(tmp_path / "calc.pdf"))
+    m.add_file("documents", str(tmp_path / "doc.pdf"))
+    m.save(str(tmp_path / "collection.json"))
+    return m
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_clean_save_is_skipped(manager):
+    """An unchanged collection is not rewritten"""
+    path = manager.current_file
+    os.utime(path, (0, 0))
+
+    manager.save()
+
+    assert os.stat(path).st_mtime == 0
+
+
+def test_dirty_save_rewrites(manager, tmp_path):
+    """A change since the last save is written out"""
+    manager.add_file("documents", str(tmp_path / "new.pdf"))
+
+    manager.save()
+
+    reloaded = CollectionManager()
+    reloaded.load(manager.current_file)
+    assert "new.pdf" in reloaded.collections["documents"]
+
+
+def test_save_with_new_indent_rewrites(manager):
+    """An unchanged collection is rewritten when a different format is requested"""
+    compact = _read(manager.current_file)
+
+    manager.save(indent=2)
+    pretty = _read(manager.current_file)
+
+    assert pretty != compact
+    assert pretty.startswith(b'{\n  "calculations"')
+
+    # Same format again: skipped
+    os.utime(manager.current_file, (0, 0))
+    manager.save(indent=2)
+    assert os.stat(manager.current_file).st_mtime == 0
+
+
+def test_deleted_file_is_rewritten(manager):
+    """A clean collection whose file has disappeared is saved again"""
+    os.remove(manager.current_file)
+
+    manager.save()
+
+    assert os.path.exists(manager.current_file)
+
@@ -17,8 +17,8 @@ def calculate_centroid(positions: List[Tuple[float, float]],
     Calculate centroid of fastener group
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates or (n, 2) array [mm]
+        areas: List or array of fastener areas [mm²]
 
     Returns:
         (xc, yc): Centroid coordinates [mm]
@@ -27,12 +27,11 @@ def calculate_centroid(positions: List[Tuple[float, float]],
         xc = Σ(Ai × xi) / ΣAi
         yc = Σ(Ai × yi) / ΣAi
     """
-    if not positions or not areas:
+    positions = np.asarray(positions, dtype=float)
+    areas = np.asarray(areas, dtype=float)
+    if positions.size == 0 or areas.size == 0:
         return (0.0, 0.0)
 
-    positions = np.array(positions)
-    areas = np.array(areas)
-
     total_area = np.sum(areas)
     if total_area == 0:
         return (0.0, 0.0)
@@ -52,8 +51,8 @@ def calculate_section_properties(
     Calculate section properties (moments of inertia) for fastener group
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates or (n, 2) array [mm]
+        areas: List or array of fastener areas [mm²]
         centroid: (xc, yc) centroid position [mm]
 
     Returns:
@@ -75,11 +74,10 @@ def calculate_section_properties(
         - Positive Mx causes tension on +y side (top)
         - Positive My causes tension on +x side (right)
     """
-    if not positions or not areas:
+    positions = np.asarray(positions, dtype=float)
+    areas = np.asarray(areas, dtype=float)
+    if positions.size == 0 or areas.size == 0:
         return {'Ix': 0.0, 'Iy': 0.0, 'Ixy': 0.0, 'J': 0.0}
-
-    positions = np.array(positions)
-    areas = np.array(areas)
     xc, yc = centroid
 
     # Distances from centroid
@@ -112,8 +110,8 @@ def calculate_bending_forces(
     Calculate axial forces in fasteners due to bending moments Mx and My
 
     Args:
-        positions: List of (x, y) coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) coordinates or (n, 2) array [mm]
+        areas: List or array of fastener areas [mm²]
         Mx: Bending moment about x-axis [kNm]
         My: Bending moment about y-axis [kNm]
         centroid: (xc, yc) centroid position [mm]
@@ -139,15 +137,14 @@ def calculate_bending_forces(
         - Positive force: Tension (↑)
         - Negative force: Compression (↓)
     """
-    if not positions or not areas:
+    positions = np.asarray(positions, dtype=float)
+    areas = np.asarray(areas, dtype=float)
+    if positions.size == 0 or areas.size == 0:
         return []
 
     n = len(positions)
     if Mx == 0 and My == 0:
         return [0.0] * n
-
-    positions = np.array(positions)
-    areas = np.array(areas)
     xc, yc = centroid
 
     # Distances from centroid
@@ -165,36 +162,29 @@ def calculate_bending_forces(
         # Degenerate case (all fasteners on a line)
         return [0.0] * n
 
-    # Construct inertia matrix and its inverse
+    # Inertia matrix
     I_matrix = np.array([[Ix, Ixy],
                          [Ixy, Iy]])
 
-    I_inv = np.linalg.inv(I_matrix)
-
     # Convert moments to N·mm for calculation
     Mx_Nmm = Mx * 1e6  # kNm → Nmm
     My_Nmm = My * 1e6  # kNm → Nmm
 
     M = np.array([Mx_Nmm, My_Nmm])
 
-    # Calculate stress (N/mm²) and force (N) at each fastener
-    forces = []
-    for i in range(n):
-        # IMPORTANT: Mx creates stress prop to y, My creates stress prop to x
-        # Position vector is [y, x] NOT [x, y]!
-        pos_vec = np.array([y[i], x[i]])
-
-        # Stress at this position: σ = [y, x] @ I_inv @ [Mx, My]
-        # This gives: σ = y*(I_inv[0,0]*Mx + I_inv[0,1]*My) + x*(I_inv[1,0]*Mx + I_inv[1,1]*My)
-        stress = pos_vec @ I_inv @ M  # N/mm²
+    # I_inv @ M by solving I @ v = M (one factorization, no explicit inverse)
+    IinvM = np.linalg.solve(I_matrix, M)
 
-        # Force = stress × area
-        force_N = stress * areas[i]  # N
-        force_kN = force_N / 1000.0  # kN
+    # IMPORTANT: Mx creates stress prop to y, My creates stress prop to x
+    # Position vector is [y, x] NOT [x, y]!
+    # Stress at each position: σ = [y, x] @ I_inv @ [Mx, My]
+    # This gives: σ = y*(I_inv[0,0]*Mx + I_inv[0,1]*My) + x*(I_inv[1,0]*Mx + I_inv[1,1]*My)
+    stresses = np.column_stack((y, x)) @ IinvM  # N/mm²
 
-        forces.append(float(force_kN))
+    # Force = stress × area [N → kN]
+    forces_kN = stresses * areas / 1000.0
 
-    return forces
+    return forces_kN.tolist()
 
 
 def calculate_eccentricity_moments(
@@ -271,8 +261,8 @@ def distribute_loads_with_bending(
     Complete load distribution including bending moments Mx, My
 
     Args:
-        positions: List of (x, y) fastener coordinates [mm]
-        areas: List of fastener areas [mm²]
+        positions: List of (x, y) fastener coordinates or (n, 2) array [mm]
+        areas: List or array of fastener areas [mm²]
         N: Axial force (tension +) [kN]
         Vx: Shear force in x-direction [kN]
         Vy: Shear force in y-direction [kN]
@@ -301,7 +291,10 @@ def distribute_loads_with_bending(
                 'V_total': float (resultant shear),
             }
     """
-    if not positions or not areas:
+    # Convert once; the helpers below then work on the same arrays
+    positions = np.asarray(positions, dtype=float)
+    areas = np.asarray(areas, dtype=float)
+    if positions.size == 0 or areas.size == 0:
         return []
 
     n = len(positions)
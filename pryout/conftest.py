@@ -0,0 +1,42 @@
+"""
+Shared pytest fixtures for the pryout test scripts
+
+The test_*.py scripts in this directory also run standalone
+(python test_planar_bending.py, from this directory). Under pytest,
+codes/python is put on sys.path once here, whatever the working directory.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'codes', 'python'))
+
+from fastener_design.calculations import planar_bending
+
+
+def square_pattern_data():
+    """
+    Four 100 mm² fasteners on a ±50 mm square, centred on the origin
+
+    Returns:
+        (positions (4, 2) array [mm], areas (4,) array [mm²],
+         centroid (xc, yc) [mm], section properties dict [mm⁴])
+    """
+    positions = np.array([(50, 50), (-50, 50), (-50, -50), (50, -50)], dtype=np.float64)
+    areas = np.full(4, 100.0)
+    centroid = planar_bending.calculate_centroid(positions, areas)
+    section_props = planar_bending.calculate_section_properties(positions, areas, centroid)
+    return positions, areas, centroid, section_props
+
+
+@pytest.fixture(scope='session')
+def square_pattern():
+    """
+    Square-pattern geometry with its section properties, built once per session
+
+    Shared between tests; callers must not mutate the arrays or the dict.
+    """
+    return square_pattern_data()
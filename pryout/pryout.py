@@ -7,6 +7,8 @@
 import math
 from typing import List, Tuple
 
+import numpy as np
+
 
 # ------------------------------------------------------------
 # Stud definition
@@ -15,12 +17,34 @@ class Stud:
     def __init__(self, x: float, y: float):
         """
         Stud coordinates relative to group centroid [mm]
+
+        Forces are stored by the StudGroup the stud belongs to; Vx, Vy and
+        Vres read this stud's entry and are 0.0 until actions are applied.
         """
         self.x = x
         self.y = y
-        self.Vx = 0.0  # kN
-        self.Vy = 0.0  # kN
-        self.Vres = 0.0  # kN
+        self._group = None
+        self._index = None
+
+    def _force(self, name: str) -> float:
+        if self._group is None:
+            return 0.0
+        return float(getattr(self._group, name)[self._index])
+
+    @property
+    def Vx(self) -> float:
+        """Shear force in x [kN]"""
+        return self._force("Vx")
+
+    @property
+    def Vy(self) -> float:
+        """Shear force in y [kN]"""
+        return self._force("Vy")
+
+    @property
+    def Vres(self) -> float:
+        """Resultant shear force [kN]"""
+        return self._force("Vres")
 
 
 # ------------------------------------------------------------
@@ -31,11 +55,27 @@ class StudGroup:
         self.studs = studs
         self.n = len(studs)
 
+        # Stud coordinates as arrays, so the force distribution is a few
+        # whole-array operations instead of per-stud attribute updates
+        self.x = np.fromiter((stud.x for stud in studs), dtype=np.float64, count=self.n)
+        self.y = np.fromiter((stud.y for stud in studs), dtype=np.float64, count=self.n)
+
+        # Stud forces [kN], one entry per stud
+        self.Vx = np.zeros(self.n)
+        self.Vy = np.zeros(self.n)
+        self.Vres = np.zeros(self.n)
+        for i, stud in enumerate(studs):
+            stud._group = self
+            stud._index = i
+
+        # Polar moment depends on geometry only - compute once
+        self.J = float(np.dot(self.x, self.x) + np.dot(self.y, self.y))
+
     def polar_moment(self) -> float:
         """
         Polar moment J = Σ(x² + y²) [mm²]
         """
-        return sum(stud.x ** 2 + stud.y ** 2 for stud in self.studs)
+        return self.J
 
     def apply_actions(self, Vx: float, Vy: float, Mz: float):
         """
@@ -43,29 +83,24 @@ class StudGroup:
         Vx, Vy in kN
         Mz in kNm
         """
-        J = self.polar_moment()
+        J = self.J
         if J <= 0.0:
             raise ValueError("Polar moment must be greater than zero")
 
-        # Convert moment to kNmm
-        Mz_kNmm = Mz * 1000.0
-
         # Direct shear distribution
-        for stud in self.studs:
-            stud.Vx = Vx / self.n
-            stud.Vy = Vy / self.n
+        self.Vx = np.full(self.n, Vx / self.n)
+        self.Vy = np.full(self.n, Vy / self.n)
 
-        # Torsional shear distribution
-        for stud in self.studs:
-            Vtx = -Mz_kNmm * stud.y / J
-            Vty =  Mz_kNmm * stud.x / J
+        # Torsional shear distribution - skipped for load cases without torsion
+        if Mz != 0.0:
+            # Convert moment to kNmm
+            Mz_kNmm = Mz * 1000.0
 
-            stud.Vx += Vtx
-            stud.Vy += Vty
+            self.Vx += (-Mz_kNmm * self.y) / J
+            self.Vy += (Mz_kNmm * self.x) / J
 
         # Resultant shear per stud
-        for stud in self.studs:
-            stud.Vres = math.sqrt(stud.Vx ** 2 + stud.Vy ** 2)
+        self.Vres = np.sqrt(self.Vx ** 2 + self.Vy ** 2)
 
 
 # ------------------------------------------------------------
@@ -155,17 +190,22 @@ class PryOutCalculator:
         self.group.apply_actions(Vx, Vy, Mz)
         V_Rd_cp = self.pryout.design_pryout_resistance()
 
+        # Build the report once from the group's force arrays
+        group = self.group
         results = []
-        for i, stud in enumerate(self.studs):
+        for i, (stud, Vx_i, Vy_i, Vres_i, util_i) in enumerate(zip(
+            self.studs, group.Vx.tolist(), group.Vy.tolist(), group.Vres.tolist(),
+            (group.Vres / V_Rd_cp).tolist()
+        )):
             results.append({
                 "stud": i + 1,
                 "x_mm": stud.x,
                 "y_mm": stud.y,
-                "Vx_kN": stud.Vx,
-                "Vy_kN": stud.Vy,
-                "Vres_kN": stud.Vres,
+                "Vx_kN": Vx_i,
+                "Vy_kN": Vy_i,
+                "Vres_kN": Vres_i,
                 "V_Rd_cp_kN": V_Rd_cp,
-                "utilization": stud.Vres / V_Rd_cp
+                "utilization": util_i
             })
         return results
 
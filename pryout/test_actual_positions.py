@@ -21,6 +21,10 @@ d = 16  # mm
 area = np.pi * (d/2)**2
 areas = [area] * 4
 
+# Layout as contiguous float64 arrays, converted once
+positions_np = np.array(positions, dtype=np.float64)
+areas_np = np.array(areas, dtype=np.float64)
+
 print("=" * 70)
 print("TEST: Actual Browser Positions")
 print("=" * 70)
@@ -38,11 +42,11 @@ print(f"  Mx = {Mx} kNm")
 print(f"  My = {My} kNm")
 
 # Calculate centroid
-centroid = planar_bending.calculate_centroid(positions, areas)
+centroid = planar_bending.calculate_centroid(positions_np, areas_np)
 print(f"\nCentroid: ({centroid[0]:.2f}, {centroid[1]:.2f}) mm")
 
 # Calculate section properties
-section_props = planar_bending.calculate_section_properties(positions, areas, centroid)
+section_props = planar_bending.calculate_section_properties(positions_np, areas_np, centroid)
 print(f"\nSection properties:")
 print(f"  Ix  = {section_props['Ix']:.0f} mm^4")
 print(f"  Iy  = {section_props['Iy']:.0f} mm^4")
@@ -50,7 +54,7 @@ print(f"  Ixy = {section_props['Ixy']:.0f} mm^4")
 
 # Calculate forces
 forces = planar_bending.calculate_bending_forces(
-    positions, areas, Mx, My, centroid, section_props
+    positions_np, areas_np, Mx, My, centroid, section_props
 )
 
 print(f"\nForces from Mx bending:")
@@ -64,8 +68,8 @@ print("Full Distribution:")
 print("=" * 70)
 
 distribution = planar_bending.distribute_loads_with_bending(
-    positions=positions,
-    areas=areas,
+    positions=positions_np,
+    areas=areas_np,
     N=0,
     Vx=0,
     Vy=0,